@@ -0,0 +1,83 @@
+"""Measures how long a fresh interpreter takes to import pycake.api and its
+classes, and fails when a cold start is over budget or loads a module that
+should only be imported on use.
+
+    python benchmarks/import_time.py [--runs 10] [--scale 1.0]
+
+Budgets are in milliseconds, for the median of --runs interpreters and
+after subtracting the time of an interpreter importing nothing. --scale
+multiplies them for slower machines.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# statement, budget in ms, modules it must not load
+CASES = (
+    ('import pycake.api', 5, ('pycake.api.CakeAPI', 'requests', 'aiohttp')),
+    ('from pycake.api import BuyerAPI', 60, ('pycake.api.AdminAPI',
+        'pycake.api.AffiliateAPI', 'requests', 'aiohttp', 'asyncio')),
+    ('from pycake.api import AdminAPI', 80, ('requests', 'aiohttp')),
+    ('from pycake.api import AffiliateAPI', 60, ('pycake.api.AdminAPI',
+        'requests', 'aiohttp')),
+    ('import pycake.models', 40, ('numpy', 'requests')),
+    ('from pycake.export import to_csv', 40, ('numpy', 'pandas', 'pyarrow')),
+)
+
+TIMER = """
+import sys, time
+start = time.perf_counter()
+{}
+elapsed = time.perf_counter() - start
+print(elapsed * 1000)
+print(' '.join(sorted(sys.modules)))
+"""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(statement):
+    """Returns the milliseconds a new interpreter took to run statement and
+    the modules it had loaded"""
+
+    output = subprocess.check_output(
+        [sys.executable, '-c', TIMER.format(statement)], cwd=ROOT,
+        universal_newlines=True)
+    elapsed, modules = output.splitlines()
+    return float(elapsed), set(modules.split())
+
+
+def median_time(statement, runs):
+    return statistics.median(run(statement)[0] for _ in range(runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--scale', type=float, default=1.0)
+    args = parser.parse_args()
+
+    baseline = median_time('pass', args.runs)
+    failures = []
+    for statement, budget, forbidden in CASES:
+        elapsed = median_time(statement, args.runs) - baseline
+        loaded = sorted(set(forbidden) & run(statement)[1])
+        budget *= args.scale
+        ok = elapsed <= budget and not loaded
+        print('{:<40} {:7.1f} ms  (budget {:.0f} ms){}'.format(
+            statement, elapsed, budget,
+            '  loaded ' + ', '.join(loaded) if loaded else ''))
+        if not ok:
+            failures.append(statement)
+
+    if failures:
+        print('over budget: ' + '; '.join(failures))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,22 +1,725 @@
-import requests as _requests
 import json as _json
+import time as _time
+from array import array as _array
 from collections import OrderedDict as _OrderedDict
-from datetime import datetime as _datetime
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from .endpoints import _add_endpoints, _endpoint
 from .function_validation import _must_have_one, _if_one_then_all
+from .pagination import _rows_of
 from .ResponseFormat import ResponseFormat
+from .CakeAPI import CakeAPI
 
+# entity: (id field, keyword arguments of its export_ function)
+_BULK_EDITS = {
+    'advertiser': ('advertiser_id', {}),
+    'affiliate': ('affiliate_id', {}),
+    'campaign': ('campaign_id', {'campaign_id': '0'}),
+}
 
-class AdminAPI(object):
+_ENDPOINTS = [
+    #-------------------------------ACCOUNTING--------------------------------#
+
+    _endpoint(
+        'export_advertiser_bills', 'accounting', 1, 'ExportAdvertiserBills',
+        "billing_period_start_date, billing_period_end_date, "
+        "billing_cycle='all', **kwargs",
+        ['api_key', 'billing_cycle', ('billing_period_start_date', str),
+         ('billing_period_end_date', str)]),
+    _endpoint(
+        'export_affiliate_bills', 'accounting', 1, 'ExportAffiliateBills',
+        "billing_period_start_date, billing_period_end_date, "
+        "billing_cycle='all', paid_only='FALSE', payment_type_id='0', "
+        "**kwargs",
+        ['api_key', 'billing_cycle', ('billing_period_start_date', str),
+         ('billing_period_end_date', str), 'paid_only', 'payment_type_id']),
+
+    #--------------------------------ADDEDIT----------------------------------#
+
+    _endpoint(
+        'add_advertiser', 'addedit', 1, 'Advertiser',
+        "advertiser_name, third_party_name='', account_status_id='1', "
+        "online_signup='FALSE', signup_ip_address='', website='', "
+        "billing_cycle_id='3', account_manager_id='0', address_street='', "
+        "address_street2='', address_city='', address_state='', "
+        "address_zip_code='', address_country='', notes='', tags='', **kwargs",
+        ['api_key', ('advertiser_id', 0), 'advertiser_name',
+         'third_party_name', 'account_status_id', 'online_signup',
+         'signup_ip_address', 'website', 'billing_cycle_id',
+         'account_manager_id', 'address_street', 'address_street2',
+         'address_city', 'address_state', 'address_zip_code',
+         'address_country', 'notes', 'tags']),
+    _endpoint(
+        'add_affiliate', 'addedit', 2, 'Affiliate',
+        "affiliate_name, third_party_name='', account_status_id='1', "
+        "inactive_reason_id='0', affiliate_tier_id='0', "
+        "account_manager_id='0', hide_offers='FALSE', website='', "
+        "tax_class='', ssn_tax_id='', vat_tax_required='FALSE', "
+        "swift_iban='', payment_to='0', payment_fee='-1', "
+        "payment_min_threshold='-1', currency_id='0', payment_setting_id='1', "
+        "billing_cycle_id='3', payment_type_id='1', payment_type_info='', "
+        "address_street='', address_street2='', address_city='', "
+        "address_state='', address_zip_code='', address_country='', "
+        "media_type_ids='', price_format_ids='', vertical_category_ids='', "
+        "country_codes='', tags='', pixel_html='', postback_url='', "
+        "postback_delay_ms='-1', fire_global_pixel='TRUE', "
+        "date_added=_datetime.now(), online_signup='FALSE', "
+        "signup_ip_address='', referral_affiliate_id='0', referral_notes='', "
+        "terms_and_conditions_agreed='TRUE', notes='', **kwargs",
+        ['api_key', ('affiliate_id', 0), 'affiliate_name', 'third_party_name',
+         'account_status_id', 'inactive_reason_id', 'affiliate_tier_id',
+         'account_manager_id', 'hide_offers', 'website', 'tax_class',
+         'ssn_tax_id', 'vat_tax_required', 'swift_iban', 'payment_to',
+         'payment_fee', 'payment_min_threshold', 'currency_id',
+         'payment_setting_id', 'billing_cycle_id', 'payment_type_id',
+         'payment_type_info', 'address_street', 'address_street2',
+         'address_city', 'address_state', 'address_zip_code',
+         'address_country', 'media_type_ids', 'price_format_ids',
+         'vertical_category_ids', 'country_codes', 'tags', 'pixel_html',
+         'postback_url', 'postback_delay_ms', 'fire_global_pixel',
+         ('date_added', str), 'online_signup', 'signup_ip_address',
+         'referral_affiliate_id', 'referral_notes',
+         'terms_and_conditions_agreed', 'notes']),
+    _endpoint(
+        'add_blacklist', 'addedit', 1, 'Blacklist',
+        "affiliate_id, blacklist_reason_id, redirect_type, sub_id='', "
+        "advertiser_id='0', offer_id='0', blacklist_date=_datetime.now(), "
+        "**kwargs",
+        ['api_key', ('blacklist_id', 0), 'affiliate_id', 'sub_id',
+         'advertiser_id', 'offer_id', 'blacklist_reason_id', 'redirect_type',
+         ('blacklist_date', str),
+         ('blacklist_date_modification_type', 'change')],
+        checks=[_must_have_one(['advertiser_id', 'offer_id'])]),
+    _endpoint(
+        'add_buyer', 'addedit', 1, 'Buyer',
+        "buyer_name, account_manager_id, account_status_id='1', "
+        "address_street='', address_street2='', address_city='', "
+        "address_state='', address_zip_code='', address_country='', "
+        "website='', billing_cycle_id='3', credit_type='unlimited', "
+        "credit_limit='-1', **kwargs",
+        ['api_key', ('buyer_id', 0), 'buyer_name', 'account_status_id',
+         'account_manager_id', 'address_street', 'address_street2',
+         'address_city', 'address_state', 'address_zip_code',
+         'address_country', 'website', 'billing_cycle_id', 'credit_type',
+         'credit_limit'],
+        checks=[_if_one_then_all(['credit_type', 'credit_limit'])]),
+    _endpoint(
+        'add_buyer_contract', 'addedit', 1, 'BuyerContract',
+        "buyer_id, vertical_id, buyer_contract_name, account_status_id='1', "
+        "offer_id='0', replace_returns='off', "
+        "replacements_non_returnable='off', max_return_age_days='30', "
+        "buy_upsells='off', vintage_leads='off', min_lead_age_minutes='0', "
+        "max_lead_age_minutes='7200', posting_wait_seconds='0', "
+        "default_confirmation_page_link='', max_post_errors='10', "
+        "send_alert_only='off', rank='0', email_template_id='0', "
+        "portal_template_id='0', **kwargs",
+        ['api_key', ('buyer_contract_id', 0), 'buyer_id', 'vertical_id',
+         'buyer_contract_name', 'account_status_id', 'offer_id',
+         'replace_returns', 'replacements_non_returnable',
+         'max_return_age_days', 'buy_upsells', 'vintage_leads',
+         'min_lead_age_minutes', 'max_lead_age_minutes',
+         'posting_wait_seconds', 'default_confirmation_page_link',
+         'max_post_errors', 'send_alert_only', 'rank', 'email_template_id',
+         'portal_template_id']),
+    _endpoint(
+        'add_contact', 'addedit', 3, 'Contact',
+        "entity_type, entity_id, role_id, contact_email_address, "
+        "contact_first_name, include_in_mass_emails='on', "
+        "contact_middle_name='', contact_last_name='', contact_title='', "
+        "contact_department_id='-1', contact_phone_work='', "
+        "contact_phone_cell='', contact_phone_fax='', contact_im_service='', "
+        "contact_im_name='', contact_timezone='', contact_language_id='-1', "
+        "**kwargs",
+        ['api_key', 'entity_type', 'entity_id', ('contact_id', 0), 'role_id',
+         'include_in_mass_emails', 'contact_first_name', 'contact_middle_name',
+         'contact_last_name', 'contact_email_address',
+         ('contact_password', ''), 'contact_title', 'contact_department_id',
+         'contact_phone_work', 'contact_phone_cell', 'contact_phone_fax',
+         'contact_im_service', 'contact_im_name', 'contact_timezone',
+         'contact_language_id']),
+    _endpoint(
+        'add_creative', 'addedit', 1, 'Creative',
+        "creative_name, offer_id, creative_type_id, third_party_name='', "
+        "creative_status_id='1', width='-1', height='-1', offer_link='', "
+        "allow_link_override='FALSE', notes='', **kwargs",
+        ['api_key', ('creative_id', 0), 'offer_id', 'creative_name',
+         'third_party_name', 'creative_type_id', 'creative_status_id', 'width',
+         'height', 'offer_link', 'allow_link_override', 'notes']),
+    _endpoint(
+        'add_creative_files', 'addedit', 1, 'CreativeFiles',
+        "creative_id, creative_file_import_url, is_preview_file='FALSE', "
+        "replace_all_files='FALSE', **kwargs",
+        ['api_key', 'creative_id', ('creative_file_id', 0),
+         'creative_file_import_url', 'is_preview_file', 'replace_all_files']),
+    _endpoint(
+        'edit_buyer', 'addedit', 1, 'Buyer',
+        "buyer_id, buyer_name='', account_status_id='0', "
+        "account_manager_id='0', address_street='', address_street2='', "
+        "address_city='', address_state='', address_zip_code='', "
+        "address_country='', website='', billing_cycle_id='0', "
+        "credit_type='no_change', credit_limit='-1', **kwargs",
+        ['api_key', 'buyer_id', 'buyer_name', 'account_status_id',
+         'account_manager_id', 'address_street', 'address_street2',
+         'address_city', 'address_state', 'address_zip_code',
+         'address_country', 'website', 'billing_cycle_id', 'credit_type',
+         'credit_limit']),
+    _endpoint(
+        'edit_buyer_contract', 'addedit', 1, 'BuyerContract',
+        "buyer_contract_id, buyer_contract_name='', account_status_id='0', "
+        "offer_id='0', replace_returns='no_change', "
+        "replacements_non_returnable='no_change', max_return_age_days='-1', "
+        "buy_upsells='no_change', vintage_leads='no_change', "
+        "min_lead_age_minutes='-1', max_lead_age_minutes='-1', "
+        "posting_wait_seconds='-1', default_confirmation_page_link='', "
+        "max_post_errors='-1', send_alert_only='no_change', rank='-1', "
+        "email_template_id='0', portal_template_id='0', **kwargs",
+        ['api_key', 'buyer_contract_id', ('buyer_id', 0), ('vertical_id', 0),
+         'buyer_contract_name', 'account_status_id', 'offer_id',
+         'replace_returns', 'replacements_non_returnable',
+         'max_return_age_days', 'buy_upsells', 'vintage_leads',
+         'min_lead_age_minutes', 'max_lead_age_minutes',
+         'posting_wait_seconds', 'default_confirmation_page_link',
+         'max_post_errors', 'send_alert_only', 'rank', 'email_template_id',
+         'portal_template_id']),
+    _endpoint(
+        'edit_creative', 'addedit', 1, 'Creative',
+        "creative_id, allow_link_override, creative_name='', "
+        "third_party_name='', creative_type_id='0', creative_status_id='0', "
+        "width='-2', height='-2', offer_link='', notes='', **kwargs",
+        ['api_key', 'creative_id', ('offer_id', 0), 'creative_name',
+         'third_party_name', 'creative_type_id', 'creative_status_id', 'width',
+         'height', 'offer_link', 'allow_link_override', 'notes']),
+    _endpoint(
+        'remove_blacklist', 'addedit', 1, 'RemoveBlacklist',
+        "blacklist_id, **kwargs",
+        ['api_key', 'blacklist_id']),
+
+    #---------------------------------EXPORT----------------------------------#
+
+    _endpoint(
+        'export_advertisers', 'export', 6, 'Advertisers',
+        "advertiser_id='0', advertiser_name='', account_manager_id='0', "
+        "tag_id='0', start_at_row='0', row_limit='0', "
+        "sort_field='advertiser_id', sort_descending='FALSE', **kwargs",
+        ['api_key', 'advertiser_id', 'advertiser_name', 'account_manager_id',
+         'tag_id', 'start_at_row', 'row_limit', 'sort_field',
+         'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'export_affiliates', 'export', 5, 'Affiliates',
+        "affiliate_id='0', affiliate_name='', account_manager_id='0', "
+        "tag_id='0', start_at_row='0', row_limit='0', "
+        "sort_field='affiliate_id', sort_descending='FALSE', **kwargs",
+        ['api_key', 'affiliate_id', 'affiliate_name', 'account_manager_id',
+         'tag_id', 'start_at_row', 'row_limit', 'sort_field',
+         'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'export_blacklists', 'export', 1, 'Blacklists',
+        "affiliate_id='0', sub_id='', advertiser_id='0', offer_id='0', "
+        "**kwargs",
+        ['api_key', 'affiliate_id', 'sub_id', 'advertiser_id', 'offer_id'],
+        force_json=True),
+    _endpoint(
+        'export_buyer_contracts', 'export', 4, 'BuyerContracts',
+        "buyer_contract_id='0', buyer_id='0', vertical_id='0', "
+        "buyer_contract_status_id='0', **kwargs",
+        ['api_key', 'buyer_contract_id', 'buyer_id', 'vertical_id',
+         'buyer_contract_status_id']),
+    _endpoint(
+        'export_buyers', 'export', 2, 'Buyers',
+        "buyer_id='0', account_status_id='0', **kwargs",
+        ['api_key', 'buyer_id', 'account_status_id']),
+    _endpoint(
+        'export_campaigns', 'export', 8, 'Campaigns',
+        "campaign_id='0', site_offer_id='0', source_affiliate_id='0', "
+        "channel_id='0', account_status_id='0', media_type_id='0', "
+        "start_at_row='0', row_limit='0', sort_field='campaign_id', "
+        "sort_descending='FALSE', **kwargs",
+        ['api_key', 'campaign_id', 'site_offer_id', 'source_affiliate_id',
+         'channel_id', 'account_status_id', 'media_type_id', 'start_at_row',
+         'row_limit', 'sort_field', 'sort_descending'],
+        force_json=True,
+        checks=[
+            _must_have_one([
+                'campaign_id', 'site_offer_id', 'source_affiliate_id'])
+        ]),
+    _endpoint(
+        'export_creatives', 'export', 3, 'Creatives',
+        "offer_id, creative_id='0', creative_name='', creative_type_id='0', "
+        "creative_status_id='0', start_at_row='0', row_limit='0', "
+        "sort_field='creative_id', sort_descending='FALSE', **kwargs",
+        ['api_key', 'creative_id', 'creative_name', 'offer_id',
+         'creative_type_id', 'creative_status_id', 'start_at_row', 'row_limit',
+         'sort_field', 'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'export_offers', 'export', 6, 'Offers',
+        "offer_id='0', offer_name='', advertiser_id='0', vertical_id='0', "
+        "offer_type_id='0', media_type_id='0', offer_status_id='0', "
+        "tag_id='0', start_at_row='0', row_limit='0', sort_field='offer_id', "
+        "sort_descending='FALSE', **kwargs",
+        ['api_key', 'offer_id', 'offer_name', 'advertiser_id', 'vertical_id',
+         'offer_type_id', 'media_type_id', 'offer_status_id', 'tag_id',
+         'start_at_row', 'row_limit', 'sort_field', 'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'export_pixel_log_requests', 'export', 1, 'PixelLogRequests',
+        "start_date, end_date, advertiser_id='0', offer_id='0', "
+        "converted_only='FALSE', start_at_row='0', row_limit='0', "
+        "sort_descending='FALSE', **kwargs",
+        ['api_key', 'advertiser_id', 'offer_id', ('start_date', str),
+         ('end_date', str), 'converted_only', 'start_at_row', 'row_limit',
+         'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'export_rule_targets', 'export', 3, 'RuleTargets',
+        "rule_id, **kwargs",
+        ['api_key', 'rule_id']),
+    _endpoint(
+        'export_schedules', 'export', 2, 'Schedules',
+        "start_date, end_date, buyer_id='0', status_id='0', vertical_id='0', "
+        "priority_only='FALSE', active_only='FALSE', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'buyer_id',
+         'status_id', 'vertical_id', 'priority_only', 'active_only']),
+
+    #----------------------------------GET------------------------------------#
+
+    _endpoint(
+        'get_account_statuses', 'get', 1, 'AccountStatuses',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_advertisers', 'get', 1, 'Advertisers',
+        "**kwargs",
+        ['api_key'],
+        force_json=True),
+    _endpoint(
+        'get_affiliate_tags', 'get', 1, 'AffiliateTags',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_affiliate_tiers', 'get', 1, 'AffiliateTiers',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_billing_cycles', 'get', 1, 'BillingCycles',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_blacklist_reasons', 'get', 1, 'BlacklistReasons',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_cap_intervals', 'get', 1, 'CapIntervals',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_cap_types', 'get', 1, 'CapTypes',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_conversion_dispositions', 'track', 2, 'ConversionDispositions',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_countries', 'get', 1, 'Countries',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_currencies', 'get', 1, 'Currencies',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_custom_queue_statuses', 'get', 1, 'CustomQueueStatuses',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_departments', 'get', 1, 'Departments',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_email_templates', 'get', 1, 'EmailTemplates',
+        "email_type='both', **kwargs",
+        ['api_key', 'email_type']),
+    _endpoint(
+        'get_exchange_rates', 'get', 1, 'ExchangeRates',
+        "start_date, end_date, **kwargs",
+        ['api_key', 'start_date', 'end_date']),
+    _endpoint(
+        'get_filter_types', 'get', 1, 'FilterTypes',
+        "filter_type_id='0', filter_type_name='', vertical_id='0', **kwargs",
+        ['api_key', 'filter_type_id', 'filter_type_name', 'vertical_id']),
+    _endpoint(
+        'get_api_key', 'get', 1, 'GetAPIKey',
+        "username, password, **kwargs",
+        ['username', 'password']),
+    _endpoint(
+        'get_inactive_reasons', 'get', 1, 'InactiveReasons',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_languages', 'get', 1, 'Languages',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_lead_info', 'get', 1, 'LeadInfo',
+        "lead_id, vertical_id='0', **kwargs",
+        ['api_key', 'lead_id', 'vertical_id']),
+    _endpoint(
+        'get_lead_return_reasons', 'leads', 1, 'GetReturnReasons',
+        '',
+        [],
+        root='buyers/api'),
+    _endpoint(
+        'get_lead_tier_groups', 'get', 1, 'LeadTierGroups',
+        "lead_tier_group_id='0', **kwargs",
+        ['api_key', 'lead_tier_group_id']),
+    _endpoint(
+        'get_link_display_types', 'get', 1, 'LinkDisplayTypes',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_media_types', 'get', 1, 'MediaTypes',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_offer_statuses', 'get', 1, 'OfferStatuses',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_offer_types', 'get', 1, 'OfferTypes',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_payment_settings', 'get', 1, 'PaymentSettings',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_payment_types', 'get', 1, 'PaymentTypes',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_price_formats', 'get', 1, 'PriceFormats',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_response_dispositions', 'get', 1, 'ResponseDispositions',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_roles', 'get', 1, 'Roles',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_schedule_types', 'get', 1, 'ScheduleTypes',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_session_regeneration_types', 'get', 1, 'SessionRegenerationTypes',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_shared_rules', 'get', 1, 'SharedRules',
+        "**kwargs",
+        ['api_key']),
+    _endpoint(
+        'get_tracking_domains', 'get', 1, 'TrackingDomains',
+        "domain_type='all', **kwargs",
+        ['api_key', 'domain_type']),
+    _endpoint(
+        'get_verticals', 'get', 2, 'Verticals',
+        "vertical_category_id='0', **kwargs",
+        ['api_key', 'vertical_category_id']),
+    _endpoint(
+        'get_vertical_categories', 'signup', 1, 'GetVerticalCategories',
+        "**kwargs",
+        ['api_key']),
+
+    #--------------------------------REPORTS----------------------------------#
+
+    _endpoint(
+        'brand_advertiser_summary', 'reports', 3, 'BrandAdvertiserSummary',
+        "start_date, end_date, brand_advertiser_id='0', "
+        "brand_advertiser_manager_id='0', brand_advertiser_tag_id='0', "
+        "event_id='0', event_type='all', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str),
+         'brand_advertiser_id', 'brand_advertiser_manager_id',
+         'brand_advertiser_tag_id', 'event_id', 'event_type']),
+    _endpoint(
+        'campaign_summary', 'reports', 5, 'CampaignSummary',
+        "start_date, end_date, campaign_id='0', source_affiliate_id='0', "
+        "subid_id='', site_offer_id='0', source_affiliate_tag_id='0', "
+        "site_offer_tag_id='0', source_affiliate_manager_id='0', "
+        "brand_advertiser_manager_id='0', event_id='0', event_type='all', "
+        "**kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'campaign_id',
+         'source_affiliate_id', 'subid_id', 'site_offer_id',
+         'source_affiliate_tag_id', 'site_offer_tag_id',
+         'source_affiliate_manager_id', 'brand_advertiser_manager_id',
+         'event_id', 'event_type']),
+    _endpoint(
+        'clicks', 'reports', 12, 'Clicks',
+        "start_date, end_date, affiliate_id='0', advertiser_id='0', "
+        "offer_id='0', campaign_id='0', creative_id='0', price_format_id='0', "
+        "include_duplicates='FALSE', include_tests='FALSE', start_at_row='0', "
+        "row_limit='0', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'affiliate_id',
+         'advertiser_id', 'offer_id', 'campaign_id', 'creative_id',
+         'price_format_id', 'include_duplicates', 'include_tests',
+         'start_at_row', 'row_limit'],
+        force_json=True),
+    _endpoint(
+        'event_conversion_changes', 'reports', 17, 'EventConversionChanges',
+        "changes_since, include_new_event_conversions='FALSE', "
+        "source_affiliate_id='0', brand_advertiser_id='0', site_offer_id='0', "
+        "campaign_id='0', creative_id='0', include_tests='FALSE', "
+        "start_at_row='0', row_limit='0', sort_field='event_conversion_date', "
+        "sort_descending='FALSE', **kwargs",
+        ['api_key', ('changes_since', str), 'include_new_event_conversions',
+         'source_affiliate_id', 'brand_advertiser_id', 'site_offer_id',
+         'campaign_id', 'creative_id', 'include_tests', 'start_at_row',
+         'row_limit', 'sort_field', 'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'country_summary', 'reports', 1, 'CountrySummary',
+        "start_date, end_date, affiliate_id='0', affiliate_tag_id='0', "
+        "advertiser_id='0', offer_id='0', campaign_id='0', event_id='0', "
+        "revenue_filter='conversions_and_events', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'affiliate_id',
+         'affiliate_tag_id', 'advertiser_id', 'offer_id', 'campaign_id',
+         'event_id', 'revenue_filter'],
+        checks=[
+            _must_have_one([
+                'advertiser_id', 'offer_id', 'affiliate_id', 'campaign_id'])
+        ]),
+    _endpoint(
+        'daily_summary', 'reports', 2, 'DailySummaryExport',
+        "start_date, end_date, source_affiliate_id='0', "
+        "brand_advertiser_id='0', site_offer_id='0', vertical_id='0', "
+        "campaign_id='0', creative_id='0', account_manager_id='0', "
+        "include_tests='FALSE', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str),
+         'source_affiliate_id', 'brand_advertiser_id', 'site_offer_id',
+         'vertical_id', 'campaign_id', 'creative_id', 'account_manager_id',
+         'include_tests']),
+    _endpoint(
+        'events_conversions', 'reports', 17, 'EventConversions',
+        "start_date, end_date, event_type='all', event_id='0', "
+        "source_affiliate_id='0', brand_advertiser_id='0', channel_id='0', "
+        "site_offer_id='0', site_offer_contract_id='0', "
+        "source_affiliate_tag_id='0', brand_advertiser_tag_id='0', "
+        "site_offer_tag_id='0', campaign_id='0', creative_id='0', "
+        "price_format_id='0', source_type='all', "
+        "payment_percentage_filter='both', disposition_type='all', "
+        "disposition_id='0', source_affiliate_billing_status='all', "
+        "brand_advertiser_billing_status='all', test_filter='non_tests', "
+        "start_at_row='0', row_limit='0', sort_field='event_conversion_date', "
+        "sort_descending='FALSE', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'event_type',
+         'event_id', 'source_affiliate_id', 'brand_advertiser_id',
+         'channel_id', 'site_offer_id', 'site_offer_contract_id',
+         'source_affiliate_tag_id', 'brand_advertiser_tag_id',
+         'site_offer_tag_id', 'campaign_id', 'creative_id', 'price_format_id',
+         'source_type', 'payment_percentage_filter', 'disposition_type',
+         'disposition_id', 'source_affiliate_billing_status',
+         'brand_advertiser_billing_status', 'test_filter', 'start_at_row',
+         'row_limit', 'sort_field', 'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'leads_by_buyer', 'reports', 4, 'LeadsByBuyer',
+        "start_date, end_date, vertical_id='0', buyer_id='0', "
+        "buyer_contract_id='0', status_id='0', sub_status_id='0', "
+        "start_at_row='0', row_limit='0', sort_field='transaction_date', "
+        "sort_descending='FALSE', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'vertical_id',
+         'buyer_id', 'buyer_contract_id', 'status_id', 'sub_status_id',
+         'start_at_row', 'row_limit', 'sort_field', 'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'leads_by_affiliate', 'reports', 2, 'LeadsByAffiliateExport',
+        "start_date, end_date, vertical_id='0', source_affiliate_id='0', "
+        "site_offer_id='0', source_affiliate_manager_id='0', "
+        "upsell='upsells_and_non_upsells', lead_tier_id='0', "
+        "start_at_row='0', row_limit='0', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'vertical_id',
+         'source_affiliate_id', 'site_offer_id', 'source_affiliate_manager_id',
+         'upsell', 'lead_tier_id', 'start_at_row', 'row_limit'],
+        force_json=True),
+    _endpoint(
+        'lite_clicks_advertiser_summary', 'reports_lite_clicks', 1,
+        'AdvertiserSummary',
+        "start_date, end_date, advertiser_id='0', advertiser_manager_id='0', "
+        "advertiser_tag_id='0', event_id='0', "
+        "revenue_filter='conversions_and_events', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'advertiser_id',
+         'advertiser_manager_id', 'advertiser_tag_id', 'event_id',
+         'revenue_filter']),
+    _endpoint(
+        'lite_clicks_affiliate_summary', 'reports_lite_clicks', 1,
+        'AffiliateSummary',
+        "start_date, end_date, affiliate_id='0', affiliate_manager_id='0', "
+        "affiliate_tag_id='0', offer_tag_id='0', event_id='0', "
+        "revenue_filter='conversions_and_events', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'affiliate_id',
+         'affiliate_manager_id', 'affiliate_tag_id', 'offer_tag_id',
+         'event_id', 'revenue_filter']),
+    _endpoint(
+        'lite_clicks_campaign_summary', 'reports_lite_clicks', 2,
+        'CampaignSummary',
+        "start_date, end_date, affiliate_id='0', subaffiliate_id='', "
+        "affiliate_tag_id='0', offer_id='0', offer_tag_id='0', "
+        "campaign_id='0', event_id='0', "
+        "revenue_filter='conversions_and_events', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'affiliate_id',
+         'subaffiliate_id', 'affiliate_tag_id', 'offer_id', 'offer_tag_id',
+         'campaign_id', 'event_id', 'revenue_filter']),
+    _endpoint(
+        'lite_clicks_country_summary', 'reports_lite_clicks', 1,
+        'CountrySummary',
+        "start_date, end_date, affiliate_id='0', affiliate_tag_id='0', "
+        "advertiser_id='0', offer_id='0', campaign_id='0', event_id='0', "
+        "revenue_filter='conversions_and_events', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'affiliate_id',
+         'affiliate_tag_id', 'advertiser_id', 'offer_id', 'campaign_id',
+         'event_id', 'revenue_filter'],
+        checks=[
+            _must_have_one([
+                'advertiser_id', 'offer_id', 'affiliate_id', 'campaign_id'])
+        ]),
+    _endpoint(
+        'lite_clicks_daily_summary', 'reports_lite_clicks', 1,
+        'DailySummaryExport',
+        "start_date, end_date, affiliate_id='0', advertiser_id='0', "
+        "offer_id='0', vertical_id='0', campaign_id='0', creative_id='0', "
+        "account_manager_id='0', include_tests='FALSE', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'affiliate_id',
+         'advertiser_id', 'offer_id', 'vertical_id', 'campaign_id',
+         'creative_id', 'account_manager_id', 'include_tests']),
+    _endpoint(
+        'lite_clicks_offer_summary', 'reports_lite_clicks', 1, 'OfferSummary',
+        "start_date, end_date, advertiser_id='0', advertiser_manager_id='0', "
+        "offer_id='0', offer_tag_id='0', affiliate_tag_id='0', event_id='0', "
+        "revenue_filter='conversions_and_events', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'advertiser_id',
+         'advertiser_manager_id', 'offer_id', 'offer_tag_id',
+         'affiliate_tag_id', 'event_id', 'revenue_filter']),
+    _endpoint(
+        'lite_clicks_sub_id_summary', 'reports_lite_clicks', 2, 'SubIDSummary',
+        "start_date, end_date, source_affiliate_id, site_offer_id='0', "
+        "campaign_id='0', sub_id='NULL', event_id='0', "
+        "revenue_filter='conversions_and_events', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str),
+         'source_affiliate_id', 'site_offer_id', 'campaign_id', 'sub_id',
+         'event_id', 'revenue_filter']),
+    _endpoint(
+        'login_export', 'reports', 1, 'LoginExport',
+        "start_date, end_date, role_id='0', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'role_id']),
+    _endpoint(
+        'order_details', 'reports', 1, 'OrderDetails',
+        "start_date, end_date, affiliate_id='0', conversion_id='0', "
+        "order_id='', start_at_row='0', row_limit='0', sort_field='order_id', "
+        "sort_descending='FALSE', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str), 'affiliate_id',
+         'conversion_id', 'order_id', 'start_at_row', 'row_limit',
+         'sort_field', 'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'site_offer_summary', 'reports', 4, 'SiteOfferSummary',
+        "start_date, end_date, brand_advertiser_id='0', "
+        "brand_advertiser_manager_id='0', site_offer_id='0', "
+        "site_offer_tag_id='0', source_affiliate_tag_id='0', event_id='0', "
+        "event_type='all', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str),
+         'brand_advertiser_id', 'brand_advertiser_manager_id', 'site_offer_id',
+         'site_offer_tag_id', 'source_affiliate_tag_id', 'event_id',
+         'event_type']),
+    _endpoint(
+        'source_affiliate_summary', 'reports', 3, 'SourceAffiliateSummary',
+        "start_date, end_date, source_affiliate_id='0', "
+        "source_affiliate_manager_id='0', source_affiliate_tag_id='0', "
+        "site_offer_tag_id='0', event_id='0', event_type='all', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str),
+         'source_affiliate_id', 'source_affiliate_manager_id',
+         'source_affiliate_tag_id', 'site_offer_tag_id', 'event_id',
+         'event_type']),
+    _endpoint(
+        'sub_id_summary', 'reports', 1, 'SubIDSummary',
+        "start_date, end_date, source_affiliate_id, site_offer_id='0', "
+        "event_id='0', revenue_filter='conversions_and_events', **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str),
+         'source_affiliate_id', 'site_offer_id', 'event_id',
+         'revenue_filter']),
+    _endpoint(
+        'traffic_export', 'reports', 1, 'TrafficExport',
+        "start_date, end_date, **kwargs",
+        ['api_key', ('start_date', str), ('end_date', str)]),
+
+    #--------------------------------SIGNUP-----------------------------------#
+
+    _endpoint(
+        'signup_advertiser', 'signup', 1, 'Advertiser',
+        "company_name, address_street, address_city, address_state, "
+        "address_zip_code, address_country, first_name, last_name, "
+        "email_address, contact_phone_work, address_street2='', website='', "
+        "notes='', contact_title='', contact_phone_cell='', "
+        "contact_phone_fax='', contact_im_name='', contact_im_service=0, "
+        "ip_address=''",
+        ['api_key', 'company_name', 'address_street', 'address_street2',
+         'address_city', 'address_state', 'address_zip_code',
+         'address_country', 'first_name', 'last_name', 'email_address',
+         ('password', ''), 'website', 'notes', 'contact_title',
+         'contact_phone_work', 'contact_phone_cell', 'contact_phone_fax',
+         'contact_im_name', 'contact_im_service', 'ip_address']),
+    _endpoint(
+        'signup_affiliate', 'signup', 4, 'Affiliate',
+        "affiliate_name, account_status_id, payment_setting_id, tax_class, "
+        "ssn_tax_id, address_street, address_city, address_state, "
+        "address_zip_code, address_country, contact_first_name, "
+        "contact_last_name, contact_email_address, contact_phone_work, "
+        "contact_timezone, terms_and_conditions_agreed, "
+        "affiliate_tier_id='0', hide_offers='FALSE', website='', "
+        "vat_tax_required='FALSE', swift_iban='', payment_to='0', "
+        "payment_fee='-1', payment_min_threshold='-1', currency_id='0', "
+        "billing_cycle_id='3', payment_type_id='1', payment_type_info='', "
+        "address_street2='', contact_middle_name='', contact_title='', "
+        "contact_phone_cell='', contact_phone_fax='', contact_im_service='', "
+        "contact_im_name='', contact_language_id='0', media_type_ids='', "
+        "price_format_ids='', vertical_category_ids='', country_codes='', "
+        "tag_ids='', date_added=_datetime.now(), signup_ip_address='', "
+        "referral_affiliate_id='0', referral_notes='', notes=''",
+        ['api_key', 'affiliate_name', 'account_status_id', 'affiliate_tier_id',
+         'hide_offers', 'website', 'tax_class', 'ssn_tax_id',
+         'vat_tax_required', 'swift_iban', 'payment_to', 'payment_fee',
+         'payment_min_threshold', 'currency_id', 'payment_setting_id',
+         'billing_cycle_id', 'payment_type_id', 'payment_type_info',
+         'address_street', 'address_street2', 'address_city', 'address_state',
+         'address_zip_code', 'address_country', 'contact_first_name',
+         'contact_middle_name', 'contact_last_name', 'contact_email_address',
+         ('contact_password', ''), 'contact_title', 'contact_phone_work',
+         'contact_phone_cell', 'contact_phone_fax', 'contact_im_service',
+         'contact_im_name', 'contact_timezone', 'contact_language_id',
+         'media_type_ids', 'price_format_ids', 'vertical_category_ids',
+         'country_codes', 'tag_ids', ('date_added', str), 'signup_ip_address',
+         'referral_affiliate_id', 'referral_notes',
+         'terms_and_conditions_agreed', 'notes']),
+]
+
+
+class AdminAPI(CakeAPI):
+
+    _API_ROOT = 'api'
     
     def __init__(
             self, admin_domain, api_key=None,
-            response_format=ResponseFormat.JSON, use_https=True):
+            response_format=ResponseFormat.JSON, use_https=True,
+            **kwargs):
         
-        self.admin_domain = admin_domain
+        super(AdminAPI, self).__init__(
+            admin_domain, response_format=response_format,
+            use_https=use_https, **kwargs)
         self.api_key = api_key
-        self.response_format = response_format
-        self.protocol = 'https' if use_https else 'http'
-        # super().__init__()
+        self._id_cache = {}
 
 
     def _make_api_call(self, url, params, force_json=False):
@@ -24,26 +727,18 @@ class AdminAPI(object):
             raise Exception('No API key has been set. You must initialize an '
                 'AdminAPI object with an api_key or use the '
                 'set_api_key() function on an existing AdminAPI object')
-        elif self.response_format.upper() == 'JSON' or force_json:
-            request = _requests.post(url, json=params, stream=True)
-            raw_response = request.text
-            try:
-                json_response = _json.loads(raw_response)
-                json_data = json_response['d']
-                return json_data
-            except:
-                request = _requests.post(url, data=params, stream=True)
-                raw_response = request.text
-                return raw_response   
-        else:
-            request = _requests.post(url, data=params, stream=True)
-            response = request.text
-            return response
+        return super(AdminAPI, self)._make_api_call(
+            url, params, force_json=force_json)
 
 
     def _get_exception_type(self, campaign_id):
         campaign_export = self.export_campaigns(
             campaign_id=campaign_id, force_json=True)
+        return self._exception_type_from_export(campaign_export)
+
+
+    @staticmethod
+    def _exception_type_from_export(campaign_export):
         try:
             all_campaigns = campaign_export['campaigns']
             campaign_data = all_campaigns[0]
@@ -54,7 +749,22 @@ class AdminAPI(object):
                 return 'allow'
         except:   
             raise Exception('Invalid campaign ID')
-        
+
+
+    @staticmethod
+    def _first_exported(export, entity_key):
+        if export['row_count'] == 0:
+            return None
+        return export[entity_key][0]
+
+
+    @staticmethod
+    def _validate_campaign_id(campaign_id):
+        if (not str(campaign_id).isdigit() or int(campaign_id) < 1 or
+            int(campaign_id) > 999999999):
+            raise Exception(('campaign_id must be an integer between 1 and '
+                '999999999'))
+
     #--------------------------------API_KEY----------------------------------#
 
     def set_api_key(self, username, password, **kwargs):
@@ -66,7 +776,7 @@ class AdminAPI(object):
         parameters['password'] = password
         
         try:
-            request = _requests.post(api_url, json=parameters, stream=True)
+            request = self._post(api_url, json=parameters)
             response = _json.loads(request.text)
             if response['d'] == '':
                 self.api_key = None
@@ -75,245 +785,8 @@ class AdminAPI(object):
         except:
             self.api_key = None
 
-    #-------------------------------ACCOUNTING--------------------------------#
-
-    def export_advertiser_bills(
-            self, billing_period_start_date, 
-            billing_period_end_date, billing_cycle='all', **kwargs):
-
-        api_url = ('{}://{}/api/1/accounting.asmx/ExportAdvertiserBills'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['billing_cycle'] = billing_cycle
-        parameters['billing_period_start_date'] = (
-            str(billing_period_start_date))
-        parameters['billing_period_end_date'] = str(billing_period_end_date)
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def export_affiliate_bills(
-            self, billing_period_start_date, billing_period_end_date,
-            billing_cycle='all', paid_only='FALSE', payment_type_id='0',
-            **kwargs):
-        
-        api_url = ('{}://{}/api/1/accounting.asmx/ExportAffiliateBills'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['billing_cycle'] = billing_cycle
-        parameters['billing_period_start_date'] = (
-            str(billing_period_start_date))
-        parameters['billing_period_end_date'] = str(billing_period_end_date)
-        parameters['paid_only'] = paid_only
-        parameters['payment_type_id'] = payment_type_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
     #--------------------------------ADDEDIT----------------------------------#
 
-    def add_advertiser(
-            self, advertiser_name, third_party_name='', account_status_id='1',
-            online_signup='FALSE', signup_ip_address='', website='',
-            billing_cycle_id='3', account_manager_id='0', address_street='',
-            address_street2='', address_city='', address_state='',
-            address_zip_code='', address_country='', notes='', tags='',
-            **kwargs):
-
-        api_url = '{}://{}/api/1/addedit.asmx/Advertiser'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['advertiser_id'] = 0
-        parameters['advertiser_name'] = advertiser_name
-        parameters['third_party_name'] = third_party_name
-        parameters['account_status_id'] = account_status_id
-        parameters['online_signup'] = online_signup
-        parameters['signup_ip_address'] = signup_ip_address
-        parameters['website'] = website
-        parameters['billing_cycle_id'] = billing_cycle_id
-        parameters['account_manager_id'] = account_manager_id
-        parameters['address_street'] = address_street
-        parameters['address_street2'] = address_street2
-        parameters['address_city'] = address_city
-        parameters['address_state'] = address_state
-        parameters['address_zip_code'] = address_zip_code
-        parameters['address_country'] = address_country
-        parameters['notes'] = notes
-        parameters['tags'] = tags
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def add_affiliate(
-            self, affiliate_name, third_party_name='', account_status_id='1',
-            inactive_reason_id='0', affiliate_tier_id='0',
-            account_manager_id='0', hide_offers='FALSE', website='',
-            tax_class='', ssn_tax_id='', vat_tax_required='FALSE',
-            swift_iban='', payment_to='0', payment_fee='-1',
-            payment_min_threshold='-1', currency_id='0',
-            payment_setting_id='1', billing_cycle_id='3', payment_type_id='1',
-            payment_type_info='', address_street='', address_street2='',
-            address_city='', address_state='', address_zip_code='',
-            address_country='', media_type_ids='', price_format_ids='',
-            vertical_category_ids='', country_codes='', tags='',
-            pixel_html='', postback_url='', postback_delay_ms='-1',
-            fire_global_pixel='TRUE', date_added=_datetime.now(),
-            online_signup='FALSE', signup_ip_address='',
-            referral_affiliate_id='0', referral_notes='',
-            terms_and_conditions_agreed='TRUE', notes='', **kwargs):
-                
-        api_url = '{}://{}/api/2/addedit.asmx/Affiliate'.format(
-            self.protocol, self.admin_domain)
-        
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = 0
-        parameters['affiliate_name'] = affiliate_name
-        parameters['third_party_name'] = third_party_name
-        parameters['account_status_id'] = account_status_id
-        parameters['inactive_reason_id'] = inactive_reason_id
-        parameters['affiliate_tier_id'] = affiliate_tier_id
-        parameters['account_manager_id'] = account_manager_id
-        parameters['hide_offers'] = hide_offers
-        parameters['website'] = website
-        parameters['tax_class'] = tax_class
-        parameters['ssn_tax_id'] = ssn_tax_id
-        parameters['vat_tax_required'] = vat_tax_required
-        parameters['swift_iban'] = swift_iban
-        parameters['payment_to'] = payment_to
-        parameters['payment_fee'] = payment_fee
-        parameters['payment_min_threshold'] = payment_min_threshold
-        parameters['currency_id'] = currency_id
-        parameters['payment_setting_id'] = payment_setting_id
-        parameters['billing_cycle_id'] = billing_cycle_id
-        parameters['payment_type_id'] = payment_type_id
-        parameters['payment_type_info'] = payment_type_info
-        parameters['address_street'] = address_street
-        parameters['address_street2'] = address_street2
-        parameters['address_city'] = address_city
-        parameters['address_state'] = address_state
-        parameters['address_zip_code'] = address_zip_code
-        parameters['address_country'] = address_country
-        parameters['media_type_ids'] = media_type_ids
-        parameters['price_format_ids'] = price_format_ids
-        parameters['vertical_category_ids'] = vertical_category_ids
-        parameters['country_codes'] = country_codes
-        parameters['tags'] = tags
-        parameters['pixel_html'] = pixel_html
-        parameters['postback_url'] = postback_url
-        parameters['postback_delay_ms'] = postback_delay_ms
-        parameters['fire_global_pixel'] = fire_global_pixel
-        parameters['date_added'] = str(date_added)
-        parameters['online_signup'] = online_signup
-        parameters['signup_ip_address'] = signup_ip_address
-        parameters['referral_affiliate_id'] = referral_affiliate_id
-        parameters['referral_notes'] = referral_notes
-        parameters['terms_and_conditions_agreed'] = (
-            terms_and_conditions_agreed)
-        parameters['notes'] = notes
-        
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    @_must_have_one(['advertiser_id', 'offer_id'])
-    def add_blacklist(
-            self, affiliate_id, blacklist_reason_id, redirect_type, sub_id='',
-            advertiser_id='0', offer_id='0', blacklist_date=_datetime.now(),
-            **kwargs):
-
-        api_url = '{}://{}/api/1/addedit.asmx/Blacklist'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['blacklist_id'] = 0
-        parameters['affiliate_id'] = affiliate_id
-        parameters['sub_id'] = sub_id
-        parameters['advertiser_id'] = advertiser_id
-        parameters['offer_id'] = offer_id
-        parameters['blacklist_reason_id'] = blacklist_reason_id
-        parameters['redirect_type'] = redirect_type
-        parameters['blacklist_date'] = str(blacklist_date)
-        parameters['blacklist_date_modification_type'] = 'change'
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    @_if_one_then_all(['credit_type', 'credit_limit'])
-    def add_buyer(
-            self, buyer_name, account_manager_id, account_status_id='1',
-            address_street='', address_street2='', address_city='',
-            address_state='', address_zip_code='', address_country='',
-            website='', billing_cycle_id='3', credit_type='unlimited',
-            credit_limit='-1', **kwargs):
-
-        api_url = '{}://{}/api/1/addedit.asmx/Buyer'.format(self.protocol,
-            self.admin_domain)
-        
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['buyer_id'] = 0
-        parameters['buyer_name'] = buyer_name
-        parameters['account_status_id'] = account_status_id
-        parameters['account_manager_id'] = account_manager_id
-        parameters['address_street'] = address_street
-        parameters['address_street2'] = address_street2
-        parameters['address_city'] = address_city
-        parameters['address_state'] = address_state
-        parameters['address_zip_code'] = address_zip_code
-        parameters['address_country'] = address_country
-        parameters['website'] = website
-        parameters['billing_cycle_id'] = billing_cycle_id
-        parameters['credit_type'] = credit_type
-        parameters['credit_limit'] = credit_limit
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def add_buyer_contract(
-            self, buyer_id, vertical_id, buyer_contract_name,
-            account_status_id='1', offer_id='0', replace_returns='off',
-            replacements_non_returnable='off', max_return_age_days='30',
-            buy_upsells='off', vintage_leads='off', min_lead_age_minutes='0',
-            max_lead_age_minutes='7200', posting_wait_seconds='0',
-            default_confirmation_page_link='', max_post_errors='10',
-            send_alert_only='off', rank='0', email_template_id='0',
-            portal_template_id='0', **kwargs):
-
-        api_url = '{}://{}/api/1/addedit.asmx/BuyerContract'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['buyer_contract_id'] = 0
-        parameters['buyer_id'] = buyer_id
-        parameters['vertical_id'] = vertical_id
-        parameters['buyer_contract_name'] = buyer_contract_name
-        parameters['account_status_id'] = account_status_id
-        parameters['offer_id'] = offer_id
-        parameters['replace_returns'] = replace_returns
-        parameters['replacements_non_returnable'] = replacements_non_returnable
-        parameters['max_return_age_days'] = max_return_age_days
-        parameters['buy_upsells'] = buy_upsells
-        parameters['vintage_leads'] = vintage_leads
-        parameters['min_lead_age_minutes'] = min_lead_age_minutes
-        parameters['max_lead_age_minutes'] = max_lead_age_minutes
-        parameters['posting_wait_seconds'] = posting_wait_seconds
-        parameters['default_confirmation_page_link'] = default_confirmation_page_link
-        parameters['max_post_errors'] = max_post_errors
-        parameters['send_alert_only'] = send_alert_only
-        parameters['rank'] = rank
-        parameters['email_template_id'] = email_template_id
-        parameters['portal_template_id'] = portal_template_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
     @_must_have_one(['offer_id', 'offer_contract_id'])
     def add_campaign(
             self, affiliate_id, media_type_id, payout, offer_id='0',
@@ -391,9 +864,10 @@ class AdminAPI(object):
 
 
     def add_campaign_creative_exception(
-            self, campaign_id, creative_id):
+            self, campaign_id, creative_id, **kwargs):
 
-        exception_type = self._get_exception_type(campaign_id=campaign_id)
+        exception_type = (kwargs['exception_type'] if 'exception_type' in
+            kwargs else self._get_exception_type(campaign_id=campaign_id))
 
         api_url = '{}://{}/api/1/addedit.asmx/CampaignCreativeExceptions'.format(
             self.protocol, self.admin_domain)
@@ -409,9 +883,10 @@ class AdminAPI(object):
 
 
     def add_campaign_subid_exception(
-            self, campaign_id, sub_id):
+            self, campaign_id, sub_id, **kwargs):
 
-        exception_type = self._get_exception_type(campaign_id=campaign_id) 
+        exception_type = (kwargs['exception_type'] if 'exception_type' in
+            kwargs else self._get_exception_type(campaign_id=campaign_id))
 
         api_url = '{}://{}/api/1/addedit.asmx/CampaignSubIdExceptions'.format(
             self.protocol, self.admin_domain)
@@ -426,87 +901,6 @@ class AdminAPI(object):
         return self._make_api_call(url=api_url, params=parameters)
 
 
-    def add_contact(
-            self, entity_type, entity_id, role_id, contact_email_address,
-            contact_first_name, include_in_mass_emails='on',
-            contact_middle_name='', contact_last_name='', contact_title='',
-            contact_department_id='-1', contact_phone_work='',
-            contact_phone_cell='', contact_phone_fax='',
-            contact_im_service='', contact_im_name='', contact_timezone='',
-            contact_language_id='-1', **kwargs):
-
-        api_url = '{}://{}/api/3/addedit.asmx/Contact'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['entity_type'] = entity_type
-        parameters['entity_id'] = entity_id
-        parameters['contact_id'] = 0
-        parameters['role_id'] = role_id
-        parameters['include_in_mass_emails'] = include_in_mass_emails
-        parameters['contact_first_name'] = contact_first_name
-        parameters['contact_middle_name'] = contact_middle_name
-        parameters['contact_last_name'] = contact_last_name
-        parameters['contact_email_address'] = contact_email_address
-        parameters['contact_password'] = ''
-        parameters['contact_title'] = contact_title
-        parameters['contact_department_id'] = contact_department_id
-        parameters['contact_phone_work'] = contact_phone_work
-        parameters['contact_phone_cell'] = contact_phone_cell
-        parameters['contact_phone_fax'] = contact_phone_fax
-        parameters['contact_im_service'] = contact_im_service
-        parameters['contact_im_name'] = contact_im_name
-        parameters['contact_timezone'] = contact_timezone
-        parameters['contact_language_id'] = contact_language_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def add_creative(
-            self, creative_name, offer_id, creative_type_id,
-            third_party_name='', creative_status_id='1', width='-1',
-            height='-1', offer_link='', allow_link_override='FALSE', notes='',
-            **kwargs):
-
-        api_url = '{}://{}/api/1/addedit.asmx/Creative'.format(
-            self.protocol, self.admin_domain)
-        
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['creative_id'] = 0
-        parameters['offer_id'] = offer_id
-        parameters['creative_name'] = creative_name
-        parameters['third_party_name'] = third_party_name
-        parameters['creative_type_id'] = creative_type_id
-        parameters['creative_status_id'] = creative_status_id
-        parameters['width'] = width
-        parameters['height'] = height
-        parameters['offer_link'] = offer_link
-        parameters['allow_link_override'] = allow_link_override
-        parameters['notes'] = notes
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def add_creative_files(
-            self, creative_id, creative_file_import_url,
-            is_preview_file='FALSE', replace_all_files='FALSE', **kwargs):
-        
-        api_url = '{}://{}/api/1/addedit.asmx/CreativeFiles'.format(
-            self.protocol, self.admin_domain)
-        
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['creative_id'] = creative_id
-        parameters['creative_file_id'] = 0
-        parameters['creative_file_import_url'] = creative_file_import_url
-        parameters['is_preview_file'] = is_preview_file
-        parameters['replace_all_files'] = replace_all_files
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
     @_if_one_then_all(['tags', 'tags_modification_type'])
     @_if_one_then_all(
         ['allowed_media_type_ids', 'allowed_media_type_modification_type'])
@@ -632,12 +1026,15 @@ class AdminAPI(object):
             address_city='', address_state='', address_zip_code='',
             address_country='', notes='', tags='', **kwargs):
 
-        advertiser_export = self.export_advertisers(
-            advertiser_id=advertiser_id, force_json=True)
-        if advertiser_export['row_count'] == 0:
+        if 'current_advertiser' in kwargs:
+            current_advertiser = kwargs['current_advertiser']
+        else:
+            current_advertiser = self._first_exported(self.export_advertisers(
+                advertiser_id=advertiser_id, force_json=True), 'advertisers')
+        if current_advertiser is None:
             current_notes = ''
         else:
-            current_notes = advertiser_export['advertisers'][0]['notes']
+            current_notes = current_advertiser['notes']
 
         api_url = '{}://{}/api/1/addedit.asmx/Advertiser'.format(
             self.protocol, self.admin_domain)
@@ -682,28 +1079,27 @@ class AdminAPI(object):
             fire_global_pixel='', referral_affiliate_id='0',
             referral_notes='', notes='', **kwargs):
         
-        affiliate_export = self.export_affiliates(
-            affiliate_id=affiliate_id, force_json=True)
-        if affiliate_export['row_count'] == 0:
+        if 'current_affiliate' in kwargs:
+            current_affiliate = kwargs['current_affiliate']
+        else:
+            current_affiliate = self._first_exported(self.export_affiliates(
+                affiliate_id=affiliate_id, force_json=True), 'affiliates')
+        if current_affiliate is None:
             current_hide_offers = 'FALSE'
             current_vat_required = 'FALSE'
             current_payment_to = 0
             current_fire_global = 'FALSE'
             current_notes = ''
         else:
-            current_hide_offers = (affiliate_export['affiliates'][0]
-                ['hide_offers'])
-            current_vat_required = (affiliate_export['affiliates'][0]
-                ['pay_vat'])
-            current_payment_to = (affiliate_export['affiliates'][0]
-                ['payment_to'])
+            current_hide_offers = current_affiliate['hide_offers']
+            current_vat_required = current_affiliate['pay_vat']
+            current_payment_to = current_affiliate['payment_to']
             if current_payment_to == 'Company':
                 current_payment_to = 0
             else:
                 current_payment_to = 1
-            current_fire_global = (affiliate_export['affiliates'][0]
-                ['fire_global_pixel'])
-            current_notes = affiliate_export['affiliates'][0]['notes']
+            current_fire_global = current_affiliate['fire_global_pixel']
+            current_notes = current_affiliate['notes']
         
         api_url = '{}://{}/api/2/addedit.asmx/Affiliate'.format(
             self.protocol, self.admin_domain)
@@ -762,75 +1158,6 @@ class AdminAPI(object):
         return self._make_api_call(url=api_url, params=parameters)
 
 
-    def edit_buyer(
-            self, buyer_id, buyer_name='', account_status_id='0',
-            account_manager_id='0', address_street='', address_street2='',
-            address_city='', address_state='', address_zip_code='',
-            address_country='', website='', billing_cycle_id='0',
-            credit_type='no_change', credit_limit='-1', **kwargs):
-
-        api_url = '{}://{}/api/1/addedit.asmx/Buyer'.format(self.protocol,
-            self.admin_domain)
-        
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['buyer_id'] = buyer_id
-        parameters['buyer_name'] = buyer_name
-        parameters['account_status_id'] = account_status_id
-        parameters['account_manager_id'] = account_manager_id
-        parameters['address_street'] = address_street
-        parameters['address_street2'] = address_street2
-        parameters['address_city'] = address_city
-        parameters['address_state'] = address_state
-        parameters['address_zip_code'] = address_zip_code
-        parameters['address_country'] = address_country
-        parameters['website'] = website
-        parameters['billing_cycle_id'] = billing_cycle_id
-        parameters['credit_type'] = credit_type
-        parameters['credit_limit'] = credit_limit
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def edit_buyer_contract(
-            self, buyer_contract_id, buyer_contract_name='',
-            account_status_id='0', offer_id='0', replace_returns='no_change',
-            replacements_non_returnable='no_change', max_return_age_days='-1',
-            buy_upsells='no_change', vintage_leads='no_change',
-            min_lead_age_minutes='-1', max_lead_age_minutes='-1',
-            posting_wait_seconds='-1', default_confirmation_page_link='',
-            max_post_errors='-1', send_alert_only='no_change', rank='-1',
-            email_template_id='0', portal_template_id='0', **kwargs):
-
-        api_url = '{}://{}/api/1/addedit.asmx/BuyerContract'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['buyer_contract_id'] = buyer_contract_id
-        parameters['buyer_id'] = 0
-        parameters['vertical_id'] = 0
-        parameters['buyer_contract_name'] = buyer_contract_name
-        parameters['account_status_id'] = account_status_id
-        parameters['offer_id'] = offer_id
-        parameters['replace_returns'] = replace_returns
-        parameters['replacements_non_returnable'] = replacements_non_returnable
-        parameters['max_return_age_days'] = max_return_age_days
-        parameters['buy_upsells'] = buy_upsells
-        parameters['vintage_leads'] = vintage_leads
-        parameters['min_lead_age_minutes'] = min_lead_age_minutes
-        parameters['max_lead_age_minutes'] = max_lead_age_minutes
-        parameters['posting_wait_seconds'] = posting_wait_seconds
-        parameters['default_confirmation_page_link'] = default_confirmation_page_link
-        parameters['max_post_errors'] = max_post_errors
-        parameters['send_alert_only'] = send_alert_only
-        parameters['rank'] = rank
-        parameters['email_template_id'] = email_template_id
-        parameters['portal_template_id'] = portal_template_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
     def edit_campaign(
             self, campaign_id, offer_contract_id='0', media_type_id='0',
             third_party_name='', account_status_id='0',
@@ -844,22 +1171,21 @@ class AdminAPI(object):
             postback_delay_ms='-1', unique_key_hash_type='', pixel_html='',
             test_link='', redirect_domain='', **kwargs):
 
-        if (not str(campaign_id).isdigit() or int(campaign_id) < 1 or
-            int(campaign_id) > 999999999):
-            raise Exception(('campaign_id must be an integer between 1 and '
-                '999999999'))
+        self._validate_campaign_id(campaign_id)
 
-        campaign_export = self.export_campaigns(
-            campaign_id=campaign_id, force_json=True)
-        if campaign_export['row_count'] == 0:
+        if 'current_campaign' in kwargs:
+            current_campaign = kwargs['current_campaign']
+        else:
+            current_campaign = self._first_exported(self.export_campaigns(
+                campaign_id=campaign_id, force_json=True), 'campaigns')
+        if current_campaign is None:
             current_hash = 'none'
         else:
-            if campaign_export['campaigns'][0]['pixel_info'] is None:
+            if current_campaign['pixel_info'] is None:
                 current_hash = 'none'
             else:
-                current_hash = (campaign_export['campaigns'][0]
-                    ['pixel_info']['hash_type']['hash_type_name'].lower()
-                    .replace(' ', '_'))
+                current_hash = (current_campaign['pixel_info']['hash_type']
+                    ['hash_type_name'].lower().replace(' ', '_'))
 
         api_url = '{}://{}/api/3/addedit.asmx/Campaign'.format(self.protocol,
             self.admin_domain)
@@ -932,35 +1258,11 @@ class AdminAPI(object):
         return self._make_api_call(url=api_url, params=parameters)
 
 
-    def edit_creative(
-            self, creative_id, allow_link_override, creative_name='',
-            third_party_name='', creative_type_id='0', creative_status_id='0',
-            width='-2', height='-2', offer_link='', notes='', **kwargs):
-
-        api_url = '{}://{}/api/1/addedit.asmx/Creative'.format(
-            self.protocol, self.admin_domain)
-        
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['creative_id'] = creative_id
-        parameters['offer_id'] = 0
-        parameters['creative_name'] = creative_name
-        parameters['third_party_name'] = third_party_name
-        parameters['creative_type_id'] = creative_type_id
-        parameters['creative_status_id'] = creative_status_id
-        parameters['width'] = width
-        parameters['height'] = height
-        parameters['offer_link'] = offer_link
-        parameters['allow_link_override'] = allow_link_override
-        parameters['notes'] = notes
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-    #      WAITING FOR BUG RESOLUTION IN UNDERLYING CAKE API
-    
-    # def edit_creative_files(
-    #         self, creative_id, creative_file_id, creative_file_import_url='',
-    #         is_preview_file='', replace_all_files='FALSE', **kwargs):
+    #      WAITING FOR BUG RESOLUTION IN UNDERLYING CAKE API
+    
+    # def edit_creative_files(
+    #         self, creative_id, creative_file_id, creative_file_import_url='',
+    #         is_preview_file='', replace_all_files='FALSE', **kwargs):
         
     #     if is_preview_file == '':
     #         creative_export = self.export_creatives(
@@ -1117,21 +1419,11 @@ class AdminAPI(object):
         return self._make_api_call(url=api_url, params=parameters)
 
 
-    def remove_blacklist(self, blacklist_id, **kwargs):
-        api_url = '{}://{}/api/1/addedit.asmx/RemoveBlacklist'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self. api_key
-        parameters['blacklist_id'] = blacklist_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
     def remove_campaign_creative_exception(
-            self, campaign_id, creative_id):
+            self, campaign_id, creative_id, **kwargs):
 
-        exception_type = self._get_exception_type(campaign_id=campaign_id)
+        exception_type = (kwargs['exception_type'] if 'exception_type' in
+            kwargs else self._get_exception_type(campaign_id=campaign_id))
 
         api_url = '{}://{}/api/1/addedit.asmx/CampaignCreativeExceptions'.format(
             self.protocol, self.admin_domain)
@@ -1147,9 +1439,10 @@ class AdminAPI(object):
 
 
     def remove_campaign_subid_exception(
-            self, campaign_id, sub_id):
+            self, campaign_id, sub_id, **kwargs):
 
-        exception_type = self._get_exception_type(campaign_id=campaign_id)
+        exception_type = (kwargs['exception_type'] if 'exception_type' in
+            kwargs else self._get_exception_type(campaign_id=campaign_id))
 
         api_url = '{}://{}/api/1/addedit.asmx/CampaignSubIdExceptions'.format(
             self.protocol, self.admin_domain)
@@ -1163,1421 +1456,257 @@ class AdminAPI(object):
 
         return self._make_api_call(url=api_url, params=parameters)
 
-    #---------------------------------EXPORT----------------------------------#
-
-    def export_advertisers(
-            self, advertiser_id='0', advertiser_name='',
-            account_manager_id='0', tag_id='0', start_at_row='0',
-            row_limit='0', sort_field='advertiser_id',
-            sort_descending='FALSE', **kwargs):
-        
-        api_url = '{}://{}/api/6/export.asmx/Advertisers'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['advertiser_id'] = advertiser_id
-        parameters['advertiser_name'] = advertiser_name
-        parameters['account_manager_id'] = account_manager_id
-        parameters['tag_id'] = tag_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        force_json = kwargs['force_json'] if 'force_json' in kwargs else False
-
-        return self._make_api_call(
-            url=api_url, params=parameters, force_json=force_json)
-
-
-    def export_affiliates(
-            self, affiliate_id='0', affiliate_name='', account_manager_id='0',
-            tag_id='0', start_at_row='0', row_limit='0',
-            sort_field='affiliate_id', sort_descending='FALSE', **kwargs):
-
-        api_url = '{}://{}/api/5/export.asmx/Affiliates'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = affiliate_id
-        parameters['affiliate_name'] = affiliate_name
-        parameters['account_manager_id'] = account_manager_id
-        parameters['tag_id'] = tag_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-         
-        force_json = kwargs['force_json'] if 'force_json' in kwargs else False
-
-        return self._make_api_call(
-            url=api_url, params=parameters, force_json=force_json)
-
-
-    def export_blacklists(
-            self, affiliate_id='0', sub_id='',
-            advertiser_id='0', offer_id='0', **kwargs):
-
-        api_url = '{}://{}/api/1/export.asmx/Blacklists'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = affiliate_id
-        parameters['sub_id'] = sub_id
-        parameters['advertiser_id'] = advertiser_id
-        parameters['offer_id'] = offer_id
-
-        force_json = kwargs['force_json'] if 'force_json' in kwargs else False
-
-        return self._make_api_call(
-            url=api_url, params=parameters, force_json=force_json)
-
-
-    def export_buyer_contracts(
-            self, buyer_contract_id='0', buyer_id='0',
-            vertical_id='0', buyer_contract_status_id='0', **kwargs):
-
-        api_url = '{}://{}/api/4/export.asmx/BuyerContracts'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['buyer_contract_id'] = buyer_contract_id
-        parameters['buyer_id'] = buyer_id
-        parameters['vertical_id'] = vertical_id
-        parameters['buyer_contract_status_id'] = buyer_contract_status_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def export_buyers(self, buyer_id='0', account_status_id='0', **kwargs):
-        api_url = '{}://{}/api/2/export.asmx/Buyers'.format(self.protocol,
-            self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['buyer_id'] = buyer_id
-        parameters['account_status_id'] = account_status_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    @_must_have_one(['campaign_id', 'site_offer_id', 'source_affiliate_id'])
-    def export_campaigns(
-            self, campaign_id='0', site_offer_id='0', source_affiliate_id='0',
-            channel_id='0', account_status_id='0', media_type_id='0',
-            start_at_row='0', row_limit='0', sort_field='campaign_id',
-            sort_descending='FALSE', **kwargs):
-
-        api_url = '{}://{}/api/8/export.asmx/Campaigns'.format(self.protocol,
-            self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['campaign_id'] = campaign_id
-        parameters['site_offer_id'] = site_offer_id
-        parameters['source_affiliate_id'] = source_affiliate_id
-        parameters['channel_id'] = channel_id
-        parameters['account_status_id'] = account_status_id
-        parameters['media_type_id'] = media_type_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-        
-        force_json = kwargs['force_json'] if 'force_json' in kwargs else False
-
-        return self._make_api_call(
-            url=api_url, params=parameters, force_json=force_json)
-
-
-    def export_creatives(
-            self, offer_id, creative_id='0', creative_name='',
-            creative_type_id='0', creative_status_id='0', start_at_row='0',
-            row_limit='0', sort_field='creative_id', sort_descending='FALSE',
-            **kwargs):
-
-        api_url = '{}://{}/api/3/export.asmx/Creatives'.format(self.protocol,
-            self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['creative_id'] = creative_id
-        parameters['creative_name'] = creative_name
-        parameters['offer_id'] = offer_id
-        parameters['creative_type_id'] = creative_type_id
-        parameters['creative_status_id'] = creative_status_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        force_json = kwargs['force_json'] if 'force_json' in kwargs else False
-
-        return self._make_api_call(
-            url=api_url, params=parameters, force_json=force_json)
-
-
-    def export_offers(
-            self, offer_id='0', offer_name='', advertiser_id='0',
-            vertical_id='0', offer_type_id='0', media_type_id='0',
-            offer_status_id='0', tag_id='0', start_at_row='0', row_limit='0',
-            sort_field='offer_id', sort_descending='FALSE', **kwargs):
-
-        api_url = '{}://{}/api/6/export.asmx/Offers'.format(self.protocol,
-            self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['offer_id'] = offer_id
-        parameters['offer_name'] = offer_name
-        parameters['advertiser_id'] = advertiser_id
-        parameters['vertical_id'] = vertical_id
-        parameters['offer_type_id'] = offer_type_id
-        parameters['media_type_id'] = media_type_id
-        parameters['offer_status_id'] = offer_status_id
-        parameters['tag_id'] = tag_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        force_json = kwargs['force_json'] if 'force_json' in kwargs else False
-
-        return self._make_api_call(
-            url=api_url, params=parameters, force_json=force_json)
-
+    #--------------------------------REPORTS----------------------------------#
 
-    def export_pixel_log_requests(
-            self, start_date, end_date, advertiser_id='0', offer_id='0', 
-            converted_only='FALSE', start_at_row='0', row_limit='0',
-            sort_descending='FALSE', **kwargs):
+    @_must_have_one(['site_offer_id', 'campaign_id'])
+    def creative_summary(
+            self, start_date, end_date, site_offer_id='0', campaign_id='0',
+            event_id='0', event_type='all', **kwargs):
 
-        api_url = '{}://{}/api/1/export.asmx/PixelLogRequests'.format(
+        api_url = '{}://{}/api/3/reports.asmx/CreativeSummary'.format(
             self.protocol, self.admin_domain)
 
         parameters = _OrderedDict()
         parameters['api_key'] = self.api_key
-        parameters['advertiser_id'] = advertiser_id
-        parameters['offer_id'] = offer_id
         parameters['start_date'] = str(start_date)
         parameters['end_date'] = str(end_date)
-        parameters['converted_only'] = converted_only
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_descending'] = sort_descending
+        parameters['site_offer_id'] = (0 if site_offer_id is None else
+            site_offer_id)
+        parameters['campaign_id'] = (0 if campaign_id is None else
+            campaign_id)
+        parameters['event_id'] = event_id
+        parameters['event_type'] = event_type
 
         return self._make_api_call(url=api_url, params=parameters)
 
+    #---------------------------------TRACK-----------------------------------#
 
-    def export_rule_targets(self, rule_id, **kwargs):
-        api_url = '{}://{}/api/3/export.asmx/RuleTargets'.format(
-            self.protocol, self.admin_domain) 
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['rule_id'] = rule_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
+    @_must_have_one(['conversion_id', 'request_session_id', 'transaction_id'])
+    @_if_one_then_all(('payout', 'add_to_existing_payout'))
+    @_if_one_then_all(('received', 'received_option'))
+    def update_conversion(
+            self, offer_id, conversion_id='0', request_session_id='0',
+            transaction_id='', payout='', add_to_existing_payout='TRUE',
+            received='', received_option='no_change',
+            disposition_type='no_change', disposition_id='0',
+            update_revshare_payout='FALSE',
+            effective_date_option='conversion_date', custom_date='',
+            note_to_append='', disallow_on_billing_status='ignore', **kwargs):
 
-    def export_schedules(
-            self, start_date, end_date, buyer_id='0', status_id='0',
-            vertical_id='0', priority_only='FALSE', active_only='FALSE',
-            **kwargs):
+        if (effective_date_option == 'custom' and
+                custom_date == ''):
+            raise Exception('Missing argument: custom_date')
 
-        api_url = '{}://{}/api/2/export.asmx/Schedules'.format(
+        api_url = '{}://{}/api/4/track.asmx/UpdateConversion'.format(
             self.protocol, self.admin_domain) 
 
         parameters = _OrderedDict()
         parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['buyer_id'] = buyer_id
-        parameters['status_id'] = status_id
-        parameters['vertical_id'] = vertical_id
-        parameters['priority_only'] = priority_only
-        parameters['active_only'] = active_only
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-    #----------------------------------GET------------------------------------#
-
-    def get_account_statuses(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/AccountStatuses'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_advertisers(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/Advertisers'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        force_json = kwargs['force_json'] if 'force_json' in kwargs else False
-
-        return self._make_api_call(
-            url=api_url, params=parameters, force_json=force_json)
-
-
-    def get_affiliate_tags(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/AffiliateTags'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
+        parameters['offer_id'] = offer_id
+        parameters['conversion_id'] = conversion_id
+        parameters['request_session_id'] = request_session_id
+        parameters['transaction_id'] = transaction_id
+        parameters['payout'] = 0 if payout == '' else payout
+        parameters['add_to_existing_payout'] = add_to_existing_payout
+        parameters['received'] = 0 if received == '' else received
+        parameters['received_option'] = received_option
+        parameters['disposition_type'] = disposition_type
+        parameters['disposition_id'] = disposition_id
+        parameters['update_revshare_payout'] = update_revshare_payout
+        parameters['effective_date_option'] = effective_date_option
+        parameters['custom_date'] = ('2067-10-20 13:31:59.7' if
+            custom_date == '' else str(custom_date))
+        parameters['note_to_append'] = note_to_append
+        parameters['disallow_on_billing_status'] = disallow_on_billing_status
 
         return self._make_api_call(url=api_url, params=parameters)
 
+    #--------------------------------SPECIAL----------------------------------#
 
-    def get_affiliate_tiers(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/AffiliateTiers'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
+    def get_advertiser_ids(self):
+        """Returns a list of all Advertiser IDs"""
 
-    def get_billing_cycles(self, **kwargs):
+        advertiser_export = self.get_advertisers(force_json=True)
+        advertiser_ids = [_['advertiser_id'] for _ in advertiser_export]
+        return advertiser_ids
 
-        api_url = '{}://{}/api/1/get.asmx/BillingCycles'.format(
-            self.protocol, self.admin_domain)
 
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
+    def _cached_ids(self, key, cache_ttl):
+        cached = self._id_cache.get(key) if cache_ttl else None
+        if cached is None or cached[0] <= _time.time():
+            return None
+        return _array('l', cached[1])
 
-        return self._make_api_call(url=api_url, params=parameters)
 
+    def _cache_ids(self, key, ids, cache_ttl):
+        if cache_ttl:
+            self._id_cache[key] = (_time.time() + cache_ttl, _array('l', ids))
+        return ids
 
-    def get_blacklist_reasons(self, **kwargs):
 
-        api_url = '{}://{}/api/1/get.asmx/BlacklistReasons'.format(
-            self.protocol, self.admin_domain)
+    def _get_ids(self, function, id_field, window, cache_ttl, **kwargs):
+        """Returns an array of the id_field of every row of a paginated
+        function, fetching window pages at a time"""
 
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
+        key = (function.__name__, tuple(sorted(kwargs.items())))
+        ids = self._cached_ids(key, cache_ttl)
+        if ids is None:
+            ids = _array('l', (row[id_field] for row in self.iter_rows(
+                function, page_size=2500, window=window, **kwargs)))
+            self._cache_ids(key, ids, cache_ttl)
+        return ids
 
-        return self._make_api_call(url=api_url, params=parameters)
 
+    def get_affiliate_ids(self, window=4, cache_ttl=None):
+        """Returns an array of all Affiliate IDs"""
 
-    def get_cap_intervals(self, **kwargs):
+        return self._get_ids(
+            self.export_affiliates, 'affiliate_id', window, cache_ttl)
 
-        api_url = '{}://{}/api/1/get.asmx/CapIntervals'.format(
-            self.protocol, self.admin_domain)
 
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
+    def get_campaign_ids(
+            self, site_offer_id='0', source_affiliate_id='0', window=4,
+            cache_ttl=None):
+        """Returns an array of Campaign IDs"""
 
-        return self._make_api_call(url=api_url, params=parameters)
+        return self._get_ids(
+            self.export_campaigns, 'campaign_id', window, cache_ttl,
+            campaign_id='0', site_offer_id=site_offer_id,
+            source_affiliate_id=source_affiliate_id)
 
 
-    def get_cap_types(self, **kwargs):
+    def get_creative_ids(self, offer_id='0', window=4, cache_ttl=None):
+        """Returns an array of Creative IDs"""
 
-        api_url = '{}://{}/api/1/get.asmx/CapTypes'.format(
-            self.protocol, self.admin_domain)
+        return self._get_ids(
+            self.export_creatives, 'creative_id', window, cache_ttl,
+            offer_id=offer_id)
 
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
 
-        return self._make_api_call(url=api_url, params=parameters)
+    def get_offer_ids(self, advertiser_id='0'):
+        """Returns a list of Offer IDs"""
 
+        offer_export = self.export_offers(
+            advertiser_id=advertiser_id, force_json=True)
+        all_offers = offer_export['offers']
+        offer_ids = [_['offer_id'] for _ in all_offers]
+        return offer_ids
 
-    def get_conversion_dispositions(self, **kwargs):
+    #----------------------------------BULK-----------------------------------#
+
+    @staticmethod
+    def _split_bulk_edits(entity, edits):
+        """Returns the entity ids and the edit_ keyword arguments of edits"""
+
+        id_field = _BULK_EDITS[entity][0]
+        entity_ids = []
+        all_kwargs = []
+        for edit in edits:
+            kwargs = dict(edit)
+            entity_ids.append(kwargs.pop(id_field))
+            all_kwargs.append(kwargs)
+        if len(set(str(_) for _ in entity_ids)) != len(entity_ids):
+            raise Exception('Each {} can only be edited once per bulk '
+                'edit'.format(id_field))
+        return entity_ids, all_kwargs
+
+
+    @staticmethod
+    def _keep_current(entity, current, rows):
+        """Stores the rows being edited in current and returns True once
+        rows are past the highest id being edited"""
+
+        id_field = _BULK_EDITS[entity][0]
+        for row in rows:
+            if str(row[id_field]) in current:
+                current[str(row[id_field])] = row
+        last_id = max([int(_) for _ in current if _.isdigit()] or [0])
+        return bool(rows) and row[id_field] >= last_id
+
+
+    def _prefetch_current(self, entity, entity_ids, page_size):
+        """Returns the current rows of the entities to edit keyed by id
+        (None for ids that do not exist), or None if they cannot be
+        exported, in which case each edit exports its own entity"""
+
+        export = getattr(self, 'export_{}s'.format(entity))
+        export_kwargs = _BULK_EDITS[entity][1]
+        current = dict.fromkeys(str(_) for _ in entity_ids)
+        try:
+            for page in self.iter_pages(
+                    export, page_size=page_size, **export_kwargs):
+                if self._keep_current(entity, current, _rows_of(page)):
+                    break
+        except Exception:
+            return None
+        return current
+
+
+    @staticmethod
+    def _edit_failure(response):
+        """Returns why an edit failed, or None if it succeeded"""
+
+        if isinstance(response, dict) and response.get('success') is False:
+            return response.get('message') or 'success was false'
+        if (isinstance(response, str) and
+                '<success>false</success>' in response.lower()):
+            return response
+        return None
 
-        api_url = '{}://{}/api/2/track.asmx/ConversionDispositions'.format(
-            self.protocol, self.admin_domain)
 
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
+    @staticmethod
+    def _bulk_results(entity_ids, failures):
+        results = {'succeeded': [], 'failed': _OrderedDict()}
+        for entity_id, failure in zip(entity_ids, failures):
+            if failure is None:
+                results['succeeded'].append(entity_id)
+            else:
+                results['failed'][entity_id] = failure
+        return results
 
-        return self._make_api_call(url=api_url, params=parameters)
 
+    def _bulk_edit(self, entity, edits, max_workers, page_size):
+        entity_ids, all_kwargs = self._split_bulk_edits(entity, edits)
+        if not entity_ids:
+            return self._bulk_results([], [])
+        current = self._prefetch_current(entity, entity_ids, page_size)
+        edit = getattr(self, 'edit_{}'.format(entity))
 
-    def get_countries(self, **kwargs):
+        def apply(entity_id, kwargs):
+            if current is not None:
+                kwargs['current_{}'.format(entity)] = current[str(entity_id)]
+            try:
+                return self._edit_failure(edit(entity_id, **kwargs))
+            except Exception as e:
+                return str(e)
 
-        api_url = '{}://{}/api/1/get.asmx/Countries'.format(
-            self.protocol, self.admin_domain)
+        with _ThreadPoolExecutor(max_workers=max_workers) as executor:
+            failures = list(executor.map(apply, entity_ids, all_kwargs))
+        return self._bulk_results(entity_ids, failures)
 
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
 
-        return self._make_api_call(url=api_url, params=parameters)
+    def bulk_edit_advertisers(self, edits, max_workers=8, page_size=2500):
+        """Applies edit_advertiser() to each dict of keyword arguments in
+        edits, which must include advertiser_id. Returns a dict with the
+        'succeeded' advertiser IDs and the reason each 'failed' one failed"""
 
+        return self._bulk_edit('advertiser', edits, max_workers, page_size)
 
-    def get_currencies(self, **kwargs):
 
-        api_url = '{}://{}/api/1/get.asmx/Currencies'.format(
-            self.protocol, self.admin_domain)
+    def bulk_edit_affiliates(self, edits, max_workers=8, page_size=2500):
+        """Applies edit_affiliate() to each dict of keyword arguments in
+        edits, which must include affiliate_id. Returns a dict with the
+        'succeeded' affiliate IDs and the reason each 'failed' one failed"""
 
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
+        return self._bulk_edit('affiliate', edits, max_workers, page_size)
 
-        return self._make_api_call(url=api_url, params=parameters)
 
+    def bulk_edit_campaigns(self, edits, max_workers=8, page_size=2500):
+        """Applies edit_campaign() to each dict of keyword arguments in
+        edits, which must include campaign_id. Returns a dict with the
+        'succeeded' campaign IDs and the reason each 'failed' one failed"""
 
-    def get_custom_queue_statuses(self, **kwargs):
+        return self._bulk_edit('campaign', edits, max_workers, page_size)
 
-        api_url = '{}://{}/api/1/get.asmx/CustomQueueStatuses'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_departments(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/Departments'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_email_templates(self, email_type='both', **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/EmailTemplates'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['email_type'] = email_type
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_exchange_rates(self, start_date, end_date, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/ExchangeRates'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = start_date
-        parameters['end_date'] = end_date
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_filter_types(
-            self, filter_type_id='0', filter_type_name='', vertical_id='0',
-            **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/FilterTypes'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['filter_type_id'] = filter_type_id
-        parameters['filter_type_name'] = filter_type_name
-        parameters['vertical_id'] = vertical_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_api_key(self, username, password, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/GetAPIKey'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['username'] = username
-        parameters['password'] = password
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_inactive_reasons(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/InactiveReasons'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_languages(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/Languages'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_lead_info(self, lead_id, vertical_id='0', **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/LeadInfo'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['lead_id'] = lead_id
-        parameters['vertical_id'] = vertical_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_lead_return_reasons(self):
-
-        api_url = '{}://{}/buyers/api/1/leads.asmx/GetReturnReasons'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = {}
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_lead_tier_groups(self, lead_tier_group_id='0', **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/LeadTierGroups'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['lead_tier_group_id'] = lead_tier_group_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_link_display_types(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/LinkDisplayTypes'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_media_types(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/MediaTypes'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_offer_statuses(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/OfferStatuses'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_offer_types(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/OfferTypes'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_payment_settings(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/PaymentSettings'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_payment_types(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/PaymentTypes'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_price_formats(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/PriceFormats'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_response_dispositions(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/ResponseDispositions'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_roles(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/Roles'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_schedule_types(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/ScheduleTypes'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_session_regeneration_types(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/SessionRegenerationTypes'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_shared_rules(self, **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/SharedRules'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_tracking_domains(self, domain_type='all', **kwargs):
-
-        api_url = '{}://{}/api/1/get.asmx/TrackingDomains'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['domain_type'] = domain_type
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_verticals(self, vertical_category_id='0', **kwargs):
-
-        api_url = '{}://{}/api/2/get.asmx/Verticals'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['vertical_category_id'] = vertical_category_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_vertical_categories(self, **kwargs):
-
-        api_url = '{}://{}/api/1/signup.asmx/GetVerticalCategories'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    #--------------------------------REPORTS----------------------------------#
-
-    def brand_advertiser_summary(
-            self, start_date, end_date, brand_advertiser_id='0',
-            brand_advertiser_manager_id='0', brand_advertiser_tag_id='0',
-            event_id='0', event_type='all', **kwargs):
-
-        api_url = '{}://{}/api/3/reports.asmx/BrandAdvertiserSummary'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['brand_advertiser_id'] = brand_advertiser_id
-        parameters['brand_advertiser_manager_id'] = (
-            brand_advertiser_manager_id)
-        parameters['brand_advertiser_tag_id'] = brand_advertiser_tag_id
-        parameters['event_id'] = event_id
-        parameters['event_type'] = event_type
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def campaign_summary(
-            self, start_date, end_date, campaign_id='0',
-            source_affiliate_id='0', subid_id='', site_offer_id='0',
-            source_affiliate_tag_id='0', site_offer_tag_id='0',
-            source_affiliate_manager_id='0', brand_advertiser_manager_id='0',
-            event_id='0', event_type='all', **kwargs):
-
-        api_url = '{}://{}/api/5/reports.asmx/CampaignSummary'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['campaign_id'] = campaign_id
-        parameters['source_affiliate_id'] = source_affiliate_id
-        parameters['subid_id'] = subid_id
-        parameters['site_offer_id'] = site_offer_id
-        parameters['source_affiliate_tag_id'] = source_affiliate_tag_id
-        parameters['site_offer_tag_id'] = site_offer_tag_id
-        parameters['source_affiliate_manager_id'] = source_affiliate_manager_id
-        parameters['brand_advertiser_manager_id'] = brand_advertiser_manager_id
-        parameters['event_id'] = event_id
-        parameters['event_type'] = event_type
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def clicks(
-            self, start_date, end_date, affiliate_id='0', advertiser_id='0',
-            offer_id='0', campaign_id='0', creative_id='0',
-            price_format_id='0', include_duplicates='FALSE',
-            include_tests='FALSE', start_at_row='0', row_limit='0', **kwargs):
-
-        api_url = '{}://{}/api/12/reports.asmx/Clicks'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['affiliate_id'] = affiliate_id
-        parameters['advertiser_id'] = advertiser_id
-        parameters['offer_id'] = offer_id
-        parameters['campaign_id'] = campaign_id
-        parameters['creative_id'] = creative_id
-        parameters['price_format_id'] = price_format_id
-        parameters['include_duplicates'] = include_duplicates
-        parameters['include_tests'] = include_tests
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def event_conversion_changes(
-            self, changes_since, include_new_event_conversions='FALSE',
-            source_affiliate_id='0', brand_advertiser_id='0',
-            site_offer_id='0', campaign_id='0', creative_id='0',
-            include_tests='FALSE', start_at_row='0', row_limit='0',
-            sort_field='event_conversion_date', sort_descending='FALSE',
-            **kwargs):
-
-        api_url = '{}://{}/api/17/reports.asmx/EventConversionChanges'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['changes_since'] = str(changes_since)
-        parameters['include_new_event_conversions'] = include_new_event_conversions
-        parameters['source_affiliate_id'] = source_affiliate_id
-        parameters['brand_advertiser_id'] = brand_advertiser_id
-        parameters['site_offer_id'] = site_offer_id
-        parameters['campaign_id'] = campaign_id
-        parameters['creative_id'] = creative_id
-        parameters['include_tests'] = include_tests
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    @_must_have_one(['advertiser_id', 'offer_id', 'affiliate_id', 'campaign_id'])
-    def country_summary(
-            self, start_date, end_date, affiliate_id='0', affiliate_tag_id='0',
-            advertiser_id='0', offer_id='0', campaign_id='0', event_id='0',
-            revenue_filter='conversions_and_events', **kwargs):
-
-        api_url = '{}://{}/api/1/reports.asmx/CountrySummary'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['affiliate_id'] = affiliate_id
-        parameters['affiliate_tag_id'] = affiliate_tag_id
-        parameters['advertiser_id'] = advertiser_id
-        parameters['offer_id'] = offer_id
-        parameters['campaign_id'] = campaign_id
-        parameters['event_id'] = event_id
-        parameters['revenue_filter'] = revenue_filter
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    @_must_have_one(['site_offer_id', 'campaign_id'])
-    def creative_summary(
-            self, start_date, end_date, site_offer_id='0', campaign_id='0',
-            event_id='0', event_type='all', **kwargs):
-
-        api_url = '{}://{}/api/3/reports.asmx/CreativeSummary'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['site_offer_id'] = (0 if site_offer_id is None else
-            site_offer_id)
-        parameters['campaign_id'] = (0 if campaign_id is None else
-            campaign_id)
-        parameters['event_id'] = event_id
-        parameters['event_type'] = event_type
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def daily_summary(
-            self, start_date, end_date, source_affiliate_id='0',
-            brand_advertiser_id='0', site_offer_id='0', vertical_id='0',
-            campaign_id='0', creative_id='0', account_manager_id='0',
-            include_tests='FALSE', **kwargs):
-
-        api_url = '{}://{}/api/2/reports.asmx/DailySummaryExport'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['source_affiliate_id'] = source_affiliate_id
-        parameters['brand_advertiser_id'] = brand_advertiser_id
-        parameters['site_offer_id'] = site_offer_id
-        parameters['vertical_id'] = vertical_id
-        parameters['campaign_id'] = campaign_id
-        parameters['creative_id'] = creative_id
-        parameters['account_manager_id'] = account_manager_id
-        parameters['include_tests'] = include_tests
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def events_conversions(
-            self, start_date, end_date, event_type='all', event_id='0',
-            source_affiliate_id='0', brand_advertiser_id='0', channel_id='0',
-            site_offer_id='0', site_offer_contract_id='0',
-            source_affiliate_tag_id='0', brand_advertiser_tag_id='0',
-            site_offer_tag_id='0', campaign_id='0', creative_id='0',
-            price_format_id='0', source_type='all',
-            payment_percentage_filter='both', disposition_type='all',
-            disposition_id='0', source_affiliate_billing_status='all',
-            brand_advertiser_billing_status='all', test_filter='non_tests',
-            start_at_row='0', row_limit='0',
-            sort_field='event_conversion_date', sort_descending='FALSE',
-            **kwargs):
-
-        api_url = '{}://{}/api/17/reports.asmx/EventConversions'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['event_type'] = event_type
-        parameters['event_id'] = event_id
-        parameters['source_affiliate_id'] = source_affiliate_id
-        parameters['brand_advertiser_id'] = brand_advertiser_id
-        parameters['channel_id'] = channel_id
-        parameters['site_offer_id'] = site_offer_id
-        parameters['site_offer_contract_id'] = site_offer_contract_id
-        parameters['source_affiliate_tag_id'] = source_affiliate_tag_id
-        parameters['brand_advertiser_tag_id'] = brand_advertiser_tag_id
-        parameters['site_offer_tag_id'] = site_offer_tag_id
-        parameters['campaign_id'] = campaign_id
-        parameters['creative_id'] = creative_id
-        parameters['price_format_id'] = price_format_id
-        parameters['source_type'] = source_type
-        parameters['payment_percentage_filter'] = payment_percentage_filter
-        parameters['disposition_type'] = disposition_type
-        parameters['disposition_id'] = disposition_id
-        parameters['source_affiliate_billing_status'] = (
-            source_affiliate_billing_status)
-        parameters['brand_advertiser_billing_status'] = (
-            brand_advertiser_billing_status)
-        parameters['test_filter'] = test_filter
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def leads_by_buyer(
-            self, start_date, end_date, vertical_id='0', buyer_id='0',
-            buyer_contract_id='0', status_id='0', sub_status_id='0',
-            start_at_row='0', row_limit='0', sort_field='transaction_date',
-            sort_descending='FALSE', **kwargs):
-
-        api_url = '{}://{}/api/4/reports.asmx/LeadsByBuyer'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['vertical_id'] = vertical_id
-        parameters['buyer_id'] = buyer_id
-        parameters['buyer_contract_id'] = buyer_contract_id
-        parameters['status_id'] = status_id
-        parameters['sub_status_id'] = sub_status_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def leads_by_affiliate(
-            self, start_date, end_date, vertical_id='0',
-            source_affiliate_id='0', site_offer_id='0',
-            source_affiliate_manager_id='0', upsell='upsells_and_non_upsells',
-            lead_tier_id='0', start_at_row='0', row_limit='0', **kwargs):
-
-        api_url = '{}://{}/api/2/reports.asmx/LeadsByAffiliateExport'.format(
-            self.protocol, self.admin_domain) 
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['vertical_id'] = vertical_id
-        parameters['source_affiliate_id'] = source_affiliate_id
-        parameters['site_offer_id'] = site_offer_id
-        parameters['source_affiliate_manager_id'] = source_affiliate_manager_id
-        parameters['upsell'] = upsell
-        parameters['lead_tier_id'] = lead_tier_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def lite_clicks_advertiser_summary(
-            self, start_date, end_date, advertiser_id='0',
-            advertiser_manager_id='0', advertiser_tag_id='0', event_id='0',
-            revenue_filter='conversions_and_events', **kwargs):
-
-        api_url = ('{}://{}/api/1/reports_lite_clicks.asmx/AdvertiserSummary'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['advertiser_id'] = advertiser_id
-        parameters['advertiser_manager_id'] = advertiser_manager_id
-        parameters['advertiser_tag_id'] = advertiser_tag_id
-        parameters['event_id'] = event_id
-        parameters['revenue_filter'] = revenue_filter
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def lite_clicks_affiliate_summary(
-            self, start_date, end_date, affiliate_id='0',
-            affiliate_manager_id='0', affiliate_tag_id='0', offer_tag_id='0',
-            event_id='0', revenue_filter='conversions_and_events', **kwargs):
-
-        api_url = ('{}://{}/api/1/reports_lite_clicks.asmx/AffiliateSummary'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['affiliate_id'] = affiliate_id
-        parameters['affiliate_manager_id'] = affiliate_manager_id
-        parameters['affiliate_tag_id'] = affiliate_tag_id
-        parameters['offer_tag_id'] = offer_tag_id
-        parameters['event_id'] = event_id
-        parameters['revenue_filter'] = revenue_filter
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def lite_clicks_campaign_summary(
-            self, start_date, end_date, affiliate_id='0', subaffiliate_id='',
-            affiliate_tag_id='0', offer_id='0', offer_tag_id='0',
-            campaign_id='0', event_id='0',
-            revenue_filter='conversions_and_events', **kwargs):
-        
-        api_url = ('{}://{}/api/2/reports_lite_clicks.asmx/CampaignSummary'
-            .format(self.protocol, self.admin_domain))
-        
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['affiliate_id'] = affiliate_id
-        parameters['subaffiliate_id'] = subaffiliate_id
-        parameters['affiliate_tag_id'] = affiliate_tag_id
-        parameters['offer_id'] = offer_id
-        parameters['offer_tag_id'] = offer_tag_id
-        parameters['campaign_id'] = campaign_id
-        parameters['event_id'] = event_id
-        parameters['revenue_filter'] = revenue_filter
-        
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    @_must_have_one(['advertiser_id', 'offer_id', 'affiliate_id', 'campaign_id'])
-    def lite_clicks_country_summary(
-            self, start_date, end_date, affiliate_id='0', affiliate_tag_id='0',
-            advertiser_id='0', offer_id='0', campaign_id='0', event_id='0',
-            revenue_filter='conversions_and_events', **kwargs):
-
-        api_url = ('{}://{}/api/1/reports_lite_clicks.asmx/CountrySummary'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['affiliate_id'] = affiliate_id
-        parameters['affiliate_tag_id'] = affiliate_tag_id
-        parameters['advertiser_id'] = advertiser_id
-        parameters['offer_id'] = offer_id
-        parameters['campaign_id'] = campaign_id
-        parameters['event_id'] = event_id
-        parameters['revenue_filter'] = revenue_filter
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def lite_clicks_daily_summary(
-            self, start_date, end_date, affiliate_id='0', advertiser_id='0',
-            offer_id='0', vertical_id='0', campaign_id='0', creative_id='0',
-            account_manager_id='0', include_tests='FALSE', **kwargs):
-
-        api_url = ('{}://{}/api/1/reports_lite_clicks.asmx/DailySummaryExport'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['affiliate_id'] = affiliate_id
-        parameters['advertiser_id'] = advertiser_id
-        parameters['offer_id'] = offer_id
-        parameters['vertical_id'] = vertical_id
-        parameters['campaign_id'] = campaign_id
-        parameters['creative_id'] = creative_id
-        parameters['account_manager_id'] = account_manager_id
-        parameters['include_tests'] = include_tests
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def lite_clicks_offer_summary(
-            self, start_date, end_date, advertiser_id='0',
-            advertiser_manager_id='0', offer_id='0', offer_tag_id='0',
-            affiliate_tag_id='0', event_id='0',
-            revenue_filter='conversions_and_events', **kwargs):
-
-        api_url = ('{}://{}/api/1/reports_lite_clicks.asmx/OfferSummary'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['advertiser_id'] = advertiser_id
-        parameters['advertiser_manager_id'] = advertiser_manager_id
-        parameters['offer_id'] = offer_id
-        parameters['offer_tag_id'] = offer_tag_id
-        parameters['affiliate_tag_id'] = affiliate_tag_id
-        parameters['event_id'] = event_id
-        parameters['revenue_filter'] = revenue_filter
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def lite_clicks_sub_id_summary(
-            self, start_date, end_date, source_affiliate_id, site_offer_id='0',
-            campaign_id='0', sub_id='NULL', event_id='0',
-            revenue_filter='conversions_and_events', **kwargs):
-
-        api_url = ('{}://{}/api/2/reports_lite_clicks.asmx/SubIDSummary'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['source_affiliate_id'] = source_affiliate_id
-        parameters['site_offer_id'] = site_offer_id
-        parameters['campaign_id'] = campaign_id
-        parameters['sub_id'] = sub_id
-        parameters['event_id'] = event_id
-        parameters['revenue_filter'] = revenue_filter
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def login_export(self, start_date, end_date, role_id='0', **kwargs):
-        api_url = '{}://{}/api/1/reports.asmx/LoginExport'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['role_id'] = role_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def order_details(
-            self, start_date, end_date, affiliate_id='0', conversion_id='0',
-            order_id='', start_at_row='0', row_limit='0',
-            sort_field='order_id', sort_descending='FALSE', **kwargs):
-
-        api_url = '{}://{}/api/1/reports.asmx/OrderDetails'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['affiliate_id'] = affiliate_id
-        parameters['conversion_id'] = conversion_id
-        parameters['order_id'] = order_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def site_offer_summary(
-            self, start_date, end_date, brand_advertiser_id='0',
-            brand_advertiser_manager_id='0', site_offer_id='0',
-            site_offer_tag_id='0', source_affiliate_tag_id='0', event_id='0',
-            event_type='all', **kwargs):
-
-        api_url = '{}://{}/api/4/reports.asmx/SiteOfferSummary'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['brand_advertiser_id'] = brand_advertiser_id
-        parameters['brand_advertiser_manager_id'] = (
-            brand_advertiser_manager_id)
-        parameters['site_offer_id'] = site_offer_id
-        parameters['site_offer_tag_id'] = site_offer_tag_id
-        parameters['source_affiliate_tag_id'] = source_affiliate_tag_id
-        parameters['event_id'] = event_id
-        parameters['event_type'] = event_type
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def source_affiliate_summary(
-            self, start_date, end_date, source_affiliate_id='0',
-            source_affiliate_manager_id='0', source_affiliate_tag_id='0',
-            site_offer_tag_id='0', event_id='0', event_type='all', **kwargs):
-
-        api_url = '{}://{}/api/3/reports.asmx/SourceAffiliateSummary'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['source_affiliate_id'] = source_affiliate_id
-        parameters['source_affiliate_manager_id'] = (
-            source_affiliate_manager_id)
-        parameters['source_affiliate_tag_id'] = source_affiliate_tag_id
-        parameters['site_offer_tag_id'] = site_offer_tag_id
-        parameters['event_id'] = event_id
-        parameters['event_type'] = event_type
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def sub_id_summary(
-            self, start_date, end_date, source_affiliate_id, site_offer_id='0',
-            event_id='0', revenue_filter='conversions_and_events', **kwargs):
-
-        api_url = '{}://{}/api/1/reports.asmx/SubIDSummary'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['source_affiliate_id'] = source_affiliate_id
-        parameters['site_offer_id'] = site_offer_id
-        parameters['event_id'] = event_id
-        parameters['revenue_filter'] = revenue_filter
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-
-    def traffic_export(self, start_date, end_date, **kwargs):
-        api_url = '{}://{}/api/1/reports.asmx/TrafficExport'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-    #--------------------------------SIGNUP-----------------------------------#
-
-    def signup_advertiser(
-            self, company_name, address_street, address_city, address_state,
-            address_zip_code, address_country, first_name, last_name,
-            email_address, contact_phone_work, address_street2='', website='',
-            notes='', contact_title='', contact_phone_cell='',
-            contact_phone_fax='', contact_im_name='', contact_im_service=0,
-            ip_address=''):
-
-        api_url = '{}://{}/api/1/signup.asmx/Advertiser'.format(
-                self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['company_name'] = company_name
-        parameters['address_street'] = address_street
-        parameters['address_street2'] = address_street2
-        parameters['address_city'] = address_city
-        parameters['address_state'] = address_state
-        parameters['address_zip_code'] = address_zip_code
-        parameters['address_country'] = address_country
-        parameters['first_name'] = first_name
-        parameters['last_name'] = last_name
-        parameters['email_address'] = email_address
-        parameters['password'] = ''
-        parameters['website'] = website
-        parameters['notes'] = notes
-        parameters['contact_title'] = contact_title
-        parameters['contact_phone_work'] = contact_phone_work
-        parameters['contact_phone_cell'] = contact_phone_cell
-        parameters['contact_phone_fax'] = contact_phone_fax
-        parameters['contact_im_name'] = contact_im_name
-        parameters['contact_im_service'] = contact_im_service
-        parameters['ip_address'] = ip_address
-
-        return self._make_api_call(url=api_url, params=parameters)        
-
-
-    def signup_affiliate(
-            self, affiliate_name, account_status_id, payment_setting_id,
-            tax_class, ssn_tax_id, address_street, address_city, address_state,
-            address_zip_code, address_country, contact_first_name,
-            contact_last_name, contact_email_address, contact_phone_work,
-            contact_timezone, terms_and_conditions_agreed,
-            affiliate_tier_id='0', hide_offers='FALSE', website='',
-            vat_tax_required='FALSE', swift_iban='', payment_to='0',
-            payment_fee='-1', payment_min_threshold='-1', currency_id='0',
-            billing_cycle_id='3', payment_type_id='1', payment_type_info='',
-            address_street2='', contact_middle_name='', contact_title='',
-            contact_phone_cell='', contact_phone_fax='', contact_im_service='',
-            contact_im_name='', contact_language_id='0', media_type_ids='',
-            price_format_ids='', vertical_category_ids='', country_codes='',
-            tag_ids='', date_added=_datetime.now(), signup_ip_address='',
-            referral_affiliate_id='0', referral_notes='', notes=''):
-
-        api_url = '{}://{}/api/4/signup.asmx/Affiliate'.format(
-                self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_name'] = affiliate_name
-        parameters['account_status_id'] = account_status_id
-        parameters['affiliate_tier_id'] = affiliate_tier_id
-        parameters['hide_offers'] = hide_offers
-        parameters['website'] = website
-        parameters['tax_class'] = tax_class
-        parameters['ssn_tax_id'] = ssn_tax_id
-        parameters['vat_tax_required'] = vat_tax_required
-        parameters['swift_iban'] = swift_iban
-        parameters['payment_to'] = payment_to
-        parameters['payment_fee'] = payment_fee
-        parameters['payment_min_threshold'] = payment_min_threshold
-        parameters['currency_id'] = currency_id
-        parameters['payment_setting_id'] = payment_setting_id
-        parameters['billing_cycle_id'] = billing_cycle_id
-        parameters['payment_type_id'] = payment_type_id
-        parameters['payment_type_info'] = payment_type_info
-        parameters['address_street'] = address_street
-        parameters['address_street2'] = address_street2
-        parameters['address_city'] = address_city
-        parameters['address_state'] = address_state
-        parameters['address_zip_code'] = address_zip_code
-        parameters['address_country'] = address_country
-        parameters['contact_first_name'] = contact_first_name
-        parameters['contact_middle_name'] = contact_middle_name
-        parameters['contact_last_name'] = contact_last_name
-        parameters['contact_email_address'] = contact_email_address
-        parameters['contact_password'] = ''
-        parameters['contact_title'] = contact_title
-        parameters['contact_phone_work'] = contact_phone_work
-        parameters['contact_phone_cell'] = contact_phone_cell
-        parameters['contact_phone_fax'] = contact_phone_fax
-        parameters['contact_im_service'] = contact_im_service
-        parameters['contact_im_name'] = contact_im_name
-        parameters['contact_timezone'] = contact_timezone
-        parameters['contact_language_id'] = contact_language_id
-        parameters['media_type_ids'] = media_type_ids
-        parameters['price_format_ids'] = price_format_ids
-        parameters['vertical_category_ids'] = vertical_category_ids
-        parameters['country_codes'] = country_codes
-        parameters['tag_ids'] = tag_ids
-        parameters['date_added'] = str(date_added)
-        parameters['signup_ip_address'] = signup_ip_address
-        parameters['referral_affiliate_id'] = referral_affiliate_id
-        parameters['referral_notes'] = referral_notes
-        parameters['terms_and_conditions_agreed'] = terms_and_conditions_agreed
-        parameters['notes'] = notes
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-    #---------------------------------TRACK-----------------------------------#
-
-    @_must_have_one(['conversion_id', 'request_session_id', 'transaction_id'])
-    @_if_one_then_all(('payout', 'add_to_existing_payout'))
-    @_if_one_then_all(('received', 'received_option'))
-    def update_conversion(
-            self, offer_id, conversion_id='0', request_session_id='0',
-            transaction_id='', payout='', add_to_existing_payout='TRUE',
-            received='', received_option='no_change',
-            disposition_type='no_change', disposition_id='0',
-            update_revshare_payout='FALSE',
-            effective_date_option='conversion_date', custom_date='',
-            note_to_append='', disallow_on_billing_status='ignore', **kwargs):
-
-        if (effective_date_option == 'custom' and
-                custom_date == ''):
-            raise Exception('Missing argument: custom_date')
-
-        api_url = '{}://{}/api/4/track.asmx/UpdateConversion'.format(
-            self.protocol, self.admin_domain) 
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['offer_id'] = offer_id
-        parameters['conversion_id'] = conversion_id
-        parameters['request_session_id'] = request_session_id
-        parameters['transaction_id'] = transaction_id
-        parameters['payout'] = 0 if payout == '' else payout
-        parameters['add_to_existing_payout'] = add_to_existing_payout
-        parameters['received'] = 0 if received == '' else received
-        parameters['received_option'] = received_option
-        parameters['disposition_type'] = disposition_type
-        parameters['disposition_id'] = disposition_id
-        parameters['update_revshare_payout'] = update_revshare_payout
-        parameters['effective_date_option'] = effective_date_option
-        parameters['custom_date'] = ('2067-10-20 13:31:59.7' if
-            custom_date == '' else str(custom_date))
-        parameters['note_to_append'] = note_to_append
-        parameters['disallow_on_billing_status'] = disallow_on_billing_status
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-    #--------------------------------SPECIAL----------------------------------#
-
-    def get_advertiser_ids(self):
-        """Returns a list of all Advertiser IDs"""
-
-        advertiser_export = self.get_advertisers(force_json=True)
-        advertiser_ids = [_['advertiser_id'] for _ in advertiser_export]
-        return advertiser_ids
-
-
-    def get_affiliate_ids(self):
-        """Returns a list of all Affiliate IDs"""
-
-        CHUNK_SIZE = 2500
-        test_export = self.export_affiliates(row_limit=1, force_json=True)
-        affiliate_count = test_export['row_count']
-        if affiliate_count % CHUNK_SIZE == 0:
-            api_call_count = affiliate_count // CHUNK_SIZE
-        else:
-            api_call_count = affiliate_count // CHUNK_SIZE + 1
-        all_affiliate_ids = []
-        start_row = 1
-        for i in range(api_call_count):
-            affiliate_export = self.export_affiliates(
-                start_at_row=start_row, row_limit=CHUNK_SIZE, force_json=True)
-            affiliates = affiliate_export['affiliates']
-            affiliate_ids = [_['affiliate_id'] for _ in affiliates]
-            all_affiliate_ids += affiliate_ids
-            start_row += CHUNK_SIZE
-        return all_affiliate_ids
-
-
-    def get_offer_ids(self, advertiser_id='0'):
-        """Returns a list of Offer IDs"""
-
-        offer_export = self.export_offers(
-            advertiser_id=advertiser_id, force_json=True)
-        all_offers = offer_export['offers']
-        offer_ids = [_['offer_id'] for _ in all_offers]
-        return offer_ids
 
+_add_endpoints(AdminAPI, _ENDPOINTS)
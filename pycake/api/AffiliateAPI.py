@@ -1,842 +1,304 @@
-import requests as _requests
-import json as _json
-from collections import OrderedDict as _OrderedDict
-from datetime import datetime as _datetime
-from .function_validation import _must_have_one, _if_one_then_all
+from .endpoints import _add_endpoints, _endpoint
+from .function_validation import _must_have_one
 from .ResponseFormat import ResponseFormat
+from .CakeAPI import CakeAPI
 
-
-class AffiliateAPI(object):
-    
-    def __init__(
-            self, admin_domain, affiliate_id, api_key,
-            response_format=ResponseFormat.JSON, use_https=True):
-        
-        self.admin_domain = admin_domain
-        self.affiliate_id = affiliate_id
-        self.api_key = api_key
-        self.response_format = response_format
-        self.protocol = 'https' if use_https else 'http'
-
-    
-    def _make_api_call(self, url, params):
-        if self.response_format.upper() == 'JSON':
-            request = _requests.post(url, json=params, stream=True)
-            raw_response = request.text
-            try:
-                json_response = _json.loads(raw_response)
-                json_data = json_response['d']
-                return json_data
-            except:
-                request = _requests.post(url, data=params, stream=True)
-                raw_response = request.text
-                return raw_response    
-        else:
-            request = _requests.post(url, data=params, stream=True)
-            response = request.text
-            return response
-
+_ENDPOINTS = [
     #---------------------------------ACCOUNT---------------------------------#
 
-    def change_account_info(
-            self, contact_id, contact_type_id='0', first_name='', last_name='',
-            email_address='', title='', phone_work='', phone_cell='',
-            phone_fax='', im_service='', im_name='', tax_class='',
-            ssn_tax_id='', payment_to='', website='', address_street_1='',
-            address_street_2='', address_city='', address_state='',
-            address_country='', address_zip_code='', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/ChangeAccountInfo'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['contact_id'] = contact_id
-        parameters['contact_type_id'] = contact_type_id
-        parameters['first_name'] = first_name
-        parameters['last_name'] = last_name
-        parameters['email_address'] = email_address
-        parameters['title'] = title
-        parameters['phone_work'] = phone_work
-        parameters['phone_cell'] = phone_cell
-        parameters['phone_fax'] = phone_fax
-        parameters['im_service'] = im_service
-        parameters['im_name'] = im_name
-        parameters['tax_class'] = tax_class
-        parameters['ssn_tax_id'] = ssn_tax_id
-        parameters['payment_to'] = payment_to
-        parameters['website'] = website
-        parameters['address_street_1'] = address_street_1
-        parameters['address_street_2'] = address_street_2
-        parameters['address_city'] = address_city
-        parameters['address_state'] = address_state
-        parameters['address_country'] = address_country
-        parameters['address_zip_code'] = address_zip_code
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def change_language(
-            self, contact_id, new_language_id, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/ChangeLanguage'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['contact_id'] = contact_id
-        parameters['new_language_id'] = new_language_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def change_media_types(
-            self, contact_id, new_media_type_ids, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/ChangeMediaTypes'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['contact_id'] = contact_id
-        parameters['new_media_type_ids'] = new_media_type_ids
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def change_price_formats(
-            self, contact_id, new_price_format_ids, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/ChangePriceFormats'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['contact_id'] = contact_id
-        parameters['new_price_format_ids'] = new_price_format_ids
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def change_vertical_categories(
-            self, contact_id, new_vertical_category_ids, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/ChangeVertical'
-            'Categories'.format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['contact_id'] = contact_id
-        parameters['new_vertical_category_ids'] = new_vertical_category_ids
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_account_info(self, contact_id, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/GetAccountInfo'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['contact_id'] = contact_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_account_manager(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/GetAccountManager'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_contact_types(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/GetContactTypes'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_countries(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/GetCountries'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_languages(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/GetLanguages'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_media_types(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/GetMediaTypes'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_payment_to_types(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/GetPaymentToTypes'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_price_formats(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/GetPriceFormats'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_tax_classes(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/GetTaxClasses'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_us_states(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/GetUSStates'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def reset_password(self, contact_id, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/account.asmx/ResetPassword'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['contact_id'] = contact_id
-
-        return self._make_api_call(url=api_url, params=parameters)
+    _endpoint(
+        'change_account_info', 'account', 2, 'ChangeAccountInfo',
+        "contact_id, contact_type_id='0', first_name='', last_name='', "
+        "email_address='', title='', phone_work='', phone_cell='', "
+        "phone_fax='', im_service='', im_name='', tax_class='', "
+        "ssn_tax_id='', payment_to='', website='', address_street_1='', "
+        "address_street_2='', address_city='', address_state='', "
+        "address_country='', address_zip_code='', **kwargs",
+        ['api_key', 'affiliate_id', 'contact_id', 'contact_type_id',
+         'first_name', 'last_name', 'email_address', 'title', 'phone_work',
+         'phone_cell', 'phone_fax', 'im_service', 'im_name', 'tax_class',
+         'ssn_tax_id', 'payment_to', 'website', 'address_street_1',
+         'address_street_2', 'address_city', 'address_state',
+         'address_country', 'address_zip_code']),
+    _endpoint(
+        'change_language', 'account', 2, 'ChangeLanguage',
+        "contact_id, new_language_id, **kwargs",
+        ['api_key', 'affiliate_id', 'contact_id', 'new_language_id']),
+    _endpoint(
+        'change_media_types', 'account', 2, 'ChangeMediaTypes',
+        "contact_id, new_media_type_ids, **kwargs",
+        ['api_key', 'affiliate_id', 'contact_id', 'new_media_type_ids']),
+    _endpoint(
+        'change_price_formats', 'account', 2, 'ChangePriceFormats',
+        "contact_id, new_price_format_ids, **kwargs",
+        ['api_key', 'affiliate_id', 'contact_id', 'new_price_format_ids']),
+    _endpoint(
+        'change_vertical_categories', 'account', 2, 'ChangeVerticalCategories',
+        "contact_id, new_vertical_category_ids, **kwargs",
+        ['api_key', 'affiliate_id', 'contact_id',
+         'new_vertical_category_ids']),
+    _endpoint(
+        'get_account_info', 'account', 2, 'GetAccountInfo',
+        "contact_id, **kwargs",
+        ['api_key', 'affiliate_id', 'contact_id']),
+    _endpoint(
+        'get_account_manager', 'account', 2, 'GetAccountManager',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_contact_types', 'account', 2, 'GetContactTypes',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_countries', 'account', 2, 'GetCountries',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_languages', 'account', 2, 'GetLanguages',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_media_types', 'account', 2, 'GetMediaTypes',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_payment_to_types', 'account', 2, 'GetPaymentToTypes',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_price_formats', 'account', 2, 'GetPriceFormats',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_tax_classes', 'account', 2, 'GetTaxClasses',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_us_states', 'account', 2, 'GetUSStates',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'reset_password', 'account', 2, 'ResetPassword',
+        "contact_id, **kwargs",
+        ['api_key', 'affiliate_id', 'contact_id']),
 
     #---------------------------------OFFERS----------------------------------#
 
-    def add_link_creative(
-            self, campaign_id, creative_name, offer_link, description='',
-            **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/AddLinkCreative'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['campaign_id'] = campaign_id
-        parameters['creative_name'] = creative_name
-        parameters['offer_link'] = offer_link
-        parameters['description'] = description
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def apply_for_offer(
-            self, offer_contract_id, media_type_id, agreed_to_terms, notes='',
-            agreed_from_ip_address='', **kwargs):
-
-        api_url = '{}://{}/affiliates/api/3/offers.asmx/ApplyForOffer'.format(
-            self.protocol, self.admin_domain) 
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['offer_contract_id'] = offer_contract_id
-        parameters['media_type_id'] = media_type_id
-        parameters['notes'] = notes
-        parameters['agreed_to_terms'] = agreed_to_terms
-        parameters['agreed_from_ip_address'] = agreed_from_ip_address
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def creative_feed(self, updates_since, export_feed_id, **kwargs):
-
-        api_url = '{}://{}/affiliates/api/2/offers.asmx/CreativeFeed'.format(
-            self.protocol, self.admin_domain) 
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['export_feed_id'] = export_feed_id
-        parameters['updates_since'] = updates_since
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_campaign(self, campaign_id, **kwargs):
-
-        api_url = '{}://{}/affiliates/api/2/offers.asmx/GetCampaign'.format(
-            self.protocol, self.admin_domain) 
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['campaign_id'] = campaign_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_creative_code(self, campaign_id, creative_id, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetCreativeCode'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['campaign_id'] = campaign_id
-        parameters['creative_id'] = creative_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_creative_feeds(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetCreativeFeeds'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_creative_types(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetCreativeTypes'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_featured_offer(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetFeaturedOffer'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_media_type_categories(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetMediaTypeCategories'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_offer_statuses(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetOfferStatuses'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_pixel_tokens(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetPixelTokens'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_product_feeds(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetProductFeeds'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_sub_affiliates(self, start_at_row='0', row_limit='0', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetSubAffiliates'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_suppression_list(self, offer_id, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetSuppressionList'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['offer_id'] = offer_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_tags(self, **kwargs):
-
-        api_url = '{}://{}/affiliates/api/2/offers.asmx/GetTags'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def get_vertical_categories(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetVerticalCategories'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)  
-
-
-    def get_verticals(self, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/GetVerticals'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-
-        return self._make_api_call(url=api_url, params=parameters)   
-
-
-    def offer_feed(
-            self, campaign_name='', media_type_category_id='0',
-            vertical_category_id='0', country_code='', vertical_id='0',
-            offer_status_id='0', tag_id='0', start_at_row='0', row_limit='0',
-            **kwargs):
-        
-        api_url = '{}://{}/affiliates/api/5/offers.asmx/OfferFeed'.format(
-            self.protocol, self.admin_domain) 
-        
-        parameters = _OrderedDict()
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['api_key'] = self.api_key
-        parameters['campaign_name'] = campaign_name
-        parameters['media_type_category_id'] = media_type_category_id
-        parameters['vertical_category_id'] = vertical_category_id
-        parameters['country_code'] = country_code
-        parameters['vertical_id'] = vertical_id
-        parameters['offer_status_id'] = offer_status_id
-        parameters['tag_id'] = tag_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def send_creative_pack(
-        self, campaign_id, creative_id='0', contact_id='0', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/offers.asmx/SendCreativePack'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['campaign_id'] = campaign_id
-        parameters['creative_id'] = creative_id
-        parameters['contact_id'] = contact_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def set_pixel(self, campaign_id, pixel_html, **kwargs):
-
-        api_url = '{}://{}/affiliates/api/2/offers.asmx/SetPixel'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['campaign_id'] = campaign_id
-        parameters['pixel_html'] = pixel_html
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def set_postback_url(self, campaign_id, postback_url, **kwargs):
-
-        api_url = '{}://{}/affiliates/api/2/offers.asmx/SetPostbackURL'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['campaign_id'] = campaign_id
-        parameters['postback_url'] = postback_url
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def set_test_link(self, campaign_id, test_link, **kwargs):
-
-        api_url = '{}://{}/affiliates/api/2/offers.asmx/SetTestLink'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['campaign_id'] = campaign_id
-        parameters['test_link'] = test_link
-
-        return self._make_api_call(url=api_url, params=parameters)
+    _endpoint(
+        'add_link_creative', 'offers', 2, 'AddLinkCreative',
+        "campaign_id, creative_name, offer_link, description='', **kwargs",
+        ['api_key', 'affiliate_id', 'campaign_id', 'creative_name',
+         'offer_link', 'description']),
+    _endpoint(
+        'apply_for_offer', 'offers', 3, 'ApplyForOffer',
+        "offer_contract_id, media_type_id, agreed_to_terms, notes='', "
+        "agreed_from_ip_address='', **kwargs",
+        ['api_key', 'affiliate_id', 'offer_contract_id', 'media_type_id',
+         'notes', 'agreed_to_terms', 'agreed_from_ip_address']),
+    _endpoint(
+        'creative_feed', 'offers', 2, 'CreativeFeed',
+        "updates_since, export_feed_id, **kwargs",
+        ['api_key', 'affiliate_id', 'export_feed_id', 'updates_since']),
+    _endpoint(
+        'get_campaign', 'offers', 2, 'GetCampaign',
+        "campaign_id, **kwargs",
+        ['api_key', 'affiliate_id', 'campaign_id']),
+    _endpoint(
+        'get_creative_code', 'offers', 2, 'GetCreativeCode',
+        "campaign_id, creative_id, **kwargs",
+        ['api_key', 'affiliate_id', 'campaign_id', 'creative_id']),
+    _endpoint(
+        'get_creative_feeds', 'offers', 2, 'GetCreativeFeeds',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_creative_types', 'offers', 2, 'GetCreativeTypes',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_featured_offer', 'offers', 2, 'GetFeaturedOffer',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_media_type_categories', 'offers', 2, 'GetMediaTypeCategories',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_offer_statuses', 'offers', 2, 'GetOfferStatuses',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_pixel_tokens', 'offers', 2, 'GetPixelTokens',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_product_feeds', 'offers', 2, 'GetProductFeeds',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_sub_affiliates', 'offers', 2, 'GetSubAffiliates',
+        "start_at_row='0', row_limit='0', **kwargs",
+        ['api_key', 'affiliate_id', 'start_at_row', 'row_limit'],
+        force_json=True),
+    _endpoint(
+        'get_suppression_list', 'offers', 2, 'GetSuppressionList',
+        "offer_id, **kwargs",
+        ['api_key', 'affiliate_id', 'offer_id']),
+    _endpoint(
+        'get_tags', 'offers', 2, 'GetTags',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_vertical_categories', 'offers', 2, 'GetVerticalCategories',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'get_verticals', 'offers', 2, 'GetVerticals',
+        "**kwargs",
+        ['api_key', 'affiliate_id']),
+    _endpoint(
+        'offer_feed', 'offers', 5, 'OfferFeed',
+        "campaign_name='', media_type_category_id='0', "
+        "vertical_category_id='0', country_code='', vertical_id='0', "
+        "offer_status_id='0', tag_id='0', start_at_row='0', row_limit='0', "
+        "**kwargs",
+        ['affiliate_id', 'api_key', 'campaign_name', 'media_type_category_id',
+         'vertical_category_id', 'country_code', 'vertical_id',
+         'offer_status_id', 'tag_id', 'start_at_row', 'row_limit'],
+        force_json=True),
+    _endpoint(
+        'send_creative_pack', 'offers', 2, 'SendCreativePack',
+        "campaign_id, creative_id='0', contact_id='0', **kwargs",
+        ['api_key', 'affiliate_id', 'campaign_id', 'creative_id',
+         'contact_id']),
+    _endpoint(
+        'set_pixel', 'offers', 2, 'SetPixel',
+        "campaign_id, pixel_html, **kwargs",
+        ['api_key', 'affiliate_id', 'campaign_id', 'pixel_html']),
+    _endpoint(
+        'set_postback_url', 'offers', 2, 'SetPostbackURL',
+        "campaign_id, postback_url, **kwargs",
+        ['api_key', 'affiliate_id', 'campaign_id', 'postback_url']),
+    _endpoint(
+        'set_test_link', 'offers', 2, 'SetTestLink',
+        "campaign_id, test_link, **kwargs",
+        ['api_key', 'affiliate_id', 'campaign_id', 'test_link']),
 
     #---------------------------------REPORTS---------------------------------#
 
-    def bills(self, start_at_row='0', row_limit='0', **kwargs):
-        api_url = '{}://{}/affiliates/api/3/reports.asmx/Bills'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def campaign_summary(
-            self, start_date, end_date, sub_affiliate='', event_type='all',
-            start_at_row='0', row_limit='0', sort_field='site_offer_id',
-            sort_descending='FALSE', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/6/reports.asmx/CampaignSummary'
-            .format(self.protocol, self.admin_domain))
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['sub_affiliate'] = sub_affiliate
-        parameters['event_type'] = event_type
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def clicks(
-            self, start_date, end_date, offer_id='0', campaign_id='0', 
-            include_duplicates='FALSE', start_at_row='0', row_limit='0',
+    _endpoint(
+        'bills', 'reports', 3, 'Bills',
+        "start_at_row='0', row_limit='0', **kwargs",
+        ['api_key', 'affiliate_id', 'start_at_row', 'row_limit'],
+        force_json=True),
+    _endpoint(
+        'campaign_summary', 'reports', 6, 'CampaignSummary',
+        "start_date, end_date, sub_affiliate='', event_type='all', "
+        "start_at_row='0', row_limit='0', sort_field='site_offer_id', "
+        "sort_descending='FALSE', **kwargs",
+        ['api_key', 'affiliate_id', ('start_date', str), ('end_date', str),
+         'sub_affiliate', 'event_type', 'start_at_row', 'row_limit',
+         'sort_field', 'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'clicks', 'reports', 10, 'Clicks',
+        "start_date, end_date, offer_id='0', campaign_id='0', "
+        "include_duplicates='FALSE', start_at_row='0', row_limit='0', "
+        "**kwargs",
+        ['api_key', 'affiliate_id', ('start_date', str), ('end_date', str),
+         'offer_id', 'campaign_id', 'include_duplicates', 'start_at_row',
+         'row_limit'],
+        force_json=True),
+    _endpoint(
+        'daily_summary', 'reports', 3, 'DailySummary',
+        "start_date, end_date, site_offer_id='0', **kwargs",
+        ['api_key', 'affiliate_id', ('start_date', str), ('end_date', str),
+         'site_offer_id']),
+    _endpoint(
+        'events_conversions', 'reports', 9, 'EventConversions',
+        "start_date, end_date, currency_id, site_offer_id='0', "
+        "disposition_type='', event_type='all', exclude_bot_traffic='FALSE', "
+        "start_at_row='0', row_limit='0', **kwargs",
+        ['api_key', 'affiliate_id', ('start_date', str), ('end_date', str),
+         'site_offer_id', 'currency_id', 'disposition_type', 'event_type',
+         'exclude_bot_traffic', 'start_at_row', 'row_limit'],
+        force_json=True),
+    _endpoint(
+        'hourly_summary', 'reports', 3, 'HourlySummary',
+        "start_date, end_date, site_offer_id='0', **kwargs",
+        ['api_key', 'affiliate_id', ('start_date', str), ('end_date', str),
+         'site_offer_id']),
+    _endpoint(
+        'network_news', 'reports', 2, 'NetworkNews',
+        "row_limit='0', **kwargs",
+        ['api_key', 'affiliate_id', 'row_limit']),
+    _endpoint(
+        'offer_compliance', 'reports', 3, 'OfferCompliance',
+        "start_at_row='0', row_limit='0', **kwargs",
+        ['api_key', 'affiliate_id', 'start_at_row', 'row_limit'],
+        force_json=True),
+    _endpoint(
+        'order_detail_changes', 'reports', 2, 'OrderDetailChanges',
+        "changes_since, include_new_conversions='FALSE', start_at_row='0', "
+        "row_limit='0', sort_field='conversion_id', sort_descending='FALSE', "
+        "**kwargs",
+        ['api_key', 'affiliate_id', ('changes_since', str),
+         'include_new_conversions', 'start_at_row', 'row_limit', 'sort_field',
+         'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'order_details', 'reports', 2, 'OrderDetails',
+        "start_date, end_date, conversion_id='0', order_id='', "
+        "start_at_row='0', row_limit='0', sort_field='conversion_id', "
+        "sort_descending='FALSE', **kwargs",
+        ['api_key', 'affiliate_id', ('start_date', str), ('end_date', str),
+         'conversion_id', 'order_id', 'start_at_row', 'row_limit',
+         'sort_field', 'sort_descending'],
+        force_json=True,
+        checks=[_must_have_one(['conversion_id', 'order_id'])]),
+    _endpoint(
+        'performance_summary', 'reports', 2, 'PerformanceSummary',
+        "date, **kwargs",
+        ['api_key', 'affiliate_id', ('date', str)]),
+    _endpoint(
+        'referral', 'reports', 2, 'Referral',
+        "start_date, end_date, over_minimum, start_at_row='0', row_limit='0', "
+        "sort_field='affiliate_id', sort_descending='FALSE', **kwargs",
+        ['api_key', 'affiliate_id', ('start_date', str), ('end_date', str),
+         'over_minimum', 'start_at_row', 'row_limit', 'sort_field',
+         'sort_descending'],
+        force_json=True),
+    _endpoint(
+        'sub_affiliate_summary', 'reports', 4, 'SubAffiliateSummary',
+        "start_date, end_date, site_offer_id='0', start_at_row='0', "
+        "row_limit='0', **kwargs",
+        ['api_key', 'affiliate_id', ('start_date', str), ('end_date', str),
+         'site_offer_id', 'start_at_row', 'row_limit'],
+        force_json=True),
+    _endpoint(
+        'top_offer_summary', 'reports', 3, 'TopOfferSummary',
+        "start_date, end_date, vertical_id='0', start_at_row='0', "
+        "row_limit='0', **kwargs",
+        ['api_key', 'affiliate_id', ('start_date', str), ('end_date', str),
+         'vertical_id', 'start_at_row', 'row_limit'],
+        force_json=True),
+]
+
+
+class AffiliateAPI(CakeAPI):
+
+    _API_ROOT = 'affiliates/api'
+    
+    def __init__(
+            self, admin_domain, affiliate_id, api_key,
+            response_format=ResponseFormat.JSON, use_https=True,
             **kwargs):
         
-        api_url = '{}://{}/affiliates/api/10/reports.asmx/Clicks'.format(
-            self.protocol, self.admin_domain)
-        
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['offer_id'] = offer_id
-        parameters['campaign_id'] = campaign_id
-        parameters['include_duplicates'] = include_duplicates
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def daily_summary(self, start_date, end_date, site_offer_id='0', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/3/reports.asmx/DailySummary'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['site_offer_id'] = site_offer_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def events_conversions(
-            self, start_date, end_date, currency_id, site_offer_id='0',
-            disposition_type='', event_type='all', exclude_bot_traffic='FALSE',
-            start_at_row='0', row_limit='0', **kwargs):
-        
-        api_url = ('{}://{}/affiliates/api/9/reports.asmx/EventConversions'
-            .format(self.protocol, self.admin_domain))
-        
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['site_offer_id'] = site_offer_id
-        parameters['currency_id'] = currency_id
-        parameters['disposition_type'] = disposition_type
-        parameters['event_type'] = event_type
-        parameters['exclude_bot_traffic'] = exclude_bot_traffic
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def hourly_summary(self, start_date, end_date, site_offer_id='0', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/3/reports.asmx/HourlySummary'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['site_offer_id'] = site_offer_id
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def network_news(self, row_limit='0', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/reports.asmx/NetworkNews'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['row_limit'] = row_limit
-
-
-    def offer_compliance(self, start_at_row='0', row_limit='0', **kwargs):
-        api_url = ('{}://{}/affiliates/api/3/reports.asmx/OfferCompliance'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def order_detail_changes(
-            self, changes_since, include_new_conversions='FALSE',
-            start_at_row='0', row_limit='0', sort_field='conversion_id',
-            sort_descending='FALSE', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/reports.asmx/OrderDetailChanges'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['changes_since'] = str(changes_since)
-        parameters['include_new_conversions'] = include_new_conversions
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    @_must_have_one(['conversion_id', 'order_id'])
-    def order_details(
-            self, start_date, end_date, conversion_id='0', order_id='',
-            start_at_row='0', row_limit='0', sort_field='conversion_id',
-            sort_descending='FALSE', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/reports.asmx/OrderDetails'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['conversion_id'] = conversion_id
-        parameters['order_id'] = order_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def performance_summary(self, date, **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/2/reports.asmx/PerformanceSummary'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['date'] = str(date)
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def referral(
-            self, start_date, end_date, over_minimum, start_at_row='0',
-            row_limit='0', sort_field='affiliate_id', sort_descending='FALSE',
-            **kwargs):
-
-        api_url = '{}://{}/affiliates/api/2/reports.asmx/Referral'.format(
-            self.protocol, self.admin_domain)
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['over_minimum'] = over_minimum
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-        parameters['sort_field'] = sort_field
-        parameters['sort_descending'] = sort_descending
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def sub_affiliate_summary(
-            self, start_date, end_date, site_offer_id='0', start_at_row='0',
-            row_limit='0', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/4/reports.asmx/SubAffiliateSummary'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['site_offer_id'] = site_offer_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-    def top_offer_summary(
-            self, start_date, end_date, vertical_id='0', start_at_row='0',
-            row_limit='0', **kwargs):
-
-        api_url = ('{}://{}/affiliates/api/3/reports.asmx/TopOfferSummary'
-            .format(self.protocol, self.admin_domain))
-
-        parameters = _OrderedDict()
-        parameters['api_key'] = self.api_key
-        parameters['affiliate_id'] = self.affiliate_id
-        parameters['start_date'] = str(start_date)
-        parameters['end_date'] = str(end_date)
-        parameters['vertical_id'] = vertical_id
-        parameters['start_at_row'] = start_at_row
-        parameters['row_limit'] = row_limit
-
-        return self._make_api_call(url=api_url, params=parameters)
-
-
-
-
-
-
+        super(AffiliateAPI, self).__init__(
+            admin_domain, response_format=response_format,
+            use_https=use_https, **kwargs)
+        self.affiliate_id = affiliate_id
+        self.api_key = api_key
 
 
+_add_endpoints(AffiliateAPI, _ENDPOINTS)
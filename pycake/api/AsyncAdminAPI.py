@@ -0,0 +1,177 @@
+import asyncio as _asyncio
+import json as _json
+from array import array as _array
+from collections import OrderedDict as _OrderedDict
+from functools import wraps as _wraps
+from .AdminAPI import AdminAPI, _BULK_EDITS
+from .AsyncCakeAPI import AsyncCakeAPI
+from .pagination import _rows_of
+
+
+class AsyncAdminAPI(AdminAPI, AsyncCakeAPI):
+    """AdminAPI whose functions are coroutines, e.g.
+    await ckadmin.clicks(start_date, end_date)"""
+
+    #--------------------------------API_KEY----------------------------------#
+
+    @_wraps(AdminAPI.set_api_key)
+    async def set_api_key(self, username, password, **kwargs):
+        api_url = '{}://{}/api/1/get.asmx/GetAPIKey'.format(self.protocol,
+            self.admin_domain)
+
+        parameters = _OrderedDict()
+        parameters['username'] = username
+        parameters['password'] = password
+
+        try:
+            request = await self._post(api_url, json=parameters)
+            response = _json.loads(request.text)
+            if response['d'] == '':
+                self.api_key = None
+            else:
+                self.api_key = response['d']
+        except:
+            self.api_key = None
+
+    #--------------------------------ADDEDIT----------------------------------#
+
+    async def _get_exception_kwargs(self, campaign_id, kwargs):
+        if 'exception_type' not in kwargs:
+            campaign_export = await self.export_campaigns(
+                campaign_id=campaign_id, force_json=True)
+            kwargs['exception_type'] = self._exception_type_from_export(
+                campaign_export)
+        return kwargs
+
+
+    @_wraps(AdminAPI.add_campaign_creative_exception)
+    async def add_campaign_creative_exception(
+            self, campaign_id, creative_id, **kwargs):
+
+        kwargs = await self._get_exception_kwargs(campaign_id, kwargs)
+        return await AdminAPI.add_campaign_creative_exception(
+            self, campaign_id, creative_id, **kwargs)
+
+
+    @_wraps(AdminAPI.add_campaign_subid_exception)
+    async def add_campaign_subid_exception(self, campaign_id, sub_id, **kwargs):
+        kwargs = await self._get_exception_kwargs(campaign_id, kwargs)
+        return await AdminAPI.add_campaign_subid_exception(
+            self, campaign_id, sub_id, **kwargs)
+
+
+    @_wraps(AdminAPI.edit_advertiser)
+    async def edit_advertiser(self, advertiser_id, **kwargs):
+        if 'current_advertiser' not in kwargs:
+            kwargs['current_advertiser'] = self._first_exported(
+                await self.export_advertisers(
+                    advertiser_id=advertiser_id, force_json=True),
+                'advertisers')
+        return await AdminAPI.edit_advertiser(self, advertiser_id, **kwargs)
+
+
+    @_wraps(AdminAPI.edit_affiliate)
+    async def edit_affiliate(self, affiliate_id, **kwargs):
+        if 'current_affiliate' not in kwargs:
+            kwargs['current_affiliate'] = self._first_exported(
+                await self.export_affiliates(
+                    affiliate_id=affiliate_id, force_json=True),
+                'affiliates')
+        return await AdminAPI.edit_affiliate(self, affiliate_id, **kwargs)
+
+
+    @_wraps(AdminAPI.edit_campaign)
+    async def edit_campaign(self, campaign_id, **kwargs):
+        self._validate_campaign_id(campaign_id)
+        if 'current_campaign' not in kwargs:
+            kwargs['current_campaign'] = self._first_exported(
+                await self.export_campaigns(
+                    campaign_id=campaign_id, force_json=True),
+                'campaigns')
+        return await AdminAPI.edit_campaign(self, campaign_id, **kwargs)
+
+
+    @_wraps(AdminAPI.remove_campaign_creative_exception)
+    async def remove_campaign_creative_exception(
+            self, campaign_id, creative_id, **kwargs):
+
+        kwargs = await self._get_exception_kwargs(campaign_id, kwargs)
+        return await AdminAPI.remove_campaign_creative_exception(
+            self, campaign_id, creative_id, **kwargs)
+
+
+    @_wraps(AdminAPI.remove_campaign_subid_exception)
+    async def remove_campaign_subid_exception(
+            self, campaign_id, sub_id, **kwargs):
+
+        kwargs = await self._get_exception_kwargs(campaign_id, kwargs)
+        return await AdminAPI.remove_campaign_subid_exception(
+            self, campaign_id, sub_id, **kwargs)
+
+    #--------------------------------SPECIAL----------------------------------#
+
+    async def get_advertiser_ids(self):
+        """Returns a list of all Advertiser IDs"""
+
+        advertiser_export = await self.get_advertisers(force_json=True)
+        advertiser_ids = [_['advertiser_id'] for _ in advertiser_export]
+        return advertiser_ids
+
+
+    async def _get_ids(self, function, id_field, window, cache_ttl, **kwargs):
+        key = (function.__name__, tuple(sorted(kwargs.items())))
+        ids = self._cached_ids(key, cache_ttl)
+        if ids is None:
+            ids = _array('l')
+            async for row in self.iter_rows(
+                    function, page_size=2500, window=window, **kwargs):
+                ids.append(row[id_field])
+            self._cache_ids(key, ids, cache_ttl)
+        return ids
+
+
+    async def get_offer_ids(self, advertiser_id='0'):
+        """Returns a list of Offer IDs"""
+
+        offer_export = await self.export_offers(
+            advertiser_id=advertiser_id, force_json=True)
+        all_offers = offer_export['offers']
+        offer_ids = [_['offer_id'] for _ in all_offers]
+        return offer_ids
+
+    #----------------------------------BULK-----------------------------------#
+
+    async def _prefetch_current(self, entity, entity_ids, page_size):
+        export = getattr(self, 'export_{}s'.format(entity))
+        export_kwargs = _BULK_EDITS[entity][1]
+        current = dict.fromkeys(str(_) for _ in entity_ids)
+        try:
+            async for page in self.iter_pages(
+                    export, page_size=page_size, **export_kwargs):
+                if self._keep_current(entity, current, _rows_of(page)):
+                    break
+        except Exception:
+            return None
+        return current
+
+
+    async def _bulk_edit(self, entity, edits, max_workers, page_size):
+        entity_ids, all_kwargs = self._split_bulk_edits(entity, edits)
+        if not entity_ids:
+            return self._bulk_results([], [])
+        current = await self._prefetch_current(entity, entity_ids, page_size)
+        edit = getattr(self, 'edit_{}'.format(entity))
+        semaphore = _asyncio.Semaphore(max_workers)
+
+        async def apply(entity_id, kwargs):
+            if current is not None:
+                kwargs['current_{}'.format(entity)] = current[str(entity_id)]
+            async with semaphore:
+                try:
+                    return self._edit_failure(await edit(entity_id, **kwargs))
+                except Exception as e:
+                    return str(e)
+
+        failures = await _asyncio.gather(*[apply(entity_id, kwargs)
+            for entity_id, kwargs in zip(entity_ids, all_kwargs)])
+        return self._bulk_results(entity_ids, failures)
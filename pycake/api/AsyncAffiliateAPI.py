@@ -0,0 +1,7 @@
+from .AffiliateAPI import AffiliateAPI
+from .AsyncCakeAPI import AsyncCakeAPI
+
+
+class AsyncAffiliateAPI(AffiliateAPI, AsyncCakeAPI):
+    """AffiliateAPI whose functions are coroutines, e.g.
+    await ckaff.offer_feed()"""
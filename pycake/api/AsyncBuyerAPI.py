@@ -0,0 +1,7 @@
+from .BuyerAPI import BuyerAPI
+from .AsyncCakeAPI import AsyncCakeAPI
+
+
+class AsyncBuyerAPI(BuyerAPI, AsyncCakeAPI):
+    """BuyerAPI whose functions are coroutines, e.g.
+    await ckbuyer.get_return_reasons()"""
@@ -0,0 +1,203 @@
+import asyncio as _asyncio
+import json as _json
+from collections import deque as _deque
+from .AsyncTransport import AsyncTransport
+from .CakeAPI import CakeAPI, _CONVERTED_FORMATS, _convert_rows
+from .CakeAPI import _is_read_endpoint, _rejects_json
+from .EncodingCache import EncodingCache
+from .pagination import _page_count, _page_start, _row_count, _rows_of
+from .sharding import _can_halve, _date_shards, _halve, _unique_rows
+
+
+class AsyncCakeAPI(CakeAPI):
+    """ Base class from which all Async API classes will inherit.
+
+    Every API function of an Async class returns a coroutine. At most
+    max_concurrency requests per object are in flight at once.
+    """
+
+    def __init__(
+            self, admin_domain, async_transport=None, max_concurrency=100,
+            **kwargs):
+
+        super(AsyncCakeAPI, self).__init__(admin_domain, **kwargs)
+        self.async_transport = (AsyncTransport.get_default() if
+            async_transport is None else async_transport)
+        self.max_concurrency = max_concurrency
+        self._semaphore = _asyncio.Semaphore(max_concurrency)
+
+
+    async def _make_api_call(self, url, params, force_json=False):
+        # responses are read whole, so the _STREAM formats behave like JSON
+        # and XML
+        response_format = ('JSON' if force_json else
+            self.response_format.upper().replace('_STREAM', ''))
+        if response_format in _CONVERTED_FORMATS:
+            return _convert_rows(
+                await self._send(url, params, 'JSON'), response_format)
+        if not self._shareable(url, response_format):
+            return await self._send(url, params, response_format)
+
+        key = self._call_key(url, params, response_format)
+        cached = self._cached(url, key)
+        if cached is not None:
+            return cached
+
+        async def fetch():
+            response = await self._send(url, params, response_format)
+            self._cache(url, key, response)
+            return response
+
+        if self.single_flight is None:
+            return await fetch()
+        return await self.single_flight.do_async(key, fetch)
+
+
+    async def _send(self, url, params, response_format):
+        async with self._semaphore:
+            if response_format == 'JSON':
+                encoding = self.encoding_cache.get(url)
+                if encoding == EncodingCache.FORM:
+                    return await self._post_form(url, params)
+                self.encoding_cache.count('json_requests')
+                request = await self._post(url, json=params)
+                if request.status_code == 200:
+                    try:
+                        json_data = _json.loads(request.text)['d']
+                    except (ValueError, KeyError):
+                        pass
+                    else:
+                        if encoding is None:
+                            self.encoding_cache.set(url, EncodingCache.JSON)
+                        return json_data
+                if encoding == EncodingCache.JSON:
+                    raise Exception('{} returned an invalid JSON response '
+                        '(HTTP {})'.format(url, request.status_code))
+                self.encoding_cache.count('fallbacks')
+                return await self._post_form(
+                    url, params, learn=_rejects_json(request))
+            else:
+                return await self._post_form(url, params)
+
+
+    async def _post(self, url, json=None, data=None):
+        async def send():
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(self._rate_limit_key())
+            return await self.async_transport.post(url, json=json, data=data)
+
+        return await self.retry_policy.call_async(
+            EncodingCache.endpoint_key(url), send,
+            retry=_is_read_endpoint(url),
+            exceptions=self.async_transport.retry_exceptions)
+
+
+    async def _post_form(self, url, params, learn=False):
+        self.encoding_cache.count('form_requests')
+        request = await self._post(url, data=params)
+        if learn and request.status_code == 200:
+            self.encoding_cache.set(url, EncodingCache.FORM)
+        return request.text
+
+
+    async def iter_pages(self, function, page_size=2500, window=4, **kwargs):
+        """Yields each page of a paginated API function in order, keeping up
+        to window page requests in flight"""
+
+        kwargs['force_json'] = True
+        first_page = await function(
+            start_at_row=_page_start(0, page_size), row_limit=page_size,
+            **kwargs)
+        page_count = _page_count(first_page, page_size)
+        yield first_page
+
+        pending = _deque()
+        next_page = 1
+        try:
+            while pending or next_page < page_count:
+                while next_page < page_count and len(pending) < window:
+                    pending.append(_asyncio.ensure_future(function(
+                        start_at_row=_page_start(next_page, page_size),
+                        row_limit=page_size, **kwargs)))
+                    next_page += 1
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+    async def iter_rows(self, function, page_size=2500, window=4, **kwargs):
+        """Yields each row of a paginated API function in order"""
+
+        async for page in self.iter_pages(
+                function, page_size=page_size, window=window, **kwargs):
+            for row in _rows_of(page):
+                yield row
+
+
+    async def iter_sharded_rows(
+            self, function, start_date, end_date, shard='day',
+            max_workers=4, id_field=None, target_rows=50000, **kwargs):
+        """Yields each row of a report function like
+        CakeAPI.iter_sharded_rows, requesting up to max_workers shards at
+        once"""
+
+        kwargs['force_json'] = True
+        shards = _date_shards(start_date, end_date, shard)
+        if shard == 'adaptive':
+            planned = []
+            while shards:
+                row_counts = await _asyncio.gather(*[function(
+                    start_date=start, end_date=end, start_at_row='1',
+                    row_limit='1', **kwargs) for start, end in shards])
+                halved = []
+                for shard_range, page in zip(shards, row_counts):
+                    if _can_halve(shard_range, _row_count(page), target_rows):
+                        halved += _halve(shard_range)
+                    else:
+                        planned.append(shard_range)
+                shards = halved
+            shards = sorted(planned)
+
+        shards = _deque(shards)
+        pending = _deque()
+        previous_ids = set()
+        try:
+            while pending or shards:
+                while shards and len(pending) < max_workers:
+                    start, end = shards.popleft()
+                    pending.append(_asyncio.ensure_future(function(
+                        start_date=start, end_date=end, **kwargs)))
+                rows, previous_ids = _unique_rows(
+                    _rows_of(await pending.popleft()), id_field, previous_ids)
+                for row in rows:
+                    yield row
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+    async def to_csv(
+            self, function, path, fields=None, page_size=2500, window=4,
+            **kwargs):
+        """Streams every row of a paginated API function to a CSV file as
+        its pages arrive and returns how many rows were written. Without
+        fields the columns are those of the first page; an object that was
+        null on it is written to its column as JSON."""
+
+        from pycake.export.flatten import _flatten
+        from pycake.export.csv_export import _csv_chunks, _csv_fields
+
+        count = 0
+        header = True
+        with open(path, 'w', newline='', encoding='utf-8') as csv_file:
+            async for page in self.iter_pages(
+                    function, page_size=page_size, window=window, **kwargs):
+                rows = _rows_of(page)
+                if fields is None:
+                    fields = _csv_fields(_flatten(row) for row in rows)
+                for chunk in _csv_chunks(rows, fields=fields, header=header):
+                    csv_file.write(chunk)
+                header = False
+                count += len(rows)
+        return count
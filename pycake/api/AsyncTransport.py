@@ -0,0 +1,94 @@
+import asyncio as _asyncio
+
+_aiohttp = None
+
+
+def _require_aiohttp():
+    # aiohttp is imported by the first AsyncTransport so that importing
+    # pycake.api does not load it
+    global _aiohttp
+    if _aiohttp is None:
+        try:
+            import aiohttp as _aiohttp
+        except ImportError:
+            raise Exception('AsyncTransport requires the aiohttp package. '
+                'Install it with: pip install pycake[async]')
+
+
+class _AsyncResponse(object):
+
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+
+class AsyncTransport(object):
+    """Pooled keep-alive HTTP transport for the Async API classes.
+
+    limit caps the total number of open connections and limit_per_host the
+    connections to any one CAKE domain (0 means no per-host cap). Requires
+    the aiohttp package.
+    """
+
+    _default = None
+
+    def __init__(
+            self, limit=100, limit_per_host=0, keepalive_timeout=15,
+            timeout=None):
+
+        _require_aiohttp()
+        self.retry_exceptions = (
+            _aiohttp.ClientConnectionError, _asyncio.TimeoutError)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session = None
+        self._loop = None
+
+
+    @classmethod
+    def get_default(cls):
+        """Returns the process-wide AsyncTransport, creating it on first use"""
+
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+
+    @classmethod
+    def set_default(cls, transport):
+        """Replaces the AsyncTransport used by Async API objects created
+        without one"""
+
+        cls._default = transport
+
+
+    def _get_session(self):
+        loop = _asyncio.get_running_loop()
+        if (self._session is None or self._session.closed or
+                self._loop is not loop):
+            connector = _aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout)
+            self._session = _aiohttp.ClientSession(
+                connector=connector,
+                timeout=_aiohttp.ClientTimeout(total=self.timeout))
+            self._loop = loop
+        return self._session
+
+
+    async def post(self, url, json=None, data=None):
+        if data is not None:
+            data = [(key, str(value)) for (key, value) in data.items()
+                if value is not None]
+        session = self._get_session()
+        async with session.post(url, json=json, data=data) as response:
+            text = await response.text()
+            return _AsyncResponse(response.status, text)
+
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
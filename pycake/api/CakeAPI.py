@@ -0,0 +1,346 @@
+import json as _json
+from collections import deque as _deque
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from itertools import repeat as _repeat
+from urllib.parse import urlsplit as _urlsplit
+from .EncodingCache import EncodingCache
+from .json_stream import _open_json_stream
+from .pagination import _page_count, _page_start, _rows_of
+from .xml_stream import _open_xml_stream
+from .RateLimiter import RateLimiter
+from .ResponseFormat import ResponseFormat
+from .RetryPolicy import RetryPolicy
+from .RowStream import RowStream
+from .sharding import _can_halve, _date_shards, _halve, _shard_row_count
+from .sharding import _shard_rows, _unique_rows
+from .Transport import Transport
+
+_READ_SERVICES = frozenset(['export', 'get', 'reports', 'reports_lite_clicks'])
+_READ_PREFIXES = ('Get', 'Export')
+_CONVERTED_FORMATS = ('COLUMNAR', 'DATAFRAME', 'CSV')
+# what ASMX answers when a method does not accept a JSON request body
+_JSON_REJECTIONS = ('Request format is invalid',
+    'Request format is unrecognized', 'Invalid web service call')
+
+
+def _endpoint_parts(url):
+    """Returns the service and method of an endpoint URL, e.g.
+    ('reports', 'Clicks') for .../api/12/reports.asmx/Clicks"""
+
+    path = _urlsplit(url).path
+    service, _, method = path.rpartition('/')
+    service = service.rsplit('/', 1)[-1]
+    if service.endswith('.asmx'):
+        service = service[:-len('.asmx')]
+    return service.lower(), method
+
+
+def _convert_rows(response, response_format):
+    """Returns the rows of a JSON response as NumPy columns, a DataFrame or
+    an iterator of CSV text. Responses without rows are returned
+    unchanged."""
+
+    if isinstance(response, RowStream):
+        rows = response
+    elif isinstance(response, dict) and any(
+            isinstance(_, list) for _ in response.values()):
+        rows = _rows_of(response)
+    else:
+        return response
+    # imported here so numpy and pandas are only loaded when used
+    if response_format == 'CSV':
+        from pycake.export.csv_export import _csv_chunks
+        return _csv_chunks(rows)
+    from pycake.export.frames import to_columns, to_dataframe
+    if response_format == 'DATAFRAME':
+        return to_dataframe(rows)
+    return to_columns(rows)
+
+
+def _rejects_json(response):
+    """Returns True when a failed JSON call was refused because of its
+    encoding rather than failing for another reason, such as a server
+    error page"""
+
+    return (400 <= response.status_code <= 500 and
+        any(_ in response.text for _ in _JSON_REJECTIONS))
+
+
+def _is_read_endpoint(url):
+    """Returns True for endpoints that only read data and are therefore
+    safe to send more than once"""
+
+    service, method = _endpoint_parts(url)
+    return (service in _READ_SERVICES or method.startswith(_READ_PREFIXES)
+        or method.endswith('Feed'))
+
+
+class CakeAPI(object):
+    """ Base class from which all API classes will inherit. """
+
+    # shared objects that stay in their process when an API object is
+    # pickled; unpickled objects use their new process' defaults instead
+    _PROCESS_LOCAL = ('transport', 'encoding_cache', 'retry_policy',
+        'single_flight', 'response_cache')
+
+    def __init__(
+            self, admin_domain, response_format=ResponseFormat.JSON,
+            use_https=True, transport=None, encoding_cache=None,
+            retry_policy=None, rate_limiter=None, single_flight=None,
+            response_cache=None):
+
+        self.admin_domain = admin_domain
+        self.response_format = response_format
+        self.protocol = 'https' if use_https else 'http'
+        self.transport = (Transport.get_default() if transport is None
+            else transport)
+        self.encoding_cache = (EncodingCache.get_default() if
+            encoding_cache is None else encoding_cache)
+        self.retry_policy = (RetryPolicy.get_default() if retry_policy is None
+            else retry_policy)
+        self.rate_limiter = rate_limiter
+        self.single_flight = single_flight
+        self.response_cache = response_cache
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self._PROCESS_LOCAL:
+            state[name] = None
+        return state
+
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.transport = Transport.get_default()
+        self.encoding_cache = EncodingCache.get_default()
+        self.retry_policy = RetryPolicy.get_default()
+
+
+    def _make_api_call(self, url, params, force_json=False):
+        response_format = ('JSON' if force_json else
+            self.response_format.upper())
+        if response_format in _CONVERTED_FORMATS:
+            return _convert_rows(
+                self._send(url, params, 'JSON_STREAM'), response_format)
+        if not self._shareable(url, response_format):
+            return self._send(url, params, response_format)
+
+        key = self._call_key(url, params, response_format)
+        cached = self._cached(url, key)
+        if cached is not None:
+            return cached
+
+        def fetch():
+            response = self._send(url, params, response_format)
+            self._cache(url, key, response)
+            return response
+
+        if self.single_flight is None:
+            return fetch()
+        return self.single_flight.do(key, fetch)
+
+
+    def _shareable(self, url, response_format):
+        """Returns True when a call's result may be cached or shared with
+        identical in-flight calls"""
+
+        return ((self.single_flight is not None or
+            self.response_cache is not None) and
+            response_format in ('JSON', 'XML') and _is_read_endpoint(url))
+
+
+    def _cached(self, url, key):
+        if self.response_cache is None:
+            return None
+        return self.response_cache.get(url, key)
+
+
+    def _cache(self, url, key, response):
+        if self.response_cache is not None:
+            self.response_cache.set(url, key, response)
+
+
+    @staticmethod
+    def _call_key(url, params, response_format):
+        return '{} {} {}'.format(response_format, url, _json.dumps(
+            params, sort_keys=True, separators=(',', ':'), default=str))
+
+
+    def _send(self, url, params, response_format):
+        if response_format in ('JSON', 'JSON_STREAM'):
+            encoding = self.encoding_cache.get(url)
+            if encoding == EncodingCache.FORM:
+                return self._post_form(url, params)
+            self.encoding_cache.count('json_requests')
+            request = self._post(url, json=params)
+            if request.status_code == 200:
+                try:
+                    if response_format == 'JSON_STREAM':
+                        json_data = _open_json_stream(request)
+                    else:
+                        json_data = _json.loads(request.text)['d']
+                except (ValueError, KeyError):
+                    pass
+                else:
+                    if encoding is None:
+                        self.encoding_cache.set(url, EncodingCache.JSON)
+                    return json_data
+            if encoding == EncodingCache.JSON:
+                request.close()
+                raise Exception('{} returned an invalid JSON response '
+                    '(HTTP {})'.format(url, request.status_code))
+            # only an endpoint's first call falls back to form data, and
+            # only a rejected JSON body teaches it to use form data
+            rejected = _rejects_json(request)
+            request.close()
+            self.encoding_cache.count('fallbacks')
+            return self._post_form(url, params, learn=rejected)
+        else:
+            return self._post_form(
+                url, params, stream=response_format == 'XML_STREAM')
+
+
+    def _rate_limit_key(self):
+        return RateLimiter.key_for(
+            self.admin_domain, getattr(self, 'api_key', None))
+
+
+    def _post(self, url, json=None, data=None):
+        def send():
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self._rate_limit_key())
+            return self.transport.post(url, json=json, data=data)
+
+        return self.retry_policy.call(
+            EncodingCache.endpoint_key(url), send,
+            retry=_is_read_endpoint(url),
+            exceptions=self.transport.retry_exceptions)
+
+
+    def _post_form(self, url, params, learn=False, stream=False):
+        self.encoding_cache.count('form_requests')
+        request = self._post(url, data=params)
+        if learn and request.status_code == 200:
+            self.encoding_cache.set(url, EncodingCache.FORM)
+        if stream:
+            return _open_xml_stream(request)
+        return request.text
+
+
+    def iter_pages(self, function, page_size=2500, window=4, **kwargs):
+        """Yields each page of a paginated API function in order. The first
+        page gives the row count; the remaining pages are fetched by window
+        threads ahead of the consumer."""
+
+        kwargs['force_json'] = True
+        first_page = function(
+            start_at_row=_page_start(0, page_size), row_limit=page_size,
+            **kwargs)
+        page_count = _page_count(first_page, page_size)
+        yield first_page
+        if page_count < 2:
+            return
+
+        executor = _ThreadPoolExecutor(max_workers=window)
+        pending = _deque()
+        next_page = 1
+        try:
+            while pending or next_page < page_count:
+                while next_page < page_count and len(pending) < window:
+                    pending.append(executor.submit(function,
+                        start_at_row=_page_start(next_page, page_size),
+                        row_limit=page_size, **kwargs))
+                    next_page += 1
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+    def iter_rows(self, function, page_size=2500, window=4, **kwargs):
+        """Yields each row of a paginated API function in order"""
+
+        for page in self.iter_pages(
+                function, page_size=page_size, window=window, **kwargs):
+            for row in _rows_of(page):
+                yield row
+
+
+    def _plan_shards(self, executor, function, shards, target_rows, kwargs):
+        """Halves shards until each holds at most target_rows rows"""
+
+        planned = []
+        while shards:
+            row_counts = executor.map(
+                _shard_row_count, _repeat(function), shards, _repeat(kwargs))
+            halved = []
+            for shard, row_count in zip(shards, list(row_counts)):
+                if _can_halve(shard, row_count, target_rows):
+                    halved += _halve(shard)
+                else:
+                    planned.append(shard)
+            shards = halved
+        return sorted(planned)
+
+
+    def iter_sharded_rows(
+            self, function, start_date, end_date, shard='day', pool='thread',
+            max_workers=4, id_field=None, target_rows=50000, **kwargs):
+        """Yields each row of a report function taking start_date and
+        end_date in order, running it on max_workers threads (or processes
+        with pool='process') over 'day' or 'hour' shards of the date range.
+        'adaptive' shards are days halved until they hold at most
+        target_rows rows. Rows whose id_field was in the previous shard are
+        skipped. With pool='process' a rate_limiter must have a path, since
+        every process would otherwise allow the full rate on its own."""
+
+        shards = _date_shards(start_date, end_date, shard)
+        if pool == 'thread':
+            executor = _ThreadPoolExecutor(max_workers=max_workers)
+        elif pool == 'process':
+            # function is pickled with the API object it is bound to
+            rate_limiter = getattr(
+                getattr(function, '__self__', self), 'rate_limiter', None)
+            if rate_limiter is not None and rate_limiter.path is None:
+                raise Exception("pool='process' requires a RateLimiter with "
+                    'a path, which the worker processes share')
+            from concurrent.futures import (
+                ProcessPoolExecutor as _ProcessPoolExecutor)
+            executor = _ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            raise Exception("pool must be 'thread' or 'process'")
+
+        pending = _deque()
+        try:
+            if shard == 'adaptive':
+                shards = self._plan_shards(
+                    executor, function, shards, target_rows, kwargs)
+            shards = _deque(shards)
+            previous_ids = set()
+            while pending or shards:
+                while shards and len(pending) < max_workers:
+                    pending.append(executor.submit(
+                        _shard_rows, function, shards.popleft(), kwargs))
+                rows, previous_ids = _unique_rows(
+                    pending.popleft().result(), id_field, previous_ids)
+                for row in rows:
+                    yield row
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+    def to_csv(
+            self, function, path, fields=None, page_size=2500, window=4,
+            **kwargs):
+        """Streams every row of a paginated API function to a CSV file as
+        its pages arrive and returns how many rows were written"""
+
+        from pycake.export.csv_export import to_csv
+
+        return to_csv(self.iter_rows(
+            function, page_size=page_size, window=window, **kwargs), path,
+            fields=fields)
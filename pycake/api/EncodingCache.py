@@ -0,0 +1,116 @@
+import json as _json
+import os as _os
+import threading as _threading
+from urllib.parse import urlsplit as _urlsplit
+try:
+    import fcntl as _fcntl
+except ImportError:
+    _fcntl = None
+
+
+class EncodingCache(object):
+    """Remembers which request encoding each CAKE endpoint accepts.
+
+    Endpoints that reject JSON bodies are learned the first time the form
+    fallback succeeds, so later calls go straight to form data instead of
+    paying for a failed JSON round trip. Other failures, such as a server
+    error page, are not learned. Pass a path to persist the learned profile
+    between processes. Each save merges what this cache learned into the
+    file as other processes left it, under a lock where fcntl is available.
+    """
+
+    JSON = 'json'
+    FORM = 'form'
+
+    _default = None
+    _default_lock = _threading.Lock()
+
+    def __init__(self, path=None):
+        self.path = path
+        self.stats = {
+            'json_requests': 0,
+            'form_requests': 0,
+            'fallbacks': 0,
+        }
+        self._encodings = {}
+        self._lock = _threading.Lock()
+        if path is not None:
+            self._encodings.update(self._load())
+
+
+    @classmethod
+    def get_default(cls):
+        """Returns the process-wide EncodingCache, creating it on first use"""
+
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+
+    @classmethod
+    def set_default(cls, encoding_cache):
+        """Replaces the EncodingCache used by API objects created without one"""
+
+        with cls._default_lock:
+            cls._default = encoding_cache
+
+
+    @staticmethod
+    def endpoint_key(url):
+        parts = _urlsplit(url)
+        return parts.netloc.lower() + parts.path.lower()
+
+
+    def get(self, url):
+        return self._encodings.get(self.endpoint_key(url))
+
+
+    def set(self, url, encoding):
+        key = self.endpoint_key(url)
+        if self._encodings.get(key) == encoding:
+            return
+        with self._lock:
+            self._encodings[key] = encoding
+            if self.path is not None:
+                self._save({key: encoding})
+
+
+    def count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+
+    def clear(self):
+        with self._lock:
+            self._encodings.clear()
+            if self.path is not None:
+                self._save(None)
+
+
+    def _load(self):
+        if not _os.path.exists(self.path):
+            return {}
+        with open(self.path) as profile:
+            return _json.load(profile)
+
+
+    def _save(self, changes):
+        """Writes changes into the profile as it is on disk, keeping the
+        endpoints other processes learned since it was loaded. With changes
+        None the profile is replaced by this cache's encodings."""
+
+        # the profile itself is replaced on every save, so the lock is held
+        # on a file next to it
+        with open(self.path + '.lock', 'w') as lock_file:
+            if _fcntl is not None:
+                _fcntl.flock(lock_file.fileno(), _fcntl.LOCK_EX)
+            if changes is not None:
+                self._encodings.update(self._load())
+                self._encodings.update(changes)
+            temp_path = '{}.{}.tmp'.format(self.path, _os.getpid())
+            with open(temp_path, 'w') as profile:
+                _json.dump(
+                    self._encodings, profile, indent=0, sort_keys=True)
+            _os.replace(temp_path, self.path)
@@ -0,0 +1,111 @@
+import hashlib as _hashlib
+import json as _json
+import os as _os
+import threading as _threading
+import time as _time
+try:
+    import fcntl as _fcntl
+except ImportError:
+    _fcntl = None
+
+
+class RateLimiter(object):
+    """Client-side token bucket limiting requests per CAKE API key.
+
+    Each admin_domain and api_key pair gets a bucket holding up to burst
+    tokens that refills at rate tokens per second; every request takes a
+    token and waits for one when the bucket is empty. Waiting callers
+    reserve their token up front, so they are released evenly spaced rather
+    than all at once.
+
+    Without a path the buckets are shared by the threads of this process.
+    With a path they are kept in that file under an exclusive lock and
+    shared by every process using the same path. Only a hash of the API
+    key is written to the file.
+    """
+
+    def __init__(self, rate, burst=None, path=None):
+        if path is not None and _fcntl is None:
+            raise Exception('A file-backed RateLimiter requires fcntl, which '
+                'is not available on this platform')
+        self.rate = float(rate)
+        self.burst = float(rate if burst is None else burst)
+        self.path = path
+        self._buckets = {}
+        self._lock = _threading.Lock()
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = _threading.Lock()
+
+
+    @staticmethod
+    def key_for(admin_domain, api_key=None):
+        digest = _hashlib.sha1(str(api_key).encode('utf-8')).hexdigest()
+        return '{}:{}'.format(admin_domain.lower(), digest[:16])
+
+
+    def _take(self, bucket, tokens, now):
+        """Takes tokens from a (tokens, timestamp) bucket and returns the
+        updated bucket and how long the caller must wait"""
+
+        available, stamp = bucket if bucket else (self.burst, now)
+        available = min(self.burst, available + (now - stamp) * self.rate)
+        available -= tokens
+        wait = -available / self.rate if available < 0 else 0
+        return [available, now], wait
+
+
+    def _reserve(self, key, tokens):
+        if self.path is None:
+            with self._lock:
+                self._buckets[key], wait = self._take(
+                    self._buckets.get(key), tokens, _time.time())
+            return wait
+
+        fd = _os.open(self.path, _os.O_RDWR | _os.O_CREAT, 0o600)
+        try:
+            _fcntl.flock(fd, _fcntl.LOCK_EX)
+            with _os.fdopen(_os.dup(fd), 'r+') as bucket_file:
+                content = bucket_file.read()
+                buckets = _json.loads(content) if content else {}
+                buckets[key], wait = self._take(
+                    buckets.get(key), tokens, _time.time())
+                bucket_file.seek(0)
+                bucket_file.truncate()
+                _json.dump(buckets, bucket_file)
+        finally:
+            _os.close(fd)
+        return wait
+
+
+    def acquire(self, key, tokens=1):
+        """Blocks until tokens are available for key"""
+
+        wait = self._reserve(key, tokens)
+        if wait > 0:
+            _time.sleep(wait)
+
+
+    async def acquire_async(self, key, tokens=1):
+        """Waits without blocking the event loop until tokens are available
+        for key"""
+
+        import asyncio as _asyncio
+
+        if self.path is None:
+            wait = self._reserve(key, tokens)
+        else:
+            # the file lock can be held by another process, so it is taken
+            # on a worker thread rather than on the event loop
+            wait = await _asyncio.get_running_loop().run_in_executor(
+                None, self._reserve, key, tokens)
+        if wait > 0:
+            await _asyncio.sleep(wait)
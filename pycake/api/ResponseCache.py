@@ -0,0 +1,193 @@
+import hashlib as _hashlib
+import json as _json
+import os as _os
+import sqlite3 as _sqlite3
+import threading as _threading
+import time as _time
+from collections import OrderedDict as _OrderedDict
+from .CakeAPI import _endpoint_parts
+
+
+class _MemoryStore(object):
+
+    def __init__(self):
+        self._entries = _OrderedDict()
+        self._bytes = 0
+
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+
+    def set(self, key, expires, payload):
+        self.delete(key)
+        self._entries[key] = (expires, payload)
+        self._bytes += len(payload)
+
+
+    def delete(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+
+    def evict(self, max_entries, max_bytes):
+        evicted = 0
+        while self._entries and (len(self._entries) > max_entries or
+                self._bytes > max_bytes):
+            key, (_, payload) = self._entries.popitem(last=False)
+            self._bytes -= len(payload)
+            evicted += 1
+        return evicted
+
+
+    def clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+
+class _SQLiteStore(object):
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+        self._pid = None
+
+
+    def _db(self):
+        # connections must not be shared with forked children
+        if self._pid != _os.getpid():
+            self._connection = _sqlite3.connect(
+                self.path, timeout=30, isolation_level=None,
+                check_same_thread=False)
+            self._connection.execute('CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, expires REAL, used REAL, size INTEGER, '
+                'payload TEXT)')
+            self._pid = _os.getpid()
+        return self._connection
+
+
+    def get(self, key):
+        db = self._db()
+        entry = db.execute('SELECT expires, payload FROM responses '
+            'WHERE key = ?', (key,)).fetchone()
+        if entry is not None:
+            db.execute('UPDATE responses SET used = ? WHERE key = ?',
+                (_time.time(), key))
+        return entry
+
+
+    def set(self, key, expires, payload):
+        self._db().execute('INSERT OR REPLACE INTO responses '
+            'VALUES (?, ?, ?, ?, ?)',
+            (key, expires, _time.time(), len(payload), payload))
+
+
+    def delete(self, key):
+        self._db().execute('DELETE FROM responses WHERE key = ?', (key,))
+
+
+    def evict(self, max_entries, max_bytes):
+        db = self._db()
+        count, size = db.execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses'
+            ).fetchone()
+        evicted = []
+        for key, entry_size in db.execute(
+                'SELECT key, size FROM responses ORDER BY used').fetchall():
+            if count <= max_entries and size <= max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            size -= entry_size
+        db.executemany('DELETE FROM responses WHERE key = ?', evicted)
+        return len(evicted)
+
+
+    def clear(self):
+        self._db().execute('DELETE FROM responses')
+
+
+class ResponseCache(object):
+    """TTL and LRU cache for the responses of the get.asmx lookup endpoints.
+
+    Responses are kept for ttl seconds; ttls maps endpoint method names
+    (e.g. 'Countries') to their own TTL, and a TTL of 0 disables caching for
+    that endpoint. The least recently used responses are evicted once there
+    are more than max_entries of them or they take more than max_bytes.
+    Responses are stored serialized, so every hit returns a fresh copy.
+
+    With a path the responses are kept in a SQLite database at that path,
+    which survives restarts and can be shared between processes. Only a
+    hash of each call (which includes the API key) is stored.
+    """
+
+    def __init__(
+            self, ttl=300, ttls=None, max_entries=1024,
+            max_bytes=16 * 1024 * 1024, path=None):
+
+        self.ttl = ttl
+        self.ttls = dict((method.lower(), method_ttl) for method, method_ttl
+            in (ttls or {}).items())
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path = path
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+        }
+        self._store = _MemoryStore() if path is None else _SQLiteStore(path)
+        self._lock = _threading.Lock()
+
+
+    def ttl_for(self, url):
+        """Returns how long responses from url are cached, 0 if they are
+        not"""
+
+        service, method = _endpoint_parts(url)
+        if service != 'get' or method == 'GetAPIKey':
+            return 0
+        return self.ttls.get(method.lower(), self.ttl)
+
+
+    @staticmethod
+    def _hash(key):
+        return _hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+    def get(self, url, key):
+        """Returns the cached response for a call, or None"""
+
+        if not self.ttl_for(url):
+            return None
+        key = self._hash(key)
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None and entry[0] <= _time.time():
+                self._store.delete(key)
+                entry = None
+            self.stats['misses' if entry is None else 'hits'] += 1
+        return None if entry is None else _json.loads(entry[1])
+
+
+    def set(self, url, key, response):
+        ttl = self.ttl_for(url)
+        if not ttl or response is None or (isinstance(response, dict) and
+                response.get('success') is False):
+            return
+        payload = _json.dumps(response, separators=(',', ':'))
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            self._store.set(self._hash(key), _time.time() + ttl, payload)
+            self.stats['evictions'] += self._store.evict(
+                self.max_entries, self.max_bytes)
+
+
+    def clear(self):
+        with self._lock:
+            self._store.clear()
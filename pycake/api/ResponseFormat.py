@@ -1,4 +1,8 @@
 class ResponseFormat:
 	JSON = 'JSON'
 	XML = 'XML'
-
+	JSON_STREAM = 'JSON_STREAM'
+	XML_STREAM = 'XML_STREAM'
+	COLUMNAR = 'COLUMNAR'
+	DATAFRAME = 'DATAFRAME'
+	CSV = 'CSV'
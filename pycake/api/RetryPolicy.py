@@ -0,0 +1,189 @@
+import random as _random
+import threading as _threading
+import time as _time
+
+
+class _CircuitBreaker(object):
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = _threading.Lock()
+
+
+    def allow(self):
+        """Returns False while the breaker is open. Once reset_timeout has
+        passed a single trial call is let through."""
+
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if _time.time() - self.opened_at < self.reset_timeout:
+                return False
+            self.opened_at = _time.time()
+            return True
+
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+
+    def failure(self):
+        """Records a failure and returns True if it opened the breaker"""
+
+        with self._lock:
+            self.failures += 1
+            if self.failures < self.failure_threshold:
+                return False
+            self.opened_at = _time.time()
+            return True
+
+
+class RetryPolicy(object):
+    """Retries failed calls to read-only endpoints and fails fast on
+    endpoints that keep failing.
+
+    A call is failed when the transport raises a connection error or the
+    response status is in retry_statuses. 500 is left out by default
+    because CAKE also answers 500 to well-formed requests it rejects.
+    Read-only calls are retried up to max_retries times, sleeping a random
+    time between 0 and backoff_factor * 2 ** attempt (capped at
+    max_backoff) before each retry. After failure_threshold consecutive
+    failures an endpoint's circuit breaker opens and calls to it raise
+    immediately until reset_timeout seconds have passed.
+    """
+
+    _default = None
+    _default_lock = _threading.Lock()
+
+    def __init__(
+            self, max_retries=3, backoff_factor=0.5, max_backoff=30,
+            retry_statuses=(502, 503, 504), failure_threshold=5,
+            reset_timeout=30):
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.stats = {
+            'retries': 0,
+            'breaker_trips': 0,
+            'breaker_rejections': 0,
+        }
+        self._breakers = {}
+        self._lock = _threading.Lock()
+
+
+    @classmethod
+    def get_default(cls):
+        """Returns the process-wide RetryPolicy, creating it on first use"""
+
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+
+    @classmethod
+    def set_default(cls, retry_policy):
+        """Replaces the RetryPolicy used by API objects created without one"""
+
+        with cls._default_lock:
+            cls._default = retry_policy
+
+
+    def _count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+
+    def _breaker(self, endpoint):
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(endpoint, _CircuitBreaker(
+                    self.failure_threshold, self.reset_timeout))
+        return breaker
+
+
+    def _backoff(self, attempt):
+        return _random.uniform(0, min(
+            self.max_backoff, self.backoff_factor * 2 ** attempt))
+
+
+    def _admit(self, endpoint):
+        breaker = self._breaker(endpoint)
+        if not breaker.allow():
+            self._count('breaker_rejections')
+            raise Exception('Circuit breaker open for {}: the endpoint failed '
+                '{} times in a row'.format(endpoint, breaker.failures))
+        return breaker
+
+
+    def _should_retry(self, breaker, response, attempt, retry):
+        """Records the outcome of an attempt. Returns None when the response
+        is final, otherwise whether another attempt may be made."""
+
+        if response is not None and (
+                response.status_code not in self.retry_statuses):
+            breaker.success()
+            return None
+        if breaker.failure():
+            self._count('breaker_trips')
+        if not retry or attempt >= self.max_retries or not breaker.allow():
+            return False
+        self._count('retries')
+        return True
+
+
+    def call(self, endpoint, send, retry=True, exceptions=()):
+        """Calls send(), retrying it as configured. When no attempts are
+        left the last response is returned or the last error raised."""
+
+        breaker = self._admit(endpoint)
+        attempt = 0
+        while True:
+            try:
+                response = send()
+            except exceptions:
+                should_retry = self._should_retry(breaker, None, attempt, retry)
+                if not should_retry:
+                    raise
+            else:
+                should_retry = self._should_retry(
+                    breaker, response, attempt, retry)
+                if not should_retry:
+                    return response
+                response.close()
+            _time.sleep(self._backoff(attempt))
+            attempt += 1
+
+
+    async def call_async(self, endpoint, send, retry=True, exceptions=()):
+        """Awaits send() the same way call() calls it"""
+
+        import asyncio as _asyncio
+
+        breaker = self._admit(endpoint)
+        attempt = 0
+        while True:
+            try:
+                response = await send()
+            except exceptions:
+                should_retry = self._should_retry(breaker, None, attempt, retry)
+                if not should_retry:
+                    raise
+            else:
+                should_retry = self._should_retry(
+                    breaker, response, attempt, retry)
+                if not should_retry:
+                    return response
+            await _asyncio.sleep(self._backoff(attempt))
+            attempt += 1
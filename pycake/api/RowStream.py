@@ -0,0 +1,64 @@
+class RowStream(object):
+    """Iterates over the rows of a streamed API response one at a time.
+
+    Members of the response other than the rows (row_count, success,
+    message...) are available through fields or item access as soon as they
+    have been read off the connection. The connection is released once the
+    rows are exhausted or close() is called.
+    """
+
+    def __init__(self, rows, fields=None, row_key=None, response=None):
+        self._rows = rows
+        self.fields = {} if fields is None else fields
+        self.row_key = row_key
+        self._response = response
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        try:
+            return next(self._rows)
+        except StopIteration:
+            self.close()
+            raise
+
+    next = __next__
+
+
+    def __getitem__(self, key):
+        return self.fields[key]
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+    def get(self, key, default=None):
+        return self.fields.get(key, default)
+
+
+    @property
+    def row_count(self):
+        return self.fields.get('row_count')
+
+
+    def as_models(self, model, lazy=False):
+        """Yields each remaining row as an instance of a pycake.models
+        class. lazy=True decodes each field only when it is read."""
+
+        convert = model.lazy if lazy else model.from_dict
+        for row in self:
+            yield convert(row)
+
+
+    def close(self):
+        if self._response is not None:
+            self._response.close()
+            self._response = None
@@ -0,0 +1,73 @@
+import threading as _threading
+
+
+class _Call(object):
+
+    def __init__(self):
+        self.done = _threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Coalesces concurrent identical calls into one.
+
+    While a call for a key is in flight, other callers asking for the same
+    key wait for it and receive the same result (or exception) instead of
+    sending their own request. Shared results are the same object for every
+    caller and should be treated as read-only.
+    """
+
+    def __init__(self):
+        self.stats = {
+            'calls': 0,
+            'shared': 0,
+        }
+        self._calls = {}
+        self._futures = {}
+        self._lock = _threading.Lock()
+
+
+    def do(self, key, function):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats['calls'] += 1
+            else:
+                self.stats['shared'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+    async def do_async(self, key, function):
+        """Awaits function() once for all concurrent callers with the same
+        key. A waiter being cancelled does not cancel the shared call."""
+
+        import asyncio as _asyncio
+
+        future = self._futures.get(key)
+        if future is None:
+            future = _asyncio.ensure_future(function())
+            self._futures[key] = future
+            future.add_done_callback(lambda _: self._futures.pop(key, None))
+            self.stats['calls'] += 1
+        else:
+            self.stats['shared'] += 1
+        return await _asyncio.shield(future)
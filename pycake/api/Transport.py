@@ -0,0 +1,69 @@
+import threading as _threading
+
+
+class Transport(object):
+    """Pooled keep-alive HTTP transport shared by the API classes.
+
+    pool_connections is the number of per-host pools to keep and
+    pool_maxsize the number of connections kept alive per host. With
+    pool_block=True callers wait for a free connection instead of opening
+    a throwaway one when a host's pool is exhausted.
+
+    requests is imported when the first Transport is created, not when
+    pycake.api is imported.
+    """
+
+    _default = None
+    _default_lock = _threading.Lock()
+
+    def __init__(
+            self, pool_connections=10, pool_maxsize=10, pool_block=False,
+            keep_alive=True, timeout=None):
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+
+        import requests as _requests
+        from requests.adapters import HTTPAdapter as _HTTPAdapter
+
+        self.retry_exceptions = (
+            _requests.exceptions.ConnectionError, _requests.exceptions.Timeout)
+        adapter = _HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+            pool_block=pool_block)
+        self.session = _requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+
+    @classmethod
+    def get_default(cls):
+        """Returns the process-wide Transport, creating it on first use"""
+
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+
+    @classmethod
+    def set_default(cls, transport):
+        """Replaces the Transport used by API objects created without one"""
+
+        with cls._default_lock:
+            cls._default = transport
+
+
+    def post(self, url, json=None, data=None, stream=True):
+        return self.session.post(
+            url, json=json, data=data, stream=stream, timeout=self.timeout)
+
+
+    def close(self):
+        self.session.close()
@@ -1,4 +1,42 @@
-from .AdminAPI import AdminAPI
-from .AffiliateAPI import AffiliateAPI
-from .BuyerAPI import BuyerAPI
-from .ResponseFormat import ResponseFormat
+"""The API classes are imported the first time they are used, so importing
+pycake.api (or one class from it) does not load every API module and the
+HTTP libraries behind them."""
+
+import importlib as _importlib
+import sys as _sys
+from types import ModuleType as _ModuleType
+
+# each class is defined in the submodule of the same name
+_CLASSES = (
+    'AdminAPI', 'AffiliateAPI', 'BuyerAPI', 'ResponseFormat', 'Transport',
+    'EncodingCache', 'AsyncAdminAPI', 'AsyncAffiliateAPI', 'AsyncBuyerAPI',
+    'AsyncTransport', 'RowStream', 'RetryPolicy', 'RateLimiter',
+    'SingleFlight', 'ResponseCache')
+
+__all__ = list(_CLASSES)
+
+
+def __getattr__(name):
+    if name not in _CLASSES:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+    module = _importlib.import_module('.' + name, __name__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_CLASSES))
+
+
+class _Package(_ModuleType):
+
+    def __setattr__(self, name, value):
+        # importing a submodule binds it to the package under its own name,
+        # which would hide the class of that name
+        if name in _CLASSES and isinstance(value, _ModuleType):
+            value = getattr(value, name)
+        super(_Package, self).__setattr__(name, value)
+
+
+_sys.modules[__name__].__class__ = _Package
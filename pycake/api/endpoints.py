@@ -0,0 +1,82 @@
+import re as _re
+from collections import namedtuple as _namedtuple
+from datetime import datetime as _datetime
+
+_Endpoint = _namedtuple('_Endpoint', [
+    'name', 'service', 'version', 'method', 'signature', 'parameters',
+    'root', 'force_json', 'checks'])
+_ARGUMENT = _re.compile(r'(?:^|, )\**(\w+)')
+
+
+def _endpoint(
+        name, service, version, method, signature, parameters, root=None,
+        force_json=False, checks=()):
+    """Declares an API function calling
+    <root>/<version>/<service>.asmx/<method>.
+
+    signature is the function's argument list as it would be written after
+    self. parameters lists the request parameters in order: a name is sent
+    as the argument of that name, or the object's attribute of that name
+    (e.g. api_key) when there is no such argument; (name, str) sends
+    str(argument) and (name, value) always sends value. checks are
+    function_validation decorators, applied as if listed top to bottom
+    above the function. root defaults to the class' _API_ROOT.
+    """
+
+    return _Endpoint(name, service, version, method, signature, parameters,
+        root, force_json, checks)
+
+
+def _endpoint_source(endpoint, root):
+    """Returns the source of an endpoint's function. The URL path and the
+    parameter dict are written out as literals, so a call only formats the
+    domain and fills in the arguments."""
+
+    path = '/{}/{}/{}.asmx/{}'.format(
+        endpoint.root or root, endpoint.version, endpoint.service,
+        endpoint.method)
+    arguments = set(_ARGUMENT.findall(endpoint.signature))
+    values = []
+    for parameter in endpoint.parameters:
+        if isinstance(parameter, tuple):
+            name, value = parameter
+            if value is str:
+                value = 'str({})'.format(name)
+            else:
+                value = repr(value)
+        else:
+            name = parameter
+            value = name if name in arguments else 'self.' + name
+        values.append('{!r}: {}'.format(name, value))
+    if endpoint.force_json:
+        force_json = ("kwargs['force_json'] if 'force_json' in kwargs "
+            "else False")
+    else:
+        force_json = 'False'
+    return ('def {}(self{}{}):\n'
+        '    return self._make_api_call(\n'
+        '        url=self.protocol + \'://\' + self.admin_domain + {!r},\n'
+        '        params={{{}}},\n'
+        '        force_json={})\n'.format(
+        endpoint.name, ', ' if endpoint.signature else '',
+        endpoint.signature, path, ', '.join(values), force_json))
+
+
+def _add_endpoints(cls, endpoints):
+    """Generates the function of every endpoint and adds it to cls. All of
+    them are compiled at once when cls is defined."""
+
+    namespace = {'_datetime': _datetime}
+    exec(compile('\n'.join(_endpoint_source(endpoint, cls._API_ROOT)
+        for endpoint in endpoints), '<{} endpoints>'.format(cls.__name__),
+        'exec'), namespace)
+    for endpoint in endpoints:
+        if endpoint.name in cls.__dict__:
+            raise Exception('{}.{} is defined twice'.format(
+                cls.__name__, endpoint.name))
+        function = namespace[endpoint.name]
+        function.__module__ = cls.__module__
+        function.__qualname__ = '{}.{}'.format(cls.__name__, endpoint.name)
+        for check in reversed(endpoint.checks):
+            function = check(function)
+        setattr(cls, endpoint.name, function)
@@ -0,0 +1,151 @@
+import codecs as _codecs
+import json as _json
+from .RowStream import RowStream
+
+_CHUNK_SIZE = 65536
+_WHITESPACE = ' \t\n\r'
+_decoder = _json.JSONDecoder()
+
+
+class _JSONReader(object):
+    """Reads JSON values one at a time from an iterable of byte chunks,
+    buffering no more than the value being decoded."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._decode = _codecs.getincrementaldecoder('utf-8')().decode
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+
+    def _fill(self):
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        for chunk in self._chunks:
+            text = self._decode(chunk)
+            if text:
+                self._buffer += text
+                return
+        self._buffer += self._decode(b'', True)
+        self._eof = True
+
+
+    def peek(self):
+        """Returns the next non-whitespace character without consuming it,
+        or '' at the end of the input"""
+
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if self._eof:
+                return ''
+            self._fill()
+
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError('Expected {!r} in JSON stream, found {!r}'
+                .format(char, found))
+        self._pos += 1
+
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+                # a number at the end of the buffer may continue in the next
+                # chunk, so only trust values followed by another character
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            except ValueError:
+                if self._eof:
+                    raise
+            self._fill()
+
+
+def _read_members(reader, fields):
+    """Reads the remaining members of an object into fields until it
+    closes or an array member begins. Returns the array's key, or None."""
+
+    while True:
+        char = reader.peek()
+        if char == '}':
+            reader.expect('}')
+            return None
+        if char == ',':
+            reader.expect(',')
+        key = reader.value()
+        reader.expect(':')
+        if reader.peek() == '[':
+            reader.expect('[')
+            return key
+        fields[key] = reader.value()
+
+
+def _iter_array(reader):
+    if reader.peek() == ']':
+        reader.expect(']')
+        return
+    while True:
+        yield reader.value()
+        char = reader.peek()
+        reader.expect(char)
+        if char == ']':
+            return
+        if char != ',':
+            raise ValueError('Malformed array in JSON stream')
+
+
+def _iter_rows(reader, fields):
+    for row in _iter_array(reader):
+        yield row
+    while True:
+        key = _read_members(reader, fields)
+        if key is None:
+            return
+        fields[key] = list(_iter_array(reader))
+
+
+def _open_json_stream(response):
+    """Reads a CAKE JSON envelope up to its first array of rows and returns
+    a RowStream over them. Responses without rows are returned fully parsed,
+    the same way they would be without streaming."""
+
+    reader = _JSONReader(response.iter_content(chunk_size=_CHUNK_SIZE))
+    reader.expect('{')
+    while True:
+        key = reader.value()
+        reader.expect(':')
+        if key == 'd':
+            break
+        reader.value()
+        reader.expect(',')
+
+    char = reader.peek()
+    if char == '[':
+        reader.expect('[')
+        return RowStream(_iter_array(reader), response=response)
+    if char != '{':
+        data = reader.value()
+        response.close()
+        return data
+
+    reader.expect('{')
+    fields = {}
+    row_key = _read_members(reader, fields)
+    if row_key is None:
+        response.close()
+        return fields
+    return RowStream(
+        _iter_rows(reader, fields), fields=fields, row_key=row_key,
+        response=response)
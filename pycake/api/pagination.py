@@ -0,0 +1,34 @@
+def _rows_of(page):
+    """Returns the list of rows in an exported or reported page"""
+
+    if not isinstance(page, dict):
+        raise Exception('Expected a JSON page, received: {}'.format(page))
+    for value in page.values():
+        if isinstance(value, list):
+            return value
+    return []
+
+
+def _row_count(page):
+    """Returns the size of the result set a page belongs to"""
+
+    if not isinstance(page, dict) or 'row_count' not in page:
+        raise Exception('Expected a JSON page with a row_count, '
+            'received: {}'.format(page))
+    return int(page['row_count'])
+
+
+def _page_count(page, page_size):
+    """Returns how many pages of page_size hold a result set"""
+
+    row_count = _row_count(page)
+    if row_count % page_size == 0:
+        return row_count // page_size
+    else:
+        return row_count // page_size + 1
+
+
+def _page_start(page_index, page_size):
+    """Returns the 1-based start_at_row of a 0-based page index"""
+
+    return page_index * page_size + 1
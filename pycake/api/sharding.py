@@ -0,0 +1,89 @@
+from datetime import date as _date
+from datetime import datetime as _datetime
+from datetime import timedelta as _timedelta
+from .pagination import _row_count, _rows_of
+
+_SHARD_SPANS = {
+    'day': _timedelta(days=1),
+    'hour': _timedelta(hours=1),
+    'adaptive': _timedelta(days=1),
+}
+_MIN_ADAPTIVE_SPAN = _timedelta(hours=1)
+_DATE_FORMATS = (
+    '%Y-%m-%d', '%Y-%m-%d %H:%M', '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f',
+    '%m/%d/%Y', '%m/%d/%Y %H:%M:%S')
+
+
+def _to_datetime(value):
+    """Returns a datetime for a datetime, date or date string"""
+
+    if isinstance(value, _datetime):
+        return value
+    if isinstance(value, _date):
+        return _datetime(value.year, value.month, value.day)
+    for date_format in _DATE_FORMATS:
+        try:
+            return _datetime.strptime(str(value).strip(), date_format)
+        except ValueError:
+            pass
+    raise Exception('Could not parse date: {}'.format(value))
+
+
+def _date_shards(start_date, end_date, shard):
+    """Splits start_date to end_date into a list of (start, end) shards of
+    the span named by shard"""
+
+    if shard not in _SHARD_SPANS:
+        raise Exception('shard must be one of: {}'.format(
+            ', '.join(sorted(_SHARD_SPANS))))
+    start = _to_datetime(start_date)
+    end = _to_datetime(end_date)
+    if end <= start:
+        raise Exception('end_date must be after start_date')
+    shards = []
+    while start < end:
+        shard_end = min(start + _SHARD_SPANS[shard], end)
+        shards.append((start, shard_end))
+        start = shard_end
+    return shards
+
+
+def _halve(shard):
+    start, end = shard
+    middle = start + (end - start) // 2
+    middle = middle.replace(microsecond=0)
+    return [(start, middle), (middle, end)]
+
+
+def _can_halve(shard, row_count, target_rows):
+    start, end = shard
+    return row_count > target_rows and end - start >= 2 * _MIN_ADAPTIVE_SPAN
+
+
+def _shard_row_count(function, shard, kwargs):
+    """Returns the row count of a shard from a single-row request"""
+
+    return _row_count(function(
+        start_date=shard[0], end_date=shard[1], start_at_row='1',
+        row_limit='1', force_json=True, **kwargs))
+
+
+def _shard_rows(function, shard, kwargs):
+    """Returns every row of a shard. Module level so that process pools can
+    pickle it."""
+
+    return _rows_of(function(
+        start_date=shard[0], end_date=shard[1], force_json=True, **kwargs))
+
+
+def _unique_rows(rows, id_field, previous_ids):
+    """Returns the rows of a shard whose id_field is not in previous_ids
+    (the ids of the shard before it) and the id_field values of all rows"""
+
+    if id_field is None:
+        return rows, set()
+    ids = set(row[id_field] for row in rows)
+    if not previous_ids:
+        return rows, ids
+    return [row for row in rows if row[id_field] not in previous_ids], ids
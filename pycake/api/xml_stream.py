@@ -0,0 +1,85 @@
+from itertools import chain as _chain
+from xml.etree import ElementTree as _ElementTree
+from .RowStream import RowStream
+
+_XSI_NIL = '{http://www.w3.org/2001/XMLSchema-instance}nil'
+
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def _element_value(element):
+    """Converts an element to a string, None (xsi:nil) or, when it has child
+    elements, a dict. Repeated child elements are collected into a list."""
+
+    if len(element) == 0:
+        if element.get(_XSI_NIL) == 'true':
+            return None
+        return element.text or ''
+    value = {}
+    repeated = set()
+    for child in element:
+        key = _local_name(child.tag)
+        child_value = _element_value(child)
+        if key not in value:
+            value[key] = child_value
+        elif key in repeated:
+            value[key].append(child_value)
+        else:
+            value[key] = [value[key], child_value]
+            repeated.add(key)
+    return value
+
+
+def _iter_xml_rows(source, fields):
+    """Yields the rows of a CAKE XML response while it is being parsed.
+
+    Rows are the complex elements inside a container element such as
+    <clicks>, or the children of an ArrayOf... root. Leaf elements next to
+    the container (success, message, row_count...) are stored in fields.
+    Each element is freed as soon as it has been converted.
+    """
+
+    depth = 0
+    root = container = None
+    array_root = False
+    container_rows = 0
+    for event, element in _ElementTree.iterparse(
+            source, events=('start', 'end')):
+        if event == 'start':
+            if depth == 0:
+                root = element
+                array_root = _local_name(element.tag).startswith('ArrayOf')
+            elif depth == 1:
+                container = element
+                container_rows = 0
+            depth += 1
+            continue
+
+        depth -= 1
+        if depth == 2 and not array_root and len(element):
+            yield _element_value(element)
+            container_rows += 1
+            container.clear()
+        elif depth == 1:
+            if array_root:
+                yield _element_value(element)
+            elif container_rows == 0:
+                fields[_local_name(element.tag)] = _element_value(element)
+            root.clear()
+
+
+def _open_xml_stream(response):
+    """Returns a RowStream over the rows of a CAKE XML response. The
+    response is read up to its first row so that the fields preceding the
+    rows are available right away."""
+
+    response.raw.decode_content = True
+    fields = {}
+    rows = _iter_xml_rows(response.raw, fields)
+    try:
+        rows = _chain([next(rows)], rows)
+    except StopIteration:
+        pass
+    return RowStream(rows, fields=fields, response=response)
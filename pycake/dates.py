@@ -0,0 +1,139 @@
+import re as _re
+from datetime import datetime as _datetime
+from datetime import timedelta as _timedelta
+
+_NET_DATE = _re.compile(r'/Date\((-?\d+)([+-]\d{2})?(\d{2})?\)/$')
+_EPOCH = _datetime(1970, 1, 1)
+_NAT = -2 ** 63
+# milliseconds of each +hhmm offset seen, as a server only uses one or two
+_OFFSETS = {}
+_np = None
+
+
+def _require_numpy():
+    # numpy is imported on first use so that the models and syncs using this
+    # module do not load it
+    global _np
+    if _np is None:
+        try:
+            import numpy as _np
+        except ImportError:
+            raise Exception('Decoding date columns requires the numpy '
+                'package. Install it with: pip install pycake[columnar]')
+
+
+def is_net_date(value):
+    """Returns True for a .NET JSON date such as /Date(1514764800000-0500)/"""
+
+    return isinstance(value, str) and _NET_DATE.match(value) is not None
+
+
+def net_date_milliseconds(value):
+    """Returns the CAKE server's local time of a /Date(ms-0500)/ value in
+    milliseconds since the epoch"""
+
+    # sliced rather than matched since this runs for every date of every row
+    if not value.startswith('/Date(') or not value.endswith(')/'):
+        raise ValueError('{!r} is not a .NET JSON date'.format(value))
+    # /Date( + at least one digit + +hhmm)/, so the slice is never digits
+    # of a date without an offset
+    offset = _OFFSETS.get(value[-7:-2]) if len(value) > 13 else None
+    if offset is not None:
+        return int(value[6:-7]) + offset
+    body = value[6:-2]
+    sign_at = max(body.rfind('+'), body.rfind('-', 1))
+    if sign_at < 1:
+        return int(body)
+    offset = (int(body[sign_at + 1:sign_at + 3]) * 3600000 +
+        int(body[sign_at + 3:] or 0) * 60000)
+    if body[sign_at] == '-':
+        offset = -offset
+    if len(body) - sign_at == 5:
+        _OFFSETS[body[sign_at:]] = offset
+    return int(body[:sign_at]) + offset
+
+
+def parse_date(value):
+    """Returns the CAKE server's local time for a /Date(ms-0500)/ or ISO
+    date as a naive datetime, or None. Some fields hold ISO dates without a
+    time, which are midnight.
+
+    >>> parse_date('/Date(1514764800000-0500)/')
+    datetime.datetime(2017, 12, 31, 19, 0)
+    >>> parse_date('2018-01-01T08:30:00.123')
+    datetime.datetime(2018, 1, 1, 8, 30)
+    >>> parse_date('2018-01-01')
+    datetime.datetime(2018, 1, 1, 0, 0)
+    """
+
+    if not value:
+        return None
+    if isinstance(value, _datetime):
+        return value
+    if not value.startswith('/Date('):
+        if len(value) == 10:
+            return _datetime.strptime(value, '%Y-%m-%d')
+        return _datetime.strptime(value[:19], '%Y-%m-%dT%H:%M:%S')
+    return _EPOCH + _timedelta(milliseconds=net_date_milliseconds(value))
+
+
+def _date_milliseconds(value):
+    if not value:
+        return _NAT
+    if isinstance(value, str) and value.startswith('/Date('):
+        return net_date_milliseconds(value)
+    delta = parse_date(value) - _EPOCH
+    return delta.days * 86400000 + delta.seconds * 1000
+
+
+def _decode_group(digits, width):
+    """Decodes equally long /Date(ms+hhmm)/ values, given as a 2-D array of
+    their bytes, to milliseconds. Returns None unless every value has that
+    layout."""
+
+    # /Date( is 6 bytes, +hhmm)/ is 7
+    if width < 14:
+        return None
+    signs = digits[:, width - 7]
+    numbers = _np.concatenate(
+        [digits[:, 6:width - 7], digits[:, width - 6:width - 2]], axis=1)
+    numbers = numbers - ord('0')
+    if (((signs != ord('+')) & (signs != ord('-'))).any() or
+            (numbers > 9).any() or (digits[:, :6] != _np.frombuffer(
+            b'/Date(', dtype=_np.uint8)).any() or (digits[:, width - 2:] !=
+            _np.frombuffer(b')/', dtype=_np.uint8)).any()):
+        return None
+    numbers = numbers.astype(_np.int64)
+    milliseconds = numbers[:, :-4].dot(
+        10 ** _np.arange(width - 14, -1, -1, dtype=_np.int64))
+    offsets = (numbers[:, -4:-2].dot(_np.array([10, 1], dtype=_np.int64)) *
+        3600000 + numbers[:, -2:].dot(_np.array([10, 1], dtype=_np.int64)) *
+        60000)
+    return milliseconds + _np.where(signs == ord('-'), -offsets, offsets)
+
+
+def parse_dates(values):
+    """Returns the CAKE server's local times of a sequence of /Date(...)/ or
+    ISO dates as a datetime64[ms] array, with None and '' as NaT.
+
+    Values are decoded a group of equally long ones at a time with array
+    arithmetic; values in another layout are decoded one by one."""
+
+    _require_numpy()
+    strings = _np.array(['' if _ is None else _ for _ in values], dtype='S')
+    milliseconds = _np.full(len(strings), _NAT, dtype=_np.int64)
+    if not len(strings):
+        return milliseconds.view('datetime64[ms]')
+    lengths = _np.char.str_len(strings)
+    for width in _np.unique(lengths):
+        if width == 0:
+            continue
+        group = _np.flatnonzero(lengths == width)
+        decoded = _decode_group(_np.frombuffer(
+            strings[group].astype('S{}'.format(width)).tobytes(),
+            dtype=_np.uint8).reshape(len(group), width), int(width))
+        if decoded is None:
+            decoded = [_date_milliseconds(_.decode('ascii'))
+                for _ in strings[group]]
+        milliseconds[group] = decoded
+    return milliseconds.view('datetime64[ms]')
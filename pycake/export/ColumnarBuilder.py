@@ -0,0 +1,101 @@
+from collections import OrderedDict as _OrderedDict
+from .columnar import _column_kind, _empty_array, _promote
+from .columnar import _require_numpy, _to_array
+from .columnar import _np
+from .flatten import _flatten
+
+
+class ColumnarBuilder(object):
+    """Builds typed NumPy columns from report rows one batch at a time.
+
+    Nested objects are flattened into dotted column names such as
+    source_affiliate.source_affiliate_id. Integers become int64 (float64
+    for money fields such as paid or received.amount), floats float64,
+    booleans bool and CAKE dates datetime64[ms] in the server's local time;
+    anything else is kept in an object column. Missing values are False,
+    NaN, NaT or None; int64 columns with missing values are
+    numpy.ma.MaskedArray with them masked, so sums and means skip them, and
+    become nullable Int64 columns in to_dataframe(). Only the current batch
+    is held as Python objects. fields limits the columns to the given
+    dotted names.
+    """
+
+    def __init__(self, fields=None):
+        _require_numpy()
+        self.fields = fields
+        self.row_count = 0
+        self._batch_sizes = []
+        self._chunks = _OrderedDict()
+        if fields is not None:
+            for name in fields:
+                self._chunks[name] = {}
+
+
+    def add_rows(self, rows):
+        flat_rows = [_flatten(row) for row in rows]
+        if self.fields is None:
+            for flat_row in flat_rows:
+                for name in flat_row:
+                    if name not in self._chunks:
+                        self._chunks[name] = {}
+        batch = len(self._batch_sizes)
+        for name, chunks in self._chunks.items():
+            values = [flat_row.get(name) for flat_row in flat_rows]
+            kind = _column_kind(name, values)
+            chunks[batch] = (kind, _to_array(kind, values))
+        self._batch_sizes.append(len(flat_rows))
+        self.row_count += len(flat_rows)
+
+
+    def _column(self, chunks):
+        kind = 'null'
+        for chunk_kind, _ in chunks.values():
+            kind = _promote(kind, chunk_kind)
+        if kind == 'null':
+            kind = 'object'
+        arrays = []
+        for batch, batch_size in enumerate(self._batch_sizes):
+            chunk_kind, array = chunks.get(batch, ('null', None))
+            if chunk_kind == 'null':
+                array = _empty_array(kind, batch_size)
+            elif chunk_kind != kind:
+                missing = _np.ma.getmaskarray(array)
+                array = _np.ma.getdata(array).astype(
+                    object if kind == 'object' else _np.float64)
+                array[missing] = None if kind == 'object' else _np.nan
+            arrays.append(array)
+        if not arrays:
+            return _empty_array(kind, 0)
+        if any(_np.ma.isMaskedArray(_) for _ in arrays):
+            return _np.ma.concatenate(arrays)
+        return _np.concatenate(arrays)
+
+
+    def columns(self):
+        """Returns an OrderedDict of every column built so far. Columns that
+        were always null but have nested columns (e.g. pixel_info next to
+        pixel_info.hash_type) are left out."""
+
+        columns = _OrderedDict()
+        names = list(self._chunks)
+        for name, chunks in self._chunks.items():
+            always_null = all(kind == 'null' for kind, _ in chunks.values())
+            if always_null and self.fields is None and any(
+                    _.startswith(name + '.') for _ in names):
+                continue
+            columns[name] = self._column(chunks)
+        return columns
+
+
+    def to_dataframe(self):
+        try:
+            import pandas as _pandas
+        except ImportError:
+            raise Exception('to_dataframe() requires the pandas package. '
+                'Install it with: pip install pycake[dataframe]')
+        columns = self.columns()
+        for name, column in columns.items():
+            if _np.ma.isMaskedArray(column):
+                columns[name] = _pandas.arrays.IntegerArray(
+                    column.data, _np.ma.getmaskarray(column))
+        return _pandas.DataFrame(columns)
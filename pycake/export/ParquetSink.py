@@ -0,0 +1,113 @@
+import os as _os
+import uuid as _uuid
+from pycake.dates import parse_date
+from pycake.models import Click
+from .arrow import _converter, _date_field, _model_schema, _record_batch
+
+_PARTITION_FORMATS = {
+    'day': '%Y-%m-%d',
+    'month': '%Y-%m',
+}
+_NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+_parquet = None
+
+
+def _require_parquet():
+    global _parquet
+    if _parquet is None:
+        import pyarrow.parquet as _parquet
+
+
+class ParquetSink(object):
+    """Writes report rows to Parquet files with the schema of a
+    pycake.models class.
+
+    Rows are buffered per partition and written as a row group every
+    row_group_size rows, so memory is bounded by row_group_size rows per
+    open partition. With partition_by='day' (or 'month') rows go to
+    root/<date_field>_day=<date>/, dated by date_field (the model's first
+    date field by default) in the CAKE server's local time; with
+    partition_by=None all rows go to root. Each sink writes one uniquely
+    named part-<id>.parquet file per partition. Call close() (or use a with
+    block) to finish the files.
+    """
+
+    def __init__(
+            self, root, model=Click, row_group_size=100000,
+            partition_by='day', date_field=None, compression='snappy'):
+
+        if partition_by is not None and partition_by not in (
+                _PARTITION_FORMATS):
+            raise Exception("partition_by must be 'day', 'month' or None")
+        # _model_schema() checks that pyarrow is installed
+        self.schema = _model_schema(model)
+        _require_parquet()
+        self.root = root
+        self.model = model
+        self.row_group_size = row_group_size
+        self.partition_by = partition_by
+        self.date_field = date_field or _date_field(self.schema)
+        self.compression = compression
+        self.row_count = 0
+        self.files = []
+        self._converters = [_converter(_.type) for _ in self.schema]
+        self._buffers = {}
+        self._writers = {}
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def _partition(self, row):
+        if self.partition_by is None:
+            return ''
+        date = parse_date(row.get(self.date_field))
+        if date is None:
+            return _NULL_PARTITION
+        return date.strftime(_PARTITION_FORMATS[self.partition_by])
+
+
+    def _flush(self, partition):
+        rows = self._buffers.pop(partition, None)
+        if not rows:
+            return
+        writer = self._writers.get(partition)
+        if writer is None:
+            directory = (self.root if self.partition_by is None else
+                _os.path.join(self.root, '{}_{}={}'.format(
+                self.date_field, self.partition_by, partition)))
+            if not _os.path.isdir(directory):
+                _os.makedirs(directory)
+            path = _os.path.join(
+                directory, 'part-{}.parquet'.format(_uuid.uuid4().hex))
+            writer = self._writers[partition] = _parquet.ParquetWriter(
+                path, self.schema, compression=self.compression)
+            self.files.append(path)
+        writer.write_batch(_record_batch(rows, self.schema, self._converters),
+            row_group_size=len(rows))
+
+
+    def write_rows(self, rows):
+        """Writes each row of an iterable, e.g. iter_rows(ckadmin.clicks,
+        ...) or a RowStream"""
+
+        for row in rows:
+            partition = self._partition(row)
+            buffer = self._buffers.setdefault(partition, [])
+            buffer.append(row)
+            self.row_count += 1
+            if len(buffer) >= self.row_group_size:
+                self._flush(partition)
+
+
+    def close(self):
+        for partition in list(self._buffers):
+            self._flush(partition)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
@@ -0,0 +1,43 @@
+"""The exporters are imported the first time they are used, so writing CSV
+does not load numpy, pandas or pyarrow."""
+
+import importlib as _importlib
+import sys as _sys
+from types import ModuleType as _ModuleType
+
+# the submodule defining each name
+_EXPORTS = {
+    'ColumnarBuilder': 'ColumnarBuilder',
+    'to_columns': 'frames',
+    'to_dataframe': 'frames',
+    'ParquetSink': 'ParquetSink',
+    'to_csv': 'csv_export',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+    module = _importlib.import_module('.' + _EXPORTS[name], __name__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+class _Package(_ModuleType):
+
+    def __setattr__(self, name, value):
+        # importing a submodule binds it to the package under its own name,
+        # which would hide the class of that name
+        if _EXPORTS.get(name) == name and isinstance(value, _ModuleType):
+            value = getattr(value, name)
+        super(_Package, self).__setattr__(name, value)
+
+
+_sys.modules[__name__].__class__ = _Package
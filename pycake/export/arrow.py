@@ -0,0 +1,95 @@
+import json as _json
+from pycake.dates import _date_milliseconds, parse_date
+from pycake.models.converters import _to_bool, _to_decimal
+
+_pa = None
+
+
+def _require_pyarrow():
+    # pyarrow is imported on first use so that importing pycake.export does
+    # not load it
+    global _pa
+    if _pa is None:
+        try:
+            import pyarrow as _pa
+        except ImportError:
+            raise Exception('Parquet output requires the pyarrow package. '
+                'Install it with: pip install pycake[parquet]')
+
+
+def _field_type(model, name):
+    """Returns the Arrow type of a model field, following the converter the
+    model uses for it. Fields holding nested objects, such as
+    source_affiliate, are stored as JSON strings."""
+
+    converter = model.converters.get(name)
+    if converter is int:
+        return _pa.int64()
+    if converter is _to_decimal:
+        return _pa.float64()
+    if converter is _to_bool:
+        return _pa.bool_()
+    if converter is parse_date:
+        return _pa.timestamp('ms')
+    return _pa.string()
+
+
+def _model_schema(model):
+    """Returns the Arrow schema of a pycake.models class"""
+
+    _require_pyarrow()
+    return _pa.schema([_pa.field(name, _field_type(model, name))
+        for name in model.fields])
+
+
+def _to_timestamp(value):
+    """Returns the milliseconds of a /Date(ms-0500)/ or ISO date in the
+    CAKE server's local time, or None"""
+
+    if not value:
+        return None
+    return _date_milliseconds(value)
+
+
+def _to_float(value):
+    if isinstance(value, dict):
+        value = value.get('amount')
+    return None if value is None else float(value)
+
+
+def _to_string(value):
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return _json.dumps(value, sort_keys=True)
+    return str(value)
+
+
+def _converter(arrow_type):
+    """Returns a function converting a JSON row value to the form Arrow
+    expects for arrow_type"""
+
+    if arrow_type == _pa.timestamp('ms'):
+        return _to_timestamp
+    if arrow_type == _pa.float64():
+        return _to_float
+    if arrow_type == _pa.string():
+        return _to_string
+    return lambda value: value
+
+
+def _date_field(schema):
+    """Returns the name of the first date field of schema"""
+
+    for field in schema:
+        if field.type == _pa.timestamp('ms'):
+            return field.name
+    raise Exception('The schema has no date field')
+
+
+def _record_batch(rows, schema, converters):
+    """Returns rows as an Arrow RecordBatch of schema"""
+
+    return _pa.RecordBatch.from_arrays([_pa.array(
+        [convert(row.get(field.name)) for row in rows], type=field.type)
+        for field, convert in zip(schema, converters)], schema=schema)
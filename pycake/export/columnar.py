@@ -0,0 +1,86 @@
+from pycake.dates import is_net_date, parse_dates
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+_MONEY_FIELDS = frozenset([
+    'amount', 'cost', 'fee', 'margin', 'order_total', 'paid', 'payout',
+    'price', 'profit', 'received', 'revenue', 'total'])
+
+
+def _require_numpy():
+    if _np is None:
+        raise Exception('Columnar output requires the numpy package. '
+            'Install it with: pip install pycake[columnar]')
+
+
+def _is_money(name):
+    parts = name.split('.')
+    return (not parts[-1].endswith('_id') and
+        any(part in _MONEY_FIELDS for part in parts))
+
+
+def _column_kind(name, values):
+    """Returns the kind of array values fit in: 'null', 'bool', 'int',
+    'float', 'datetime' or 'object'"""
+
+    kind = 'null'
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value_kind = 'bool'
+        elif isinstance(value, int):
+            value_kind = 'float' if _is_money(name) else 'int'
+        elif isinstance(value, float):
+            value_kind = 'float'
+        elif is_net_date(value):
+            value_kind = 'datetime'
+        else:
+            return 'object'
+        kind = _promote(kind, value_kind)
+        if kind == 'object':
+            return kind
+    return kind
+
+
+def _promote(kind, other):
+    if kind == other or other == 'null':
+        return kind
+    if kind == 'null':
+        return other
+    if kind in ('int', 'float') and other in ('int', 'float'):
+        return 'float'
+    return 'object'
+
+
+def _to_array(kind, values):
+    """Returns values as an array of kind, with missing values as False,
+    NaN, NaT or None. Integer arrays with missing values are masked arrays
+    masking them, since any fill value could be a real id or count."""
+
+    count = len(values)
+    if kind == 'bool':
+        return _np.fromiter(
+            (bool(_) for _ in values), dtype=_np.bool_, count=count)
+    if kind == 'int':
+        array = _np.fromiter((0 if _ is None else _ for _ in values),
+            dtype=_np.int64, count=count)
+        missing = _np.fromiter(
+            (_ is None for _ in values), dtype=_np.bool_, count=count)
+        if missing.any():
+            return _np.ma.MaskedArray(array, mask=missing)
+        return array
+    if kind == 'float':
+        return _np.fromiter((_np.nan if _ is None else _ for _ in values),
+            dtype=_np.float64, count=count)
+    if kind == 'datetime':
+        return parse_dates(values)
+    return _np.fromiter(values, dtype=object, count=count)
+
+
+def _empty_array(kind, count):
+    if kind == 'object':
+        return _np.full(count, None, dtype=object)
+    return _to_array(kind, [None] * count)
@@ -0,0 +1,104 @@
+import csv as _csv
+import io as _io
+import json as _json
+from itertools import chain as _chain
+from itertools import islice as _islice
+from pycake.dates import is_net_date, parse_date
+from .flatten import _flatten
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (dict, list)):
+        return _json.dumps(value, sort_keys=True)
+    if is_net_date(value):
+        return parse_date(value).strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+    return value
+
+
+def _csv_fields(flat_rows):
+    """Returns the names of flattened rows in the order they first appear"""
+
+    fields = []
+    seen = set()
+    for flat_row in flat_rows:
+        for name in flat_row:
+            if name not in seen:
+                seen.add(name)
+                fields.append(name)
+    return fields
+
+
+def _whole_fields(fields):
+    """Returns the fields that have no dotted fields below them. An object
+    found at one of them is written to it as JSON, since its keys have no
+    columns of their own."""
+
+    parents = set()
+    for name in fields:
+        parts = name.split('.')
+        for end in range(1, len(parts)):
+            parents.add('.'.join(parts[:end]))
+    return frozenset(fields) - parents
+
+
+def _csv_chunks(
+        rows, fields=None, sample_size=1000, chunk_rows=1000, header=True):
+    """Yields CSV text for rows, chunk_rows rows at a time, starting with
+    the header. Without fields the columns are the flattened fields of the
+    first sample_size rows. A nested object that was null in those rows
+    (e.g. pixel_info) is written to its column as JSON."""
+
+    rows = iter(rows)
+    sample = list(_islice(rows, sample_size))
+    if fields is None:
+        fields = _csv_fields(_flatten(row) for row in sample)
+    whole = _whole_fields(fields)
+
+    buffer = _io.StringIO()
+    writer = _csv.writer(buffer, lineterminator='\n')
+    if header:
+        writer.writerow(fields)
+    count = 0
+    for flat_row in (_flatten(row, whole=whole)
+            for row in _chain(sample, rows)):
+        writer.writerow([_csv_value(flat_row.get(_)) for _ in fields])
+        count += 1
+        if count % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def to_csv(rows, path, fields=None, sample_size=1000):
+    """Streams rows to a CSV file at path (or to a file object) and returns
+    how many rows were written. Nested fields are flattened into dotted
+    columns; without fields the columns are those of the first sample_size
+    rows, and fields that only appear later are left out, except that an
+    object in a column that was null in the sample is written as JSON."""
+
+    count = 0
+
+    def counted(rows):
+        nonlocal count
+        for row in rows:
+            count += 1
+            yield row
+
+    if hasattr(path, 'write'):
+        csv_file = path
+    else:
+        csv_file = open(path, 'w', newline='', encoding='utf-8')
+    try:
+        for chunk in _csv_chunks(
+                counted(rows), fields=fields, sample_size=sample_size):
+            csv_file.write(chunk)
+    finally:
+        if csv_file is not path:
+            csv_file.close()
+    return count
@@ -0,0 +1,13 @@
+def _flatten(row, prefix='', flat=None, whole=()):
+    """Returns a row with nested objects flattened into dotted names, e.g.
+    {'source_affiliate.source_affiliate_id': 1}. Objects at a name in whole
+    are kept as they are."""
+
+    flat = {} if flat is None else flat
+    for key, value in row.items():
+        name = prefix + key
+        if isinstance(value, dict) and name not in whole:
+            _flatten(value, name + '.', flat, whole)
+        else:
+            flat[name] = value
+    return flat
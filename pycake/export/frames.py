@@ -0,0 +1,32 @@
+from .ColumnarBuilder import ColumnarBuilder
+
+
+def _batches(rows, batch_size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def to_columns(rows, fields=None, batch_size=10000):
+    """Returns an OrderedDict of typed NumPy arrays, one per flattened
+    field, built batch_size rows at a time from any iterable of rows (a
+    RowStream, iter_rows(), a list...)"""
+
+    builder = ColumnarBuilder(fields=fields)
+    for batch in _batches(rows, batch_size):
+        builder.add_rows(batch)
+    return builder.columns()
+
+
+def to_dataframe(rows, fields=None, batch_size=10000):
+    """Returns the columns of to_columns() as a pandas DataFrame"""
+
+    builder = ColumnarBuilder(fields=fields)
+    for batch in _batches(rows, batch_size):
+        builder.add_rows(batch)
+    return builder.to_dataframe()
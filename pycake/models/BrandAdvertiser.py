@@ -1,34 +1,39 @@
+from pycake.dates import parse_date
 from .CakeModel import CakeModel
 
 
 class BrandAdvertiser(CakeModel):
 
-    def __init__(self, **kwargs):
-        self.param_defaults = {
-            'advertiser_id': None,
-            'advertiser_name': None,
-            'third_party_name': None,
-            'account_managers': None,
-            'account_status': None,
-            'address': None,
-            'website': None,
-            'contacts': None,
-            'tags': None,
-            'credit_limits': None,
-            'suppression_lists': None,
-            'blacklists': None,
-            'billing_cycle': None,
-            'events': None,
-            'voucher_codes': None,
-            'storefronts': None,
-            'quickbooks_id': None,
-            'online_signup': None,
-            'signup_ip_address': None,
-            'api_key': None,
-            'date_created': None,
-            'date_last_accepted_terms': None,
-            'notes': None
-        }
+    fields = (
+        'advertiser_id',
+        'advertiser_name',
+        'third_party_name',
+        'account_managers',
+        'account_status',
+        'address',
+        'website',
+        'contacts',
+        'tags',
+        'credit_limits',
+        'suppression_lists',
+        'blacklists',
+        'billing_cycle',
+        'events',
+        'voucher_codes',
+        'storefronts',
+        'quickbooks_id',
+        'online_signup',
+        'signup_ip_address',
+        'api_key',
+        'date_created',
+        'date_last_accepted_terms',
+        'notes',
+    )
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
\ No newline at end of file
+    __slots__ = fields
+
+    converters = {
+        'advertiser_id': int,
+        'date_created': parse_date,
+        'date_last_accepted_terms': parse_date,
+    }
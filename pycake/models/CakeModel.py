@@ -1,39 +1,107 @@
 import json
+from .converters import _compile_hydrator, _json_default
 
 
 class CakeModel(object):
-    """ Base class from which all models will inherit. """
+    """ Base class from which all models will inherit.
+
+    Subclasses list their fields in fields and use them as their __slots__,
+    so instances hold only the field values and no per-instance __dict__.
+    Models created with lazy() keep the row instead and decode each field
+    the first time it is read.
+
+    converters maps fields to the function converting their API values,
+    e.g. int, a date parser or a nested model. from_dict(), from_rows() and
+    lazy() apply them; values passed to the constructor are kept as given.
+    """
+
+    __slots__ = ('_row', '_prefix')
+    fields = ()
+    converters = {}
 
     def __init__(self, **kwargs):
-        self.param_defaults = {}
+        self._row = None
+        for field in self.fields:
+            setattr(self, field, kwargs.get(field))
+
+    @classmethod
+    def _hydrator(cls):
+        hydrate = cls.__dict__.get('_hydrate')
+        if hydrate is None:
+            hydrate = cls._hydrate = _compile_hydrator(cls)
+        return hydrate
+
+    @classmethod
+    def from_dict(cls, row):
+        """Returns a model of a row parsed from an API response, with its
+        values converted. Keys that are not fields of the model are
+        ignored."""
+
+        return cls._hydrator()(row)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Returns a list of models of the rows parsed from an API
+        response"""
+
+        return list(map(cls._hydrator(), rows))
+
+    @classmethod
+    def lazy(cls, row, prefix=''):
+        """Returns a model of a parsed API row, or of the JSON text of one,
+        that decodes a field and keeps it the first time it is read. Cheaper
+        than from_dict() when only a few fields are used. With a prefix a
+        field is read from the prefixed key when there is one, e.g.
+        affiliate_id from source_affiliate_id with prefix='source_'."""
+
+        model = cls.__new__(cls)
+        model._row = row
+        model._prefix = prefix
+        return model
+
+    def __getattr__(self, name):
+        # only called for slots that have not been set, i.e. the fields of a
+        # lazy model that have not been read yet
+        if name not in self.fields or self._row is None:
+            raise AttributeError(name)
+        row = self._row
+        if isinstance(row, (str, bytes)):
+            row = self._row = json.loads(row)
+        value = row.get(self._prefix + name) if self._prefix else None
+        if value is None:
+            value = row.get(name)
+        if value is not None and name in self.converters:
+            value = self.converters[name](value)
+        setattr(self, name, value)
+        return value
 
     def __str__(self):
         return self.as_json_string()
 
     def __eq__(self, other):
-        return other and self.AsDict() == other.as_dict()
+        return (isinstance(other, CakeModel) and
+            self.as_dict() == other.as_dict())
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def as_json_string(self):
-        return json.dumps(self.as_dict(), sort_keys=True)
+        return json.dumps(
+            self.as_dict(), sort_keys=True, default=_json_default)
 
     def as_dict(self):
         data = {}
-        for key, value in self.param_defaults.items():
-            if isinstance(getattr(self, key, None), (list, tuple, set)):
+        for key in self.fields:
+            value = getattr(self, key, None)
+            if isinstance(value, (list, tuple, set)):
                 data[key] = list()
-                for subobj in getattr(self, key, None):
+                for subobj in value:
                     if getattr(subobj, 'as_dict', None):
                         data[key].append(subobj.as_dict())
                     else:
                         data[key].append(subobj)
-            elif getattr(getattr(self, key, None), 'as_dict', None):
-                data[key] = getattr(self, key).as_dict()
-            elif getattr(self, key, None):
-                data[key] = getattr(self, key, None)
+            elif getattr(value, 'as_dict', None):
+                data[key] = value.as_dict()
+            elif value:
+                data[key] = value
         return data
-
-
-    
\ No newline at end of file
@@ -1,44 +1,55 @@
+from pycake.dates import parse_date
 from .CakeModel import CakeModel
+from .SiteOffer import SiteOffer
+from .SourceAffiliate import SourceAffiliate
+from .converters import _nested
 
 
 class Campaign(CakeModel):
 
-	def __init__(self, **kwargs):
-		self.param_defaults = {
-			'campaign_id': None,
-			'third_party_name': None,
-			'campaign_type': None,
-			'affiliate': None,
-			'offer': None,
-			'offer_contract': None,
-			'original': None,
-			'non_original': None,
-			'exceptions': None,
-			'account_status': None,
-			'currency': None,
-			'media_type': None,
-			'display_link_type': None,
-			'event_overrides': None,
-			'deal_flow': None,
-			'payouts': None,
-			'paid': None,
-			'paid_redirects': None,
-			'disable_prepop_appending': None,
-			'suppression_amount': None,
-			'cookie_domain': None,
-			'redirect_domain': None,
-			'click_cap': None,
-			'conversion_cap': None,
-			'pixel_info': None,
-			'upsell_info': None,
-			'submission_options': None,
-			'voucher_codes': None,
-			'test_link': None,
-			'redirect_offer': None,
-			'redirect_404': None,
-			'date_created': None,
-			'expiration_date': None,
-			'notes': None
-		}
-		for (param, default) in self.param_defaults.items():
-			setattr(self, param, kwargs.get(param, default))
\ No newline at end of file
+	fields = (
+		'campaign_id',
+		'third_party_name',
+		'campaign_type',
+		'affiliate',
+		'offer',
+		'offer_contract',
+		'original',
+		'non_original',
+		'exceptions',
+		'account_status',
+		'currency',
+		'media_type',
+		'display_link_type',
+		'event_overrides',
+		'deal_flow',
+		'payouts',
+		'paid',
+		'paid_redirects',
+		'disable_prepop_appending',
+		'suppression_amount',
+		'cookie_domain',
+		'redirect_domain',
+		'click_cap',
+		'conversion_cap',
+		'pixel_info',
+		'upsell_info',
+		'submission_options',
+		'voucher_codes',
+		'test_link',
+		'redirect_offer',
+		'redirect_404',
+		'date_created',
+		'expiration_date',
+		'notes',
+	)
+
+	__slots__ = fields
+
+	converters = {
+		'campaign_id': int,
+		'affiliate': _nested(SourceAffiliate),
+		'offer': _nested(SiteOffer),
+		'date_created': parse_date,
+		'expiration_date': parse_date,
+	}
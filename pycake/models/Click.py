@@ -1,52 +1,73 @@
+from pycake.dates import parse_date
 from .CakeModel import CakeModel
+from .BrandAdvertiser import BrandAdvertiser
+from .Campaign import Campaign
+from .SiteOffer import SiteOffer
+from .SourceAffiliate import SourceAffiliate
+from .converters import _nested, _to_bool, _to_decimal
 
 
 class Click(CakeModel):
     '''http://staging.cakemarketing.com/api/12/reports.asmx?op=Clicks'''
 
-    def __init__(self, **kwargs):
-        self.param_defaults = {
-            'click_id': None,
-            'visitor_id': None,
-            'original_visitor_id': None,
-            'tracking_id': None,
-            'original_tracking_id': None,
-            'request_session_id': None,
-            'click_date': None,
-            'udid': None,
-            'source_affiliate': None, 
-            'brand_advertiser': None, 
-            'site_offer': None,
-            'site_offer_contract': None,
-            'channel': None,
-            'campaign': None,
-            'creative': None,
-            'sub_id_1': None,
-            'sub_id_2': None,
-            'sub_id_3': None,
-            'sub_id_4': None,
-            'sub_id_5': None,
-            'ip_address': None,
-            'user_agent': None,
-            'referrer_url': None,
-            'search_term': None,
-            'request_url': None,
-            'redirect_url': None,
-            'country': None,
-            'region': None,
-            'language': None,
-            'isp': None,
-            'device': None,
-            'operating_system': None,
-            'browser': None,
-            'disposition': None,
-            'paid_action': None,
-            'paid': None,
-            'received': None,
-            'duplicate': None,
-            'duplicate_clicks': None,
-            'total_clicks': None,
-        }
+    fields = (
+        'click_id',
+        'visitor_id',
+        'original_visitor_id',
+        'tracking_id',
+        'original_tracking_id',
+        'request_session_id',
+        'click_date',
+        'udid',
+        'source_affiliate',
+        'brand_advertiser',
+        'site_offer',
+        'site_offer_contract',
+        'channel',
+        'campaign',
+        'creative',
+        'sub_id_1',
+        'sub_id_2',
+        'sub_id_3',
+        'sub_id_4',
+        'sub_id_5',
+        'ip_address',
+        'user_agent',
+        'referrer_url',
+        'search_term',
+        'request_url',
+        'redirect_url',
+        'country',
+        'region',
+        'language',
+        'isp',
+        'device',
+        'operating_system',
+        'browser',
+        'disposition',
+        'paid_action',
+        'paid',
+        'received',
+        'duplicate',
+        'duplicate_clicks',
+        'total_clicks',
+    )
 
-        for (param, default) in self.param_defaults.items():
-            setattr(self, param, kwargs.get(param, default))
+    __slots__ = fields
+
+    converters = {
+        'click_id': int,
+        'visitor_id': int,
+        'original_visitor_id': int,
+        'request_session_id': int,
+        'click_date': parse_date,
+        'source_affiliate': _nested(SourceAffiliate, 'source_'),
+        'brand_advertiser': _nested(BrandAdvertiser, 'brand_'),
+        'site_offer': _nested(SiteOffer, 'site_'),
+        'campaign': _nested(Campaign),
+        'paid': _to_decimal,
+        'received': _to_decimal,
+        'duplicate': _to_bool,
+        'duplicate_clicks': int,
+        'total_clicks': int,
+    }
@@ -1,77 +1,109 @@
+from pycake.dates import parse_date
 from .CakeModel import CakeModel
+from .BrandAdvertiser import BrandAdvertiser
+from .Campaign import Campaign
+from .SiteOffer import SiteOffer
+from .SourceAffiliate import SourceAffiliate
+from .converters import _nested, _to_bool, _to_decimal
 
 
 class EventConversion(CakeModel):
 
-	def __init__(self, **kwargs):
-		self.param_defaults = {
-			'event_conversion_id': None,
-			'visitor_id': None,
-			'original_visitor_id': None,
-			'user_id': None,
-			'tracking_id': None,
-			'original_tracking_id': None,
-			'request_session_id': None,
-			'click_request_session_id': None,
-			'click_id': None,
-			'event_conversion_date': None,
-			'last_updated': None,
-			'click_date': None,
-			'source_date': None,
-			'udid': None,
-			'event_info': None,
-			'source_affiliate': None,
-			'brand_advertiser': None,
-			'site_offer': None,
-			'site_offer_contract': None,
-			'channel': None,
-			'campaign': None,
-			'creative': None,
-			'voucher_code': None,
-			'sub_id_1': None,
-			'sub_id_2': None,
-			'sub_id_3': None,
-			'sub_id_4': None,
-			'sub_id_5': None,
-			'event_conversion_ip_address': None,
-			'click_ip_address': None,
-			'event_conversion_referrer_url': None,
-			'click_referrer_url': None,
-			'event_conversion_user_agent': None,
-			'click_user_agent': None,
-			'source_type': None,
-			'price_format': None,
-			'paid': None,
-			'paid_unbilled': None,
-			'received': None,
-			'received_unbilled': None,
-			'site_offer_credit_percentage': None,
-			'site_offer_payment_percentage': None,
-			'program_credit_percentage': None,
-			'pixel_dropped': None,
-			'suppressed': None,
-			'returned': None,
-			'test': None,
-			'transaction_id': None,
-			'current_disposition': None,
-			'order_total': None,
-			'storefront': None,
-			'payout_rule': None,
-			'event_conversion_score': None,
-			'country': None,
-			'region': None,
-			'language': None,
-			'isp': None,
-			'device': None,
-			'operating_system': None,
-			'browser': None,
-			'search_term': None,
-			'keyword': None,
-			'note': None
-		}
-
-		for (param, default) in self.param_defaults.items():
-			setattr(self, param, kwargs.get(param, default))
-
+	fields = (
+		'event_conversion_id',
+		'visitor_id',
+		'original_visitor_id',
+		'user_id',
+		'tracking_id',
+		'original_tracking_id',
+		'request_session_id',
+		'click_request_session_id',
+		'click_id',
+		'event_conversion_date',
+		'last_updated',
+		'click_date',
+		'source_date',
+		'udid',
+		'event_info',
+		'source_affiliate',
+		'brand_advertiser',
+		'site_offer',
+		'site_offer_contract',
+		'channel',
+		'campaign',
+		'creative',
+		'voucher_code',
+		'sub_id_1',
+		'sub_id_2',
+		'sub_id_3',
+		'sub_id_4',
+		'sub_id_5',
+		'event_conversion_ip_address',
+		'click_ip_address',
+		'event_conversion_referrer_url',
+		'click_referrer_url',
+		'event_conversion_user_agent',
+		'click_user_agent',
+		'source_type',
+		'price_format',
+		'paid',
+		'paid_unbilled',
+		'received',
+		'received_unbilled',
+		'site_offer_credit_percentage',
+		'site_offer_payment_percentage',
+		'program_credit_percentage',
+		'pixel_dropped',
+		'suppressed',
+		'returned',
+		'test',
+		'transaction_id',
+		'current_disposition',
+		'order_total',
+		'storefront',
+		'payout_rule',
+		'event_conversion_score',
+		'country',
+		'region',
+		'language',
+		'isp',
+		'device',
+		'operating_system',
+		'browser',
+		'search_term',
+		'keyword',
+		'note',
+	)
 
+	__slots__ = fields
 
+	converters = {
+		'event_conversion_id': int,
+		'visitor_id': int,
+		'original_visitor_id': int,
+		'user_id': int,
+		'request_session_id': int,
+		'click_request_session_id': int,
+		'click_id': int,
+		'event_conversion_date': parse_date,
+		'last_updated': parse_date,
+		'click_date': parse_date,
+		'source_date': parse_date,
+		'source_affiliate': _nested(SourceAffiliate, 'source_'),
+		'brand_advertiser': _nested(BrandAdvertiser, 'brand_'),
+		'site_offer': _nested(SiteOffer, 'site_'),
+		'campaign': _nested(Campaign),
+		'paid': _to_decimal,
+		'paid_unbilled': _to_decimal,
+		'received': _to_decimal,
+		'received_unbilled': _to_decimal,
+		'site_offer_credit_percentage': _to_decimal,
+		'site_offer_payment_percentage': _to_decimal,
+		'program_credit_percentage': _to_decimal,
+		'pixel_dropped': _to_bool,
+		'suppressed': _to_bool,
+		'returned': _to_bool,
+		'test': _to_bool,
+		'order_total': _to_decimal,
+		'event_conversion_score': _to_decimal,
+	}
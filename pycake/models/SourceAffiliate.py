@@ -1,54 +1,60 @@
+from pycake.dates import parse_date
 from .CakeModel import CakeModel
 
 
 class SourceAffiliate(CakeModel):
 
-	def __init__(self, **kwargs):
-		self.param_defaults = {
-			'affiliate_id': None,
-			'affiliate_name': None,
-			'third_party_name': None,
-			'tier': None,
-			'account_managers': None,
-			'account_status': None,
-			'inactive_reason': None,
-			'address': None,
-			'website': None,
-			'payment_type': None,
-			'contacts': None,
-			'tags': None,
-			'traffic_types': None,
-			'minimum_payment_threshold': None,
-			'auto_payment_fee': None,
-			'payment_to': None,
-			'tax_class': None,
-			'ssn_tax_id': None,
-			'pay_vat': None,
-			'swift_iban': None,
-			'referrals_enabled': None,
-			'referred_by_affiliate': None,
-			'referral_info': None,
-			'billing_cycle': None,
-			'currency_settings': None,
-			'quickbooks_id': None,
-			'online_signup': None,
-			'signup_ip_address': None,
-			'pay_for_conversions': None,
-			'review': None,
-			'review_new_subaffiliates': None,
-			'suppression': None,
-			'suppression_cap': None,
-			'pixel_info': None,
-			'fire_global_pixel': None,
-			'blacklists': None,
-			'redirect_domain_override': None,
-			'auto_approve_campaigns': None,
-			'auto_approve_pixels': None,
-			'hide_offers': None,
-			'api_key': None,
-			'date_created': None,
-			'date_last_accepted_terms': None,
-			'notes': None
-		}
-		for (param, default) in self.param_defaults.items():
-			setattr(self, param, kwargs.get(param, default))
\ No newline at end of file
+	fields = (
+		'affiliate_id',
+		'affiliate_name',
+		'third_party_name',
+		'tier',
+		'account_managers',
+		'account_status',
+		'inactive_reason',
+		'address',
+		'website',
+		'payment_type',
+		'contacts',
+		'tags',
+		'traffic_types',
+		'minimum_payment_threshold',
+		'auto_payment_fee',
+		'payment_to',
+		'tax_class',
+		'ssn_tax_id',
+		'pay_vat',
+		'swift_iban',
+		'referrals_enabled',
+		'referred_by_affiliate',
+		'referral_info',
+		'billing_cycle',
+		'currency_settings',
+		'quickbooks_id',
+		'online_signup',
+		'signup_ip_address',
+		'pay_for_conversions',
+		'review',
+		'review_new_subaffiliates',
+		'suppression',
+		'suppression_cap',
+		'pixel_info',
+		'fire_global_pixel',
+		'blacklists',
+		'redirect_domain_override',
+		'auto_approve_campaigns',
+		'auto_approve_pixels',
+		'hide_offers',
+		'api_key',
+		'date_created',
+		'date_last_accepted_terms',
+		'notes',
+	)
+
+	__slots__ = fields
+
+	converters = {
+		'affiliate_id': int,
+		'date_created': parse_date,
+		'date_last_accepted_terms': parse_date,
+	}
@@ -0,0 +1,90 @@
+from datetime import datetime as _datetime
+from decimal import Decimal as _Decimal
+
+
+def _to_decimal(value):
+    """Returns a money amount, or the amount of a money object, as a
+    Decimal"""
+
+    if isinstance(value, dict):
+        value = value.get('amount')
+        if value is None:
+            return None
+    if isinstance(value, _Decimal):
+        return value
+    # str() of a float is its shortest repr, so 0.1 stays Decimal('0.1')
+    return _Decimal(str(value))
+
+
+def _to_bool(value):
+    if isinstance(value, str):
+        return value.lower() == 'true'
+    return bool(value)
+
+
+def _nested(model, prefix=''):
+    """Returns a converter wrapping a nested object in a lazy model that
+    reads its fields from keys with prefix (e.g. 'source_' reads
+    SourceAffiliate.affiliate_id from source_affiliate_id). The object is
+    not copied."""
+
+    lazy = model.lazy
+
+    def convert(value):
+        if not isinstance(value, dict):
+            return value
+        return lazy(value, prefix)
+
+    # read by _compile_hydrator, which builds nested models inline
+    convert.model = model
+    convert.prefix = prefix
+    return convert
+
+
+def _json_default(value):
+    """Serializes the converted values json cannot"""
+
+    if isinstance(value, _datetime):
+        return value.isoformat()
+    if isinstance(value, _Decimal):
+        return float(value)
+    raise TypeError('{!r} is not JSON serializable'.format(value))
+
+
+def _compile_hydrator(model):
+    """Returns a function building a model from a row, generated once per
+    model class so every field is a single attribute store"""
+
+    lines = [
+        'def hydrate(row):',
+        '    get = row.get',
+        '    model = new(model_class)',
+        '    model._row = None',
+    ]
+    namespace = {'new': model.__new__, 'model_class': model}
+    for field in model.fields:
+        converter = model.converters.get(field)
+        if converter is None:
+            lines.append('    model.{0} = get({0!r})'.format(field))
+            continue
+        nested_model = getattr(converter, 'model', None)
+        if nested_model is not None:
+            # the lazy() of a _nested converter, without its two calls
+            namespace['model_' + field] = nested_model
+            lines += [
+                '    value = get({!r})'.format(field),
+                '    if isinstance(value, dict):',
+                '        nested = new(model_{})'.format(field),
+                '        nested._row = value',
+                '        nested._prefix = {!r}'.format(converter.prefix),
+                '        value = nested',
+                '    model.{} = value'.format(field),
+            ]
+            continue
+        namespace['convert_' + field] = converter
+        lines.append('    value = get({!r})'.format(field))
+        lines.append('    model.{0} = None if value is None else '
+            'convert_{0}(value)'.format(field))
+    lines.append('    return model')
+    exec('\n'.join(lines), namespace)
+    return namespace['hydrate']
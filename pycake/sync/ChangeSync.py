@@ -0,0 +1,122 @@
+import json as _json
+from datetime import timedelta as _timedelta
+from pycake.api.pagination import _rows_of
+from pycake.api.sharding import _to_datetime
+from pycake.dates import parse_date
+from .store import _connect, _get_watermark, _set_watermark, _upsert_rows
+
+
+class ChangeSync(object):
+    """ Base class from which all change syncs will inherit.
+
+    A change sync keeps a local SQLite copy of the rows returned by a CAKE
+    changes function (one taking changes_since) current. The newest
+    updated_field seen is kept as a changes_since watermark, so each sync
+    only pulls what changed since the previous one. Rows without an
+    updated_field leave the watermark where it was, since only CAKE's own
+    times can be compared with changes_since, which is in the server's local
+    time rather than this machine's. Each sync starts
+    overlap seconds before the watermark so changes made while the previous
+    sync was paging are not missed, and rows are upserted by key_field, so
+    the overlap never duplicates them.
+    """
+
+    table = None
+    key_field = None
+    include_new_parameter = None
+    updated_field = 'last_updated'
+
+    def __init__(
+            self, api, function, scope, path, overlap=300, include_new=True,
+            page_size=2500, window=4, filters=None):
+
+        self.api = api
+        self.function = function
+        self.scope = scope
+        self.path = path
+        self.overlap = overlap
+        self.include_new = include_new
+        self.page_size = page_size
+        self.window = window
+        self.filters = filters or {}
+        self.watermark_name = '{}:{}:{}'.format(self.table, scope,
+            _json.dumps(self.filters, sort_keys=True))
+        self._db = _connect(path)
+        self._db.execute('CREATE TABLE IF NOT EXISTS {} (scope TEXT, '
+            '{} INTEGER, data TEXT, PRIMARY KEY (scope, {}))'.format(
+            self.table, self.key_field, self.key_field))
+
+
+    @property
+    def watermark(self):
+        """The time of the newest change synced, or None"""
+
+        return _get_watermark(self._db, self.watermark_name)
+
+
+    def changes(self, since=None):
+        """Yields each row changed since the watermark (or since, which is
+        required for the first sync) after storing it. The watermark only
+        moves once every change has been consumed."""
+
+        watermark = self.watermark
+        if watermark is not None:
+            changes_since = (watermark - _timedelta(
+                seconds=self.overlap)).replace(microsecond=0)
+        elif since is not None:
+            changes_since = since
+        else:
+            raise Exception('Nothing has been synced yet; please provide '
+                'since for the first sync')
+
+        newest = None
+        kwargs = dict(self.filters)
+        kwargs[self.include_new_parameter] = (
+            'TRUE' if self.include_new else 'FALSE')
+        for page in self.api.iter_pages(
+                self.function, page_size=self.page_size, window=self.window,
+                changes_since=changes_since, **kwargs):
+            rows = _rows_of(page)
+            _upsert_rows(
+                self._db, self.table, self.key_field, rows, scope=self.scope)
+            for row in rows:
+                updated = parse_date(row.get(self.updated_field))
+                if updated is not None and (
+                        newest is None or updated > newest):
+                    newest = updated
+                yield row
+        if newest is None:
+            # the client's clock can be hours ahead of the server's local
+            # time, so fall back to the changes_since just queried
+            newest = _to_datetime(changes_since)
+        if watermark is None or newest > watermark:
+            _set_watermark(self._db, self.watermark_name, newest)
+
+
+    def sync(self, since=None):
+        """Stores every change since the last sync and returns how many
+        there were"""
+
+        return sum(1 for _ in self.changes(since=since))
+
+
+    def get(self, key):
+        """Returns the stored row with key_field key, or None"""
+
+        row = self._db.execute('SELECT data FROM {} WHERE scope = ? AND '
+            '{} = ?'.format(self.table, self.key_field),
+            (self.scope, key)).fetchone()
+        return None if row is None else _json.loads(row[0])
+
+
+    def rows(self):
+        """Yields every stored row"""
+
+        for row in self._db.execute('SELECT data FROM {} WHERE scope = ? '
+                'ORDER BY {}'.format(self.table, self.key_field),
+                (self.scope,)):
+            yield _json.loads(row[0])
+
+
+    def close(self):
+        self._db.close()
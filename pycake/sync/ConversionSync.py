@@ -0,0 +1,22 @@
+from .ChangeSync import ChangeSync
+
+
+class ConversionSync(ChangeSync):
+    """Keeps a local SQLite copy of an AdminAPI's event conversions current
+    using event_conversion_changes. filters are passed on to
+    event_conversion_changes."""
+
+    table = 'event_conversions'
+    key_field = 'event_conversion_id'
+    include_new_parameter = 'include_new_event_conversions'
+
+    def __init__(
+            self, admin_api, path, overlap=300, include_new=True,
+            page_size=2500, window=4, **filters):
+
+        super(ConversionSync, self).__init__(
+            admin_api, admin_api.event_conversion_changes,
+            admin_api.admin_domain.lower(), path, overlap=overlap,
+            include_new=include_new, page_size=page_size, window=window,
+            filters=filters)
+        self.admin_api = admin_api
@@ -0,0 +1,209 @@
+import hashlib as _hashlib
+import json as _json
+import threading as _threading
+from collections import OrderedDict as _OrderedDict
+from datetime import datetime as _datetime
+from pycake.api.pagination import _row_count, _rows_of
+from .store import _connect, _get_watermark, _set_watermark
+
+# entity: (export function, id field, export keyword arguments,
+#          {indexed column: path to its value in an exported row})
+_ENTITIES = _OrderedDict([
+    ('advertisers', ('export_advertisers', 'advertiser_id', {}, {
+        'account_status_id': ('account_status', 'account_status_id'),
+    })),
+    ('affiliates', ('export_affiliates', 'affiliate_id', {}, {
+        'account_status_id': ('account_status', 'account_status_id'),
+    })),
+    ('offers', ('export_offers', 'offer_id', {}, {
+        'advertiser_id': ('advertiser', 'advertiser_id'),
+        'offer_status_id': ('offer_status', 'offer_status_id'),
+        'vertical_id': ('vertical', 'vertical_id'),
+    })),
+    ('campaigns', ('export_campaigns', 'campaign_id', {'campaign_id': '0'}, {
+        'affiliate_id': ('affiliate', 'affiliate_id'),
+        'offer_id': ('offer', 'offer_id'),
+        'offer_contract_id': ('offer_contract', 'offer_contract_id'),
+        'account_status_id': ('account_status', 'account_status_id'),
+    })),
+    ('creatives', ('export_creatives', 'creative_id', {'offer_id': '0'}, {
+        'offer_id': ('offer', 'offer_id'),
+        'creative_type_id': ('creative_type', 'creative_type_id'),
+        'creative_status_id': ('creative_status', 'creative_status_id'),
+    })),
+])
+
+
+def _value_at(row, path):
+    """Returns the value at a path of keys in a row, or None"""
+
+    value = row
+    for step in path:
+        try:
+            value = value[step]
+        except (KeyError, TypeError):
+            return None
+    return value
+
+
+class EntityMirror(object):
+    """Local SQLite mirror of an AdminAPI's advertisers, affiliates, offers,
+    campaigns and creatives.
+
+    refresh() exports each entity in pages and applies only the difference
+    to the mirror: new and changed rows are written in one batch per page
+    and rows that are no longer exported are deleted. Pages are requested
+    concurrently, so entities added or removed during the export can shift
+    rows between pages; when the ids exported do not add up to the export's
+    row_count nothing is deleted and the refresh is retried next time.
+    Rows are looked up by
+    id with get() or by indexed columns (e.g. campaigns by affiliate_id and
+    offer_id) with find(). Use one database per admin domain.
+    """
+
+    def __init__(self, admin_api, path, page_size=2500, window=4):
+        self.admin_api = admin_api
+        self.path = path
+        self.page_size = page_size
+        self.window = window
+        self.stats = {
+            'inserted': 0,
+            'updated': 0,
+            'deleted': 0,
+        }
+        self._lock = _threading.Lock()
+        self._db = _connect(path)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        with self._db:
+            for entity, (_, id_field, _, indexes) in _ENTITIES.items():
+                self._db.execute('CREATE TABLE IF NOT EXISTS {} ({} INTEGER '
+                    'PRIMARY KEY, {}checksum TEXT, data TEXT)'.format(
+                    entity, id_field, ''.join('{} INTEGER, '.format(_)
+                    for _ in indexes)))
+                for column in indexes:
+                    self._db.execute('CREATE INDEX IF NOT EXISTS {0}_{1} ON '
+                        '{0} ({1})'.format(entity, column))
+
+
+    @staticmethod
+    def _entity(entity):
+        if entity not in _ENTITIES:
+            raise Exception('entity must be one of: {}'.format(
+                ', '.join(_ENTITIES)))
+        return _ENTITIES[entity]
+
+
+    def refreshed_at(self, entity):
+        """Returns when entity was last refreshed, or None"""
+
+        self._entity(entity)
+        return _get_watermark(self._db, 'mirror:{}'.format(entity))
+
+
+    def _refresh(self, entity):
+        function_name, id_field, export_kwargs, indexes = self._entity(entity)
+        started = _datetime.now()
+        checksums = dict(self._db.execute(
+            'SELECT {}, checksum FROM {}'.format(id_field, entity)))
+        insert = 'INSERT OR REPLACE INTO {} VALUES ({})'.format(
+            entity, ', '.join('?' * (len(indexes) + 3)))
+        counts = {'inserted': 0, 'updated': 0, 'deleted': 0}
+        seen = set()
+        row_counts = set()
+
+        for page in self.admin_api.iter_pages(
+                getattr(self.admin_api, function_name),
+                page_size=self.page_size, window=self.window,
+                **export_kwargs):
+            row_counts.add(_row_count(page))
+            batch = []
+            for row in _rows_of(page):
+                data = _json.dumps(row, sort_keys=True)
+                checksum = _hashlib.sha1(data.encode('utf-8')).hexdigest()
+                entity_id = row[id_field]
+                seen.add(entity_id)
+                if checksums.get(entity_id) == checksum:
+                    continue
+                if entity_id in checksums:
+                    counts['updated'] += 1
+                else:
+                    counts['inserted'] += 1
+                batch.append([entity_id] + [_value_at(row, path) for path
+                    in indexes.values()] + [checksum, data])
+            with self._db:
+                self._db.executemany(insert, batch)
+
+        if row_counts != set([len(seen)]):
+            # some rows were missed or seen twice, so ids absent from the
+            # export may still exist
+            return counts
+        deleted = [(_,) for _ in checksums if _ not in seen]
+        counts['deleted'] = len(deleted)
+        with self._db:
+            self._db.executemany('DELETE FROM {} WHERE {} = ?'.format(
+                entity, id_field), deleted)
+        _set_watermark(self._db, 'mirror:{}'.format(entity), started)
+        return counts
+
+
+    def refresh(self, entities=None, max_age=None):
+        """Brings entities (all of them by default) up to date, skipping any
+        refreshed less than max_age seconds ago. Returns how many rows were
+        inserted, updated and deleted per entity."""
+
+        results = _OrderedDict()
+        with self._lock:
+            for entity in entities or list(_ENTITIES):
+                refreshed_at = self.refreshed_at(entity)
+                if (max_age is not None and refreshed_at is not None and
+                        (_datetime.now() - refreshed_at).total_seconds() <
+                        max_age):
+                    continue
+                results[entity] = self._refresh(entity)
+                for count, value in results[entity].items():
+                    self.stats[count] += value
+        return results
+
+
+    def get(self, entity, entity_id):
+        """Returns the mirrored row of entity with id entity_id, or None"""
+
+        id_field = self._entity(entity)[1]
+        row = self._db.execute('SELECT data FROM {} WHERE {} = ?'.format(
+            entity, id_field), (entity_id,)).fetchone()
+        return None if row is None else _json.loads(row[0])
+
+
+    def _where(self, entity, criteria):
+        _, id_field, _, indexes = self._entity(entity)
+        for column in criteria:
+            if column != id_field and column not in indexes:
+                raise Exception('{} can only be searched by: {}'.format(
+                    entity, ', '.join([id_field] + list(indexes))))
+        columns = sorted(criteria)
+        where = ' AND '.join('{} = ?'.format(_) for _ in columns)
+        return (' WHERE ' + where if where else '',
+            [criteria[_] for _ in columns])
+
+
+    def find(self, entity, **criteria):
+        """Returns the mirrored rows of entity whose indexed columns equal
+        criteria, e.g. find('campaigns', affiliate_id=5, offer_id=7)"""
+
+        where, values = self._where(entity, criteria)
+        return [_json.loads(_[0]) for _ in self._db.execute(
+            'SELECT data FROM {}{} ORDER BY {}'.format(
+            entity, where, self._entity(entity)[1]), values)]
+
+
+    def ids(self, entity, **criteria):
+        """Returns the ids of the mirrored rows of entity matching criteria"""
+
+        id_field = self._entity(entity)[1]
+        where, values = self._where(entity, criteria)
+        return [_[0] for _ in self._db.execute('SELECT {0} FROM {1}{2} '
+            'ORDER BY {0}'.format(id_field, entity, where), values)]
+
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,22 @@
+from .ChangeSync import ChangeSync
+
+
+class OrderDetailSync(ChangeSync):
+    """Keeps a local SQLite copy of an AffiliateAPI's order details current
+    using order_detail_changes. Rows are kept per admin domain and
+    affiliate, so many affiliates can share one database."""
+
+    table = 'order_details'
+    key_field = 'conversion_id'
+    include_new_parameter = 'include_new_conversions'
+
+    def __init__(
+            self, affiliate_api, path, overlap=300, include_new=True,
+            page_size=2500, window=4):
+
+        super(OrderDetailSync, self).__init__(
+            affiliate_api, affiliate_api.order_detail_changes,
+            '{}:{}'.format(affiliate_api.admin_domain.lower(),
+            affiliate_api.affiliate_id), path, overlap=overlap,
+            include_new=include_new, page_size=page_size, window=window)
+        self.affiliate_api = affiliate_api
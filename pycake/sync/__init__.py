@@ -0,0 +1,3 @@
+from .ConversionSync import ConversionSync
+from .OrderDetailSync import OrderDetailSync
+from .EntityMirror import EntityMirror
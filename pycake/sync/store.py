@@ -0,0 +1,35 @@
+import json as _json
+import sqlite3 as _sqlite3
+from datetime import datetime as _datetime
+
+_WATERMARK_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+
+def _connect(path):
+    db = _sqlite3.connect(path, timeout=30, check_same_thread=False)
+    db.execute('CREATE TABLE IF NOT EXISTS watermarks ('
+        'name TEXT PRIMARY KEY, value TEXT)')
+    return db
+
+
+def _get_watermark(db, name):
+    row = db.execute(
+        'SELECT value FROM watermarks WHERE name = ?', (name,)).fetchone()
+    return None if row is None else _datetime.strptime(
+        row[0], _WATERMARK_FORMAT)
+
+
+def _set_watermark(db, name, value):
+    with db:
+        db.execute('INSERT OR REPLACE INTO watermarks VALUES (?, ?)',
+            (name, value.strftime(_WATERMARK_FORMAT)))
+
+
+def _upsert_rows(db, table, key_field, rows, scope=''):
+    """Inserts or replaces rows, stored as JSON, keyed by key_field within
+    scope"""
+
+    with db:
+        db.executemany('INSERT OR REPLACE INTO {} VALUES (?, ?, ?)'.format(
+            table), [(scope, row[key_field], _json.dumps(row))
+            for row in rows])
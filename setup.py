@@ -17,5 +17,11 @@ setup(
   install_requires = [
     'requests',
   ],
+  extras_require = {
+    'async': ['aiohttp'],
+    'columnar': ['numpy'],
+    'dataframe': ['numpy', 'pandas'],
+    'parquet': ['pyarrow'],
+  },
   data_files = [('', ['LICENSE.txt'])]
 )